@@ -4,8 +4,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from meeting_minutes.api.routes import router
+from meeting_minutes.api.prefork import format_memory
+from meeting_minutes.api.routes import router, job_manager
+from meeting_minutes.core.backend import process_memory_stats
 from meeting_minutes.core.llm_config import llm_config
+from meeting_minutes.core.replica_pool import ReplicaPool
+from meeting_minutes.graph.registry import graph_registry
 from config import settings
 
 # 로깅 설정
@@ -24,18 +28,64 @@ async def lifespan(app: FastAPI):
     logger.info(f"  {settings.APP_NAME} v{settings.APP_VERSION} 시작")
     logger.info("=" * 70)
     
-    # LLM 모델 사전 로드 (선택사항)
-    try:
-        logger.info("LLM 모델 로드 중...")
-        llm_config.load_model()
-        logger.info("✓ LLM 모델 로드 완료")
-    except Exception as e:
-        logger.warning(f"⚠ LLM 사전 로드 실패 (첫 요청 시 로드됨): {e}")
+    settings.ensure_directories()
+    
+    # 그래프 사전 컴파일
+    elapsed = graph_registry.warmup()
+    logger.info(f"✓ 그래프 {graph_registry.stats()['count']}개 컴파일 완료 ({elapsed * 1000:.1f}ms)")
+    
+    # 복제본/스케줄러는 transformers 모델을 직접 다루므로 해당 백엔드에서만 사용
+    # (llm_config는 여기서 처음 접근할 때 생성됨)
+    local_batching = llm_config.backend_name == "transformers"
+    if (settings.REPLICA_ENABLED or settings.SCHEDULER_ENABLED) and not local_batching:
+        logger.warning(f"⚠ {llm_config.backend_name} 백엔드는 복제본/스케줄러를 사용하지 않습니다")
+    
+    # 멀티 프로세스 모델 복제본 (복제본이 모델을 로드하므로 이 프로세스는 로드하지 않음)
+    if settings.REPLICA_ENABLED and local_batching:
+        pool = ReplicaPool.from_llm(
+            llm_config,
+            num_replicas=settings.REPLICA_COUNT,
+            threads_per_replica=settings.REPLICA_THREADS
+        )
+        logger.info(
+            f"모델 복제본 {pool.num_replicas}개 시작 중 "
+            f"(복제본당 스레드 {pool.threads_per_replica}개)..."
+        )
+        try:
+            pool.start()
+            llm_config.attach_dispatcher(pool)
+        except Exception as e:
+            logger.warning(f"⚠ 모델 복제본 시작 실패 (단일 모델로 실행): {e}")
+    
+    # 연속 배칭 스케줄러 (동시 요청의 generate 호출을 하나의 배치로 디코딩)
+    if settings.SCHEDULER_ENABLED and local_batching and llm_config._dispatcher is None:
+        from meeting_minutes.core.scheduler import InferenceScheduler
+        
+        scheduler = InferenceScheduler(llm_config, max_batch_size=settings.SCHEDULER_MAX_BATCH_SIZE)
+        scheduler.start()
+        llm_config.attach_dispatcher(scheduler)
+        logger.info(f"✓ 추론 스케줄러 활성화 (최대 배치 {settings.SCHEDULER_MAX_BATCH_SIZE})")
+    
+    # LLM 모델 사전 로드 (선택사항, PRELOAD_MODEL이면 마스터가 fork 전에 이미 로드함)
+    if llm_config.is_loaded:
+        logger.info(f"✓ 마스터에서 로드한 모델 공유 - {format_memory(process_memory_stats())}")
+    elif not isinstance(llm_config._dispatcher, ReplicaPool):
+        try:
+            logger.info("LLM 모델 로드 중...")
+            llm_config.load_model()
+            logger.info("✓ LLM 모델 로드 완료")
+        except Exception as e:
+            logger.warning(f"⚠ LLM 사전 로드 실패 (첫 요청 시 로드됨): {e}")
     
     yield
     
     # 종료 시
     logger.info("서버 종료 중...")
+    job_manager.shutdown()
+    dispatcher = llm_config.detach_dispatcher()
+    if dispatcher is not None:
+        dispatcher.stop()
+    llm_config.close()
 
 
 # FastAPI 앱 생성
@@ -72,13 +122,20 @@ async def root():
 
 
 if __name__ == "__main__":
-    import uvicorn
-    
-    uvicorn.run(
-        "app:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
-        reload=settings.DEBUG
-    )
+    if settings.PRELOAD_MODEL:
+        # 마스터에서 모델을 한 번 로드하고 워커를 fork (워커가 가중치 공유)
+        from meeting_minutes.api.prefork import serve
+        
+        serve("app:app", settings.API_WORKERS)
+    else:
+        import uvicorn
+        
+        uvicorn.run(
+            "app:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            reload=settings.DEBUG,
+            workers=settings.API_WORKERS
+        )
 
 # uvicorn app:app --reload --host 127.0.0.1 --port 8000
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""파이프라인 벤치마크 - 결정적 가짜 LLM과 합성 회의 대화로 구간별 성능 측정"""
+from .fake_llm import FakeLLM
+from .transcripts import SIZES, generate_transcript, generate_sized
+
+__all__ = [
+    "FakeLLM",
+    "SIZES",
+    "generate_transcript",
+    "generate_sized",
+]
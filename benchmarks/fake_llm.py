@@ -0,0 +1,293 @@
+"""결정적 가짜 LLM - 모델 없이 파이프라인을 측정하기 위한 디스패처"""
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from meeting_minutes.core.generation_profile import (
+    GenerationProfile,
+    STOP_EOS,
+    STOP_LENGTH,
+    STOP_SEQUENCE,
+    trim_stop_sequences
+)
+from meeting_minutes.core.prompt_templates import PromptTemplates
+from meeting_minutes.utils.text_utils import estimate_tokens, extract_speakers
+
+
+def _marker(template: str) -> str:
+    """프롬프트 종류를 구분하는 마지막 줄 (예: "참석자 목록:")"""
+    return template.rstrip().rsplit("\n", 1)[-1]
+
+
+# 프롬프트 마지막 줄 → 응답 종류 (통합 요약이 "요약:"보다 먼저 확인되도록 순서 유지)
+PROMPT_KINDS = (
+    (_marker(PromptTemplates.get_preprocessing_prompt()), "preprocess"),
+    (_marker(PromptTemplates.get_summary_reduce_prompt()), "summary"),
+    (_marker(PromptTemplates.get_participant_extraction_prompt()), "participants"),
+    (_marker(PromptTemplates.get_summary_prompt()), "summary"),
+    (_marker(PromptTemplates.get_agenda_extraction_prompt()), "agenda_items"),
+    (_marker(PromptTemplates.get_discussion_extraction_prompt()), "discussions"),
+    (_marker(PromptTemplates.get_decision_extraction_prompt()), "decisions"),
+    (_marker(PromptTemplates.get_action_item_extraction_prompt()), "action_items"),
+    (_marker(PromptTemplates.get_structured_extraction_prompt()), "structured"),
+)
+
+# 프롬프트 안에서 회의 내용을 감싸는 머리말/꼬리말
+BODY_MARKERS = (
+    ("대화 내용:\n", "\n\n작업 지침"),
+    ("회의 내용:\n", "\n\n위 회의"),
+    ("구간별 요약:\n", "\n\n요구사항"),
+)
+
+_LINE_PATTERN = re.compile(r"^\s*([^:\n]{1,20}?)\s*:\s*(.+)$", re.MULTILINE)
+_PIECE_PATTERN = re.compile(r"\S+\s*")
+
+
+def prompt_kind(prompt: str) -> str:
+    """프롬프트 종류 판별 (알 수 없으면 "text")"""
+    tail = prompt.rstrip()
+    for marker, kind in PROMPT_KINDS:
+        if tail.endswith(marker):
+            return kind
+    return "text"
+
+
+def prompt_body(prompt: str) -> str:
+    """프롬프트에 들어 있는 회의 내용 부분"""
+    for head, tail in BODY_MARKERS:
+        start = prompt.find(head)
+        if start >= 0:
+            start += len(head)
+            end = prompt.find(tail, start)
+            return prompt[start:end if end >= 0 else len(prompt)].strip()
+    return prompt
+
+
+class FakeLLM:
+    """결정적 응답을 돌려주는 가짜 LLM 디스패처
+    
+    llm_config.attach_dispatcher()로 연결하면 모델을 로드하지 않고 그래프 전체를
+    실행할 수 있습니다. 응답은 프롬프트 종류별로 파서가 받아들이는 형식이며
+    같은 프롬프트에는 항상 같은 응답을 돌려줍니다.
+    
+    지연은 (입력 토큰 × prefill_latency) + (생성 토큰 × token_latency)초로
+    흉내 내며, max_concurrency개 요청까지만 동시에 "디코딩"합니다
+    (1이면 요청이 한 줄로 처리되는 단일 모델과 같음).
+    """
+    
+    def __init__(
+        self,
+        token_latency: float = 0.002,
+        prefill_latency: float = 0.0,
+        max_concurrency: int = 1
+    ):
+        """
+        Args:
+            token_latency: 생성 토큰당 지연 (초)
+            prefill_latency: 입력 토큰당 지연 (초)
+            max_concurrency: 동시에 처리할 요청 수
+        """
+        self.token_latency = token_latency
+        self.prefill_latency = prefill_latency
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """호출 통계 초기화"""
+        with self._lock:
+            self.calls = 0
+            self.input_tokens = 0
+            self.generated_tokens = 0
+            self.busy_seconds = 0.0
+            self.calls_by_kind = {}
+    
+    # ========== 응답 생성 ==========
+    
+    def respond(self, prompt: str, max_new_tokens: Optional[int] = None) -> str:
+        """프롬프트 종류별 결정적 응답 (지연 없음)
+        
+        Args:
+            prompt: 사용자 프롬프트
+            max_new_tokens: 토큰 예산 (넘으면 줄 단위로 자름)
+        
+        Returns:
+            str: 응답 텍스트
+        """
+        kind = prompt_kind(prompt)
+        body = prompt_body(prompt)
+        turns = [
+            (speaker.strip(), content.strip())
+            for speaker, content in _LINE_PATTERN.findall(body)
+        ]
+        contents = [content for _, content in turns] or [
+            line.strip() for line in body.splitlines() if line.strip()
+        ]
+        
+        if kind == "preprocess":
+            lines = [f"{speaker}: {content}" for speaker, content in turns] or contents
+        elif kind == "participants":
+            speakers, _ = extract_speakers(body)
+            lines = [", ".join(speakers) or "미상"]
+        elif kind == "summary":
+            lines = [" ".join(self._sample(contents, 4))]
+        elif kind in ("agenda_items", "decisions"):
+            lines = [self._topic(content) for content in self._sample(contents, 5)]
+        elif kind == "discussions":
+            lines = [
+                json.dumps({"topic": self._topic(content), "content": content}, ensure_ascii=False)
+                for content in self._sample(contents, 4)
+            ]
+        elif kind == "action_items":
+            lines = [
+                json.dumps(
+                    {"task": self._topic(content), "assignee": speaker or "미지정", "deadline": "미정"},
+                    ensure_ascii=False
+                )
+                for speaker, content in self._sample(turns, 3)
+            ]
+        elif kind == "structured":
+            # 한 줄 JSON은 잘리면 깨지므로 예산에 맞을 때까지 항목 수를 줄임
+            speakers, _ = extract_speakers(body)
+            for count in range(5, 0, -1):
+                lines = [self._structured(speakers, turns, contents, count)]
+                if not max_new_tokens or estimate_tokens(lines[0]) <= max_new_tokens:
+                    break
+        else:
+            lines = self._sample(contents, 3)
+        
+        return self._fit("\n".join(lines), max_new_tokens)
+    
+    def _structured(self, speakers: list, turns: list, contents: list, count: int) -> str:
+        """단일 패스 JSON 응답 (필드별 최대 count개 항목)"""
+        return json.dumps({
+            "summary": " ".join(self._sample(contents, min(count, 4))),
+            "participants": speakers,
+            "agenda_items": [self._topic(content) for content in self._sample(contents, count)],
+            "discussions": [
+                {"topic": self._topic(content), "content": content}
+                for content in self._sample(contents, min(count, 4))
+            ],
+            "decisions": [self._topic(content) for content in self._sample(contents, min(count, 3))],
+            "action_items": [
+                {"task": self._topic(content), "assignee": speaker or "미지정", "deadline": "미정"}
+                for speaker, content in self._sample(turns, min(count, 3))
+            ],
+        }, ensure_ascii=False)
+    
+    @staticmethod
+    def _sample(items: list, count: int) -> list:
+        """목록에서 고르게 count개 선택 (결정적)"""
+        if len(items) <= count:
+            return list(items)
+        step = len(items) / count
+        return [items[int(i * step)] for i in range(count)]
+    
+    @staticmethod
+    def _topic(content: str) -> str:
+        """발언 앞부분을 항목 제목으로 사용"""
+        return content.split(",")[0].split(".")[0].strip()[:40]
+    
+    @staticmethod
+    def _fit(text: str, max_new_tokens: Optional[int]) -> str:
+        """토큰 예산을 넘지 않도록 줄 단위로 자름 (JSON 줄이 깨지지 않게)"""
+        if not max_new_tokens or estimate_tokens(text) <= max_new_tokens:
+            return text
+        lines = []
+        for line in text.split("\n"):
+            if estimate_tokens("\n".join(lines + [line])) > max_new_tokens:
+                break
+            lines.append(line)
+        return "\n".join(lines) if lines else text[:int(max_new_tokens * 1.5)]
+    
+    # ========== 디스패처 인터페이스 ==========
+    
+    def submit(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_new_tokens: Optional[int] = None,
+        prefix: Optional[str] = None,
+        callback: Optional[Callable[[str], None]] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> Future:
+        """생성 요청 등록 (InferenceScheduler.submit과 같은 인터페이스)
+        
+        Returns:
+            Future: (생성된 텍스트, {"generated_tokens", "stop_reason"})
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="fake-llm"
+                )
+            executor = self._executor
+        return executor.submit(self._generate, prompt, max_new_tokens, callback, profile)
+    
+    def _generate(
+        self,
+        prompt: str,
+        max_new_tokens: Optional[int],
+        callback: Optional[Callable[[str], None]],
+        profile: Optional[GenerationProfile] = None
+    ) -> tuple:
+        """응답 생성 + 지연 흉내 (토큰 조각 단위로 callback 호출)"""
+        start = time.perf_counter()
+        text = self.respond(prompt, max_new_tokens)
+        input_tokens = estimate_tokens(prompt)
+        generated_tokens = estimate_tokens(text)
+        
+        if self.prefill_latency > 0:
+            time.sleep(input_tokens * self.prefill_latency)
+        
+        pieces = _PIECE_PATTERN.findall(text) or [text]
+        piece_latency = generated_tokens * self.token_latency / len(pieces)
+        for piece in pieces:
+            if piece_latency > 0:
+                time.sleep(piece_latency)
+            if callback is not None:
+                callback(piece)
+        
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += input_tokens
+            self.generated_tokens += generated_tokens
+            self.busy_seconds += time.perf_counter() - start
+            kind = prompt_kind(prompt)
+            self.calls_by_kind[kind] = self.calls_by_kind.get(kind, 0) + 1
+        
+        stop_reason = (
+            STOP_LENGTH if max_new_tokens and generated_tokens >= max_new_tokens else STOP_EOS
+        )
+        if profile is not None and profile.stop_sequences:
+            text, stopped = trim_stop_sequences(text, profile.stop_sequences)
+            if stopped:
+                text = text.strip()
+                stop_reason = STOP_SEQUENCE
+        return text, {"generated_tokens": generated_tokens, "stop_reason": stop_reason}
+    
+    def stats(self) -> dict:
+        """호출 통계"""
+        with self._lock:
+            return {
+                "token_latency": self.token_latency,
+                "prefill_latency": self.prefill_latency,
+                "max_concurrency": self.max_concurrency,
+                "calls": self.calls,
+                "calls_by_kind": dict(self.calls_by_kind),
+                "input_tokens": self.input_tokens,
+                "generated_tokens": self.generated_tokens,
+                "busy_seconds": round(self.busy_seconds, 3),
+            }
+    
+    def stop(self, timeout: Optional[float] = 5.0):
+        """작업 스레드 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=timeout is not None, cancel_futures=True)
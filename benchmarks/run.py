@@ -0,0 +1,426 @@
+"""파이프라인 벤치마크 - 가짜 LLM으로 구간별 시간을 측정하여 JSON 보고서로 저장
+
+측정 구간:
+- graph_build: 모드별 그래프 컴파일
+- nodes: 노드별 실행 시간 (LangGraph "tasks" 스트림 기준)
+- parsing: 노드 응답 파서 (가짜 LLM 응답을 반복 파싱한 호출당 시간)
+- docx: Word 문서 생성
+- api: /generate-minutes 왕복 (FastAPI TestClient, 서버 없이 같은 프로세스)
+
+사용 예시:
+  python -m benchmarks.run
+  python -m benchmarks.run --sizes small medium --modes parallel batched --token-latency 0.005
+  python -m benchmarks.run --token-latency 0 --repeats 5 -o output/benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import settings
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.transcripts import SIZES, generate_sized
+
+
+# 그래프 모드 기본값 (chunked는 청크 한도를 넘는 크기에서 자동 선택됨)
+DEFAULT_MODES = ("sequential", "parallel", "batched", "single_pass")
+DEFAULT_SIZES = ("small", "medium", "large")
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+    """노드/문서 생성기의 진행 출력 숨김"""
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def summarize_times(values: list) -> dict:
+    """반복 측정값 요약 (초)"""
+    return {
+        "mean": round(sum(values) / len(values), 6),
+        "min": round(min(values), 6),
+        "max": round(max(values), 6),
+    }
+
+
+def git_commit() -> str:
+    """현재 커밋 해시 (git이 없으면 빈 문자열)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+# ========== 구간별 측정 ==========
+
+def time_graph_build(mode: str, repeats: int) -> dict:
+    """그래프 컴파일 시간"""
+    from meeting_minutes.graph.builder import build_meeting_minutes_graph
+    
+    values = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build_meeting_minutes_graph(mode=mode)
+        values.append(time.perf_counter() - start)
+    return summarize_times(values)
+
+
+def run_graph_timed(graph, state: dict) -> tuple:
+    """그래프 실행 + 노드별 실행 시간
+    
+    Returns:
+        tuple: (최종 상태, {노드: 실행 시간 목록}, 전체 시간)
+    """
+    started = {}
+    nodes = {}
+    final_state = state
+    
+    start = time.perf_counter()
+    for stream_mode, chunk in graph.stream(state, stream_mode=["tasks", "values"]):
+        now = time.perf_counter()
+        if stream_mode == "values":
+            final_state = chunk
+        elif "result" in chunk or "error" in chunk:
+            if chunk["id"] in started:
+                nodes.setdefault(chunk["name"], []).append(now - started.pop(chunk["id"]))
+        else:
+            started[chunk["id"]] = now
+    return final_state, nodes, time.perf_counter() - start
+
+
+def time_parsers(fake: FakeLLM, text: str, iterations: int) -> dict:
+    """노드 응답 파서의 호출당 시간 (마이크로초)"""
+    from meeting_minutes.core.prompt_templates import PromptTemplates
+    from meeting_minutes.nodes.extraction import (
+        parse_participants,
+        parse_agenda,
+        parse_discussions,
+        parse_decisions,
+        parse_action_items,
+        parse_structured_response
+    )
+    
+    parsers = {
+        "participants": (PromptTemplates.get_participant_extraction_prompt(), parse_participants),
+        "agenda_items": (PromptTemplates.get_agenda_extraction_prompt(), parse_agenda),
+        "discussions": (PromptTemplates.get_discussion_extraction_prompt(), parse_discussions),
+        "decisions": (PromptTemplates.get_decision_extraction_prompt(), parse_decisions),
+        "action_items": (PromptTemplates.get_action_item_extraction_prompt(), parse_action_items),
+        "structured": (PromptTemplates.get_structured_extraction_prompt(), parse_structured_response),
+    }
+    
+    result = {}
+    for field, (template, parser) in parsers.items():
+        response = fake.respond(template.format(text=text))
+        start = time.perf_counter()
+        for _ in range(iterations):
+            parser(response)
+        result[field] = round((time.perf_counter() - start) / iterations * 1e6, 2)
+    return result
+
+
+def time_docx(final_state: dict, output_dir: Path, repeats: int) -> dict:
+    """Word 문서 생성 시간"""
+    from meeting_minutes.output.document_generator import MeetingMinutesDocGenerator
+    
+    values = []
+    for index in range(repeats):
+        path = output_dir / f"benchmark_{index}.docx"
+        start = time.perf_counter()
+        MeetingMinutesDocGenerator().generate(final_state, str(path))
+        values.append(time.perf_counter() - start)
+        path.unlink(missing_ok=True)
+    return summarize_times(values)
+
+
+def time_api(client, data: dict, mode: str, repeats: int) -> dict:
+    """/generate-minutes 왕복 시간 (요청 직렬화 → 그래프 → 문서 → 응답)"""
+    settings.GRAPH_MODE = mode
+    values = []
+    status_code = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.post(f"{settings.API_PREFIX}/generate-minutes", json=data)
+        values.append(time.perf_counter() - start)
+        status_code = response.status_code
+        if status_code == 200:
+            Path(response.json()["output_file"]).unlink(missing_ok=True)
+    return {**summarize_times(values), "status_code": status_code}
+
+
+# ========== 실행 ==========
+
+def benchmark_case(
+    fake: FakeLLM,
+    size: str,
+    mode: str,
+    data: dict,
+    repeats: int,
+    parse_iterations: int,
+    output_dir: Path,
+    client=None
+) -> dict:
+    """크기 × 모드 하나 측정"""
+    from meeting_minutes.core.state_schema import create_initial_state
+    from meeting_minutes.graph.builder import build_meeting_minutes_graph
+    
+    graph = build_meeting_minutes_graph(mode=mode)
+    
+    totals = []
+    node_times = {}
+    final_state = None
+    llm_stats = None
+    for _ in range(repeats):
+        state = create_initial_state(
+            transcript=data["raw_transcript"],
+            title=data["meeting_title"],
+            date=data["meeting_date"]
+        )
+        fake.reset_stats()
+        final_state, nodes, total = run_graph_timed(graph, state)
+        llm_stats = fake.stats()
+        totals.append(total)
+        for name, values in nodes.items():
+            node_times.setdefault(name, []).extend(values)
+    
+    result = {
+        "size": size,
+        "mode": mode,
+        "graph_seconds": summarize_times(totals),
+        "nodes": {name: summarize_times(values) for name, values in node_times.items()},
+        "llm": {
+            "calls": llm_stats["calls"],
+            "calls_by_kind": llm_stats["calls_by_kind"],
+            "input_tokens": llm_stats["input_tokens"],
+            "generated_tokens": llm_stats["generated_tokens"],
+            "busy_seconds": llm_stats["busy_seconds"],
+        },
+        "errors": len(final_state.get("errors", [])),
+        "parsing_us": time_parsers(fake, final_state["processed_text"], parse_iterations),
+        "docx_seconds": time_docx(final_state, output_dir, repeats),
+    }
+    if client is not None:
+        result["api_seconds"] = time_api(client, data, mode, repeats)
+    return result
+
+
+def run_benchmark(
+    sizes=DEFAULT_SIZES,
+    modes=DEFAULT_MODES,
+    token_latency: float = 0.001,
+    prefill_latency: float = 0.0,
+    concurrency: int = 1,
+    repeats: int = 1,
+    parse_iterations: int = 200,
+    seed: int = 0,
+    api: bool = True,
+    verbose: bool = False
+) -> dict:
+    """벤치마크 실행
+    
+    가짜 LLM을 llm_config 디스패처로 연결하여 모델 없이 그래프를 실행합니다.
+    청크 한도를 넘는 크기는 서버와 같이 chunked 모드로 처리하며, 같은 크기에서
+    실제 실행 모드가 겹치는 조합은 한 번만 측정합니다.
+    
+    Returns:
+        dict: 보고서 (meta, graph_build, results)
+    """
+    from meeting_minutes.core.llm_config import llm_config
+    from meeting_minutes.nodes.chunking import needs_chunking
+    
+    fake = FakeLLM(token_latency, prefill_latency, concurrency)
+    previous_dispatcher = llm_config.detach_dispatcher()
+    previous_cache, llm_config.response_cache = llm_config.response_cache, None
+    previous_settings = (settings.GRAPH_MODE, settings.OUTPUT_DIR)
+    llm_config.attach_dispatcher(fake)
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fake_llm": {
+                "token_latency": token_latency,
+                "prefill_latency": prefill_latency,
+                "max_concurrency": concurrency,
+            },
+            "repeats": repeats,
+            "parse_iterations": parse_iterations,
+            "seed": seed,
+            "settings": {
+                "PREPROCESS_MODE": settings.PREPROCESS_MODE,
+                "GRAPH_MAX_CONCURRENCY": settings.GRAPH_MAX_CONCURRENCY,
+                "CHUNK_AUTO": settings.CHUNK_AUTO,
+                "CHUNK_MAX_TOKENS": settings.CHUNK_MAX_TOKENS,
+                "CHUNK_MAX_WORKERS": settings.CHUNK_MAX_WORKERS,
+                "CHUNK_GRAPH_MODE": settings.CHUNK_GRAPH_MODE,
+            },
+        },
+        "graph_build": {},
+        "results": [],
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory(prefix="benchmark_") as tmp:
+            output_dir = Path(tmp)
+            settings.OUTPUT_DIR = output_dir
+            
+            client = None
+            if api:
+                from fastapi import FastAPI
+                from fastapi.testclient import TestClient
+                from meeting_minutes.api.routes import router
+                
+                app = FastAPI()
+                app.include_router(router, prefix=settings.API_PREFIX)
+                client = TestClient(app)
+            
+            with quiet(not verbose):
+                for mode in sorted(set(modes) | {"chunked"}):
+                    report["graph_build"][mode] = time_graph_build(mode, max(repeats, 3))
+            
+            for size in sizes:
+                data = generate_sized(size, seed)
+                transcript = data["raw_transcript"]
+                measured = set()
+                for mode in modes:
+                    effective = "chunked" if needs_chunking(transcript) else mode
+                    if effective in measured:
+                        continue
+                    measured.add(effective)
+                    
+                    print(f"[측정] {size} / {effective} ...", file=sys.stderr)
+                    with quiet(not verbose):
+                        result = benchmark_case(
+                            fake, size, effective, data, repeats,
+                            parse_iterations, output_dir, client
+                        )
+                    result["turns"] = SIZES[size]
+                    result["transcript_chars"] = len(transcript)
+                    result["transcript_tokens"] = llm_config.count_tokens(transcript)
+                    report["results"].append(result)
+    finally:
+        llm_config.detach_dispatcher()
+        if previous_dispatcher is not None:
+            llm_config.attach_dispatcher(previous_dispatcher)
+        llm_config.response_cache = previous_cache
+        settings.GRAPH_MODE, settings.OUTPUT_DIR = previous_settings
+        fake.stop()
+    
+    return report
+
+
+def print_report(report: dict):
+    """결과 표 출력"""
+    print("\n" + "=" * 92)
+    print(
+        f"{'크기':<8}{'모드':<14}{'토큰':>8}{'그래프(s)':>12}{'LLM 호출':>10}"
+        f"{'LLM(s)':>10}{'문서(s)':>10}{'API(s)':>10}"
+    )
+    print("-" * 92)
+    for row in report["results"]:
+        api = row.get("api_seconds", {}).get("mean", "-")
+        print(
+            f"{row['size']:<8}{row['mode']:<14}{row['transcript_tokens']:>8}"
+            f"{row['graph_seconds']['mean']:>12.3f}{row['llm']['calls']:>10}"
+            f"{row['llm']['busy_seconds']:>10.3f}{row['docx_seconds']['mean']:>10.3f}"
+            f"{api if api == '-' else round(api, 3):>10}"
+        )
+    print("-" * 92)
+    builds = ", ".join(
+        f"{mode} {times['mean'] * 1000:.1f}ms" for mode, times in report["graph_build"].items()
+    )
+    print(f"그래프 컴파일: {builds}")
+    print("=" * 92)
+
+
+def main():
+    """메인 함수"""
+    from meeting_minutes.graph.builder import GRAPH_MODES
+    
+    parser = argparse.ArgumentParser(
+        description="가짜 LLM으로 파이프라인 구간별 시간 측정 (모델 불필요)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 기본 크기(small/medium/large) × 기본 모드 측정
+  python -m benchmarks.run
+  
+  # LLM 지연을 없애고 파이프라인 자체 오버헤드만 측정
+  python -m benchmarks.run --token-latency 0 --repeats 5
+  
+  # 두 보고서 비교용으로 저장 경로 지정
+  python -m benchmarks.run -o output/benchmarks/before.json
+        """
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=list(DEFAULT_SIZES),
+        help="합성 대화 크기"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=GRAPH_MODES,
+        default=list(DEFAULT_MODES),
+        help="그래프 모드"
+    )
+    parser.add_argument("--token-latency", type=float, default=0.001, help="생성 토큰당 지연 (초)")
+    parser.add_argument("--prefill-latency", type=float, default=0.0, help="입력 토큰당 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=1, help="가짜 LLM 동시 처리 요청 수")
+    parser.add_argument("--repeats", type=int, default=1, help="반복 측정 횟수")
+    parser.add_argument("--parse-iterations", type=int, default=200, help="파서 반복 호출 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 대화 시드")
+    parser.add_argument("--no-api", action="store_true", help="API 왕복 측정 생략")
+    parser.add_argument("--verbose", "-v", action="store_true", help="노드 진행 출력 표시")
+    parser.add_argument(
+        "--output", "-o",
+        help="보고서 JSON 경로 (기본값: output/benchmarks/benchmark_<시각>.json)"
+    )
+    
+    args = parser.parse_args()
+    
+    report = run_benchmark(
+        sizes=args.sizes,
+        modes=args.modes,
+        token_latency=args.token_latency,
+        prefill_latency=args.prefill_latency,
+        concurrency=args.concurrency,
+        repeats=max(1, args.repeats),
+        parse_iterations=max(1, args.parse_iterations),
+        seed=args.seed,
+        api=not args.no_api,
+        verbose=args.verbose
+    )
+    print_report(report)
+    
+    output = Path(args.output) if args.output else (
+        settings.OUTPUT_DIR / "benchmarks" / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✓ 보고서 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
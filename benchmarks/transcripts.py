@@ -0,0 +1,119 @@
+"""합성 회의 대화 생성 - 크기별로 재현 가능한 한국어 회의 대화"""
+import random
+from datetime import date, timedelta
+
+
+# 크기 이름 → 발언 수 (medium부터 청크 한도를 넘어 chunked 모드로 처리됨)
+SIZES = {
+    "small": 15,
+    "medium": 60,
+    "large": 240,
+    "xlarge": 960,
+}
+
+SPEAKERS = (
+    "김팀장", "이과장", "박대리", "최주임",
+    "정책임", "강선임", "윤부장", "한사원",
+)
+
+TOPICS = (
+    "신규 회원 가입 흐름 개선", "3분기 마케팅 예산", "모바일 앱 배포 일정",
+    "고객 문의 응답 시간", "데이터 이관 작업", "보안 점검 결과",
+    "협력사 계약 갱신", "사내 교육 프로그램", "서버 비용 절감", "사용자 설문 분석",
+)
+
+OPENINGS = (
+    "오늘은 {topic} 건을 논의하겠습니다.",
+    "다음 안건은 {topic}입니다.",
+    "{topic} 관련해서 진행 상황 공유드리겠습니다.",
+)
+
+STATEMENTS = (
+    "현재 {topic} 작업은 {percent}% 정도 진행되었습니다.",
+    "{topic} 관련 예산은 {amount}만원 정도 필요할 것 같습니다.",
+    "{topic} 건은 {deadline}까지 마무리하는 것을 목표로 하고 있습니다.",
+    "지난주에 {topic} 관련 회의에서 나온 의견을 정리해 두었습니다.",
+    "{topic} 쪽은 협력사 회신을 기다리고 있어서 일정이 조금 밀릴 수 있습니다.",
+    "{topic}에 대해서는 고객 반응이 생각보다 좋았습니다.",
+    "{topic} 진행하면서 인력이 한 명 더 필요하다는 의견이 있었습니다.",
+)
+
+QUESTIONS = (
+    "{topic} 일정은 문제없을까요?",
+    "{topic} 예산은 어디서 확보하나요?",
+    "{topic} 담당자는 누가 맡는 게 좋을까요?",
+)
+
+DECISIONS = (
+    "그럼 {topic} 건은 {deadline}까지 완료하는 것으로 결정하겠습니다.",
+    "{topic} 예산 {amount}만원은 승인하는 것으로 하겠습니다.",
+    "{topic} 건은 {assignee}님이 담당해서 {deadline}까지 정리해 주세요.",
+)
+
+FILLERS = ("음, ", "어, ", "그, ", "아 네, ", "")
+
+ACKS = ("네, 알겠습니다.", "네 네, 좋습니다.", "동의합니다.", "네, 확인했습니다.")
+
+
+def generate_transcript(turns: int, seed: int = 0) -> dict:
+    """합성 회의 대화 생성
+    
+    같은 turns와 seed에는 항상 같은 대화를 만듭니다. 안건마다 도입 → 보고/질문 →
+    결정 순서로 발언이 이어지며, 군더더기 표현과 짧은 맞장구가 섞여 있어
+    전처리와 추출 노드가 실제와 비슷한 입력을 받습니다.
+    
+    Args:
+        turns: 발언 수
+        seed: 난수 시드
+    
+    Returns:
+        dict: raw_transcript, meeting_title, meeting_date (API 입력 형식)
+    """
+    rng = random.Random(seed)
+    speakers = rng.sample(SPEAKERS, rng.randint(3, min(6, len(SPEAKERS))))
+    meeting_date = date(2025, 1, 6) + timedelta(days=rng.randint(0, 300))
+    
+    def fill(template: str, topic: str) -> str:
+        deadline = meeting_date + timedelta(days=rng.randint(7, 60))
+        return template.format(
+            topic=topic,
+            percent=rng.randint(2, 9) * 10,
+            amount=rng.randint(1, 50) * 100,
+            deadline=f"{deadline.month}월 {deadline.day}일",
+            assignee=rng.choice(speakers)
+        )
+    
+    lines = []
+    topic = rng.choice(TOPICS)
+    topic_turns = 0
+    for index in range(turns):
+        speaker = speakers[0] if topic_turns == 0 else rng.choice(speakers)
+        if topic_turns == 0:
+            text = fill(rng.choice(OPENINGS), topic)
+        elif (topic_turns >= 6 and rng.random() < 0.4) or index == turns - 1:
+            text = fill(rng.choice(DECISIONS), topic)
+            topic_turns = -1
+        elif rng.random() < 0.15:
+            text = rng.choice(ACKS)
+        elif rng.random() < 0.2:
+            text = fill(rng.choice(QUESTIONS), topic)
+        else:
+            text = rng.choice(FILLERS) + fill(rng.choice(STATEMENTS), topic)
+        lines.append(f"{speaker}: {text}")
+        
+        topic_turns += 1
+        if topic_turns == 0:
+            topic = rng.choice([other for other in TOPICS if other != topic])
+    
+    return {
+        "raw_transcript": "\n\n".join(lines),
+        "meeting_title": f"주간 업무 회의 ({turns}개 발언)",
+        "meeting_date": meeting_date.isoformat(),
+    }
+
+
+def generate_sized(size: str, seed: int = 0) -> dict:
+    """크기 이름(SIZES)으로 합성 회의 대화 생성"""
+    if size not in SIZES:
+        raise ValueError(f"지원하지 않는 크기입니다: {size} (지원: {', '.join(SIZES)})")
+    return generate_transcript(SIZES[size], seed)
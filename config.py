@@ -16,6 +16,20 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_PREFIX: str = "/api/v1"
+    API_WORKERS: int = 1  # uvicorn 워커 프로세스 수
+    PRELOAD_MODEL: bool = False  # 워커 fork 전에 마스터에서 모델 로드 (워커가 가중치를 copy-on-write로 공유, Linux/macOS)
+    
+    # 비동기 작업 큐
+    JOB_MAX_WORKERS: int = 1  # 동시에 실행할 생성 작업 수
+    JOB_MAX_PENDING: int = 100  # 대기 가능한 최대 작업 수
+    JOB_MAX_HISTORY: int = 200  # 보관할 완료 작업 수
+    
+    # 실시간 회의 세션 (대화를 이어 붙이며 회의록 초안 갱신)
+    SESSION_MAX_ACTIVE: int = 20  # 동시에 유지할 최대 세션 수
+    SESSION_IDLE_TIMEOUT_SECONDS: int = 3600  # 이 시간 동안 사용하지 않은 세션은 정리
+    
+    # 스트리밍 (SSE)
+    SSE_KEEPALIVE_SECONDS: float = 15.0  # 이벤트가 없을 때 keep-alive 주석 전송 간격
     
     # 파일 경로
     OUTPUT_DIR: Path = Path("./output")
@@ -23,8 +37,69 @@ class Settings(BaseSettings):
     
     # LLM 설정
     LLM_MODEL: str = "exaone-2.4b"
+    LLM_BACKEND: str = "transformers"  # transformers (HuggingFace) | llamacpp (GGUF 양자화 가중치, CPU에서 빠름) | openai (OpenAI 호환 추론 서버) | onnx (ONNX Runtime)
     LLM_TEMPERATURE: float = 0.2
     LLM_MAX_LENGTH: int = 2048
+    LLM_DETERMINISTIC: bool = False  # 그리디 디코딩 (응답 캐시 재사용에 권장)
+    LLM_CPU_PRECISION: str = "fp32"  # CPU 정밀도: fp32 | bf16 | int8 (동적 양자화) | int4 (torchao, 불가 시 int8)
+    LLM_DRAFT_MODEL: str = ""  # 추측 디코딩 초안 모델 (같은 토크나이저, 예: qwen-3b + qwen-1.5b). 비우면 사용 안 함
+    LLM_DRAFT_NUM_TOKENS: int = 0  # 한 번에 제안할 초안 토큰 수 (0이면 transformers 기본값)
+    CONSTRAINED_DECODING: bool = True  # 논의/액션 아이템을 JSON 스키마에 맞는 JSON 줄로만 생성 (파싱 실패 방지)
+    PREFIX_CACHE_SIZE: int = 4  # 회의 내용 접두부 KV 캐시 항목 수 (0이면 비활성화)
+    PREFIX_CACHE_MAX_TOKENS: int = 32768  # KV 캐시에 보관할 최대 접두부 토큰 수
+    
+    # llama.cpp 백엔드 (LLM_BACKEND=llamacpp)
+    LLAMACPP_MODEL_PATH: str = ""  # GGUF 파일 경로 또는 "저장소:파일 패턴" (비우면 LLM_MODEL의 추천 GGUF)
+    LLAMACPP_CONTEXT_SIZE: int = 8192  # 컨텍스트 길이 (프롬프트 + 생성 토큰)
+    LLAMACPP_THREADS: int = 0  # 디코딩 스레드 수 (0이면 llama.cpp 기본값)
+    LLAMACPP_GPU_LAYERS: int = 0  # GPU에 올릴 레이어 수 (-1이면 전부, 0이면 CPU만)
+    LLAMACPP_STATE_CACHE_MB: int = 1024  # 회의 내용 접두부 KV 상태 RAM 캐시 (PREFIX_CACHE_SIZE가 0이면 사용 안 함)
+    
+    # OpenAI 호환 추론 서버 백엔드 (LLM_BACKEND=openai, vLLM / llama-server 등)
+    OPENAI_BASE_URL: str = "http://127.0.0.1:8080/v1"  # 추론 서버 주소 (/v1까지)
+    OPENAI_MODEL: str = ""  # 요청에 보낼 모델 이름 (비우면 서버 /models의 첫 번째 모델)
+    OPENAI_API_KEY: str = ""  # Bearer 인증 키 (비우면 보내지 않음)
+    OPENAI_MAX_CONCURRENCY: int = 8  # 동시 요청 수 상한 (keep-alive 연결 풀 크기)
+    OPENAI_TIMEOUT: float = 120.0  # 요청 타임아웃 (초)
+    OPENAI_MAX_RETRIES: int = 3  # 연결 오류/429/5xx 재시도 횟수 (지수 백오프)
+    
+    # ONNX Runtime 백엔드 (LLM_BACKEND=onnx, scripts/export_onnx.py로 먼저 내보내기)
+    ONNX_MODEL_DIR: Path = Path("./models/onnx")  # 내보낸 모델 위치 (모델 이름별 하위 디렉토리)
+    ONNX_QUANTIZED: bool = False  # int8 양자화 그래프 사용 (export_onnx.py --int8)
+    ONNX_INTRA_OP_THREADS: int = 0  # 연산 내부 스레드 수 (0이면 물리 코어 수)
+    ONNX_INTER_OP_THREADS: int = 1  # 연산 간 스레드 수 (1이면 순차 실행)
+    
+    # 연속 배칭 스케줄러 (동시 요청의 generate 호출을 하나의 배치로 디코딩)
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_MAX_BATCH_SIZE: int = 8  # 동시에 디코딩할 최대 시퀀스 수
+    
+    # 멀티 프로세스 모델 복제본 (코어가 많은 CPU 서버용, 활성화 시 스케줄러 대신 사용)
+    REPLICA_ENABLED: bool = False
+    REPLICA_COUNT: int = 0  # 복제본 수 (0이면 코어 수/메모리로 자동 결정)
+    REPLICA_THREADS: int = 0  # 복제본당 torch 스레드 수 (0이면 코어를 복제본 수로 나눔)
+    
+    # LLM 응답 캐시 (SQLite)
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_PATH: Path = Path("./cache/llm_responses.sqlite3")
+    RESPONSE_CACHE_MAX_ENTRIES: int = 5000
+    RESPONSE_CACHE_MAX_MB: int = 200
+    
+    # 그래프 실행 설정
+    GRAPH_MODE: str = "sequential"  # sequential | parallel | batched | single_pass | chunked
+    GRAPH_MAX_CONCURRENCY: int = 4  # parallel 모드 동시 실행 노드 수 (0이면 제한 없음)
+    
+    # 전처리
+    PREPROCESS_MODE: str = "rule"  # rule (규칙 기반, LLM 호출 없음) | polish (규칙 기반 후 LLM 다듬기) | llm (원본을 LLM이 재작성)
+    
+    # 참석자 추출
+    PARTICIPANTS_RULE_BASED: bool = True  # 화자 표기("김대리: ...")로 참석자 추출 (LLM 호출 생략)
+    PARTICIPANTS_MIN_CONFIDENCE: float = 0.6  # 이보다 낮으면 LLM으로 추출
+    
+    # 긴 회의록 분할 처리 (map-reduce)
+    CHUNK_AUTO: bool = True  # 청크 한도를 넘는 대화는 자동으로 chunked 모드 사용
+    CHUNK_MAX_TOKENS: int = 1500  # 청크당 최대 토큰 수
+    CHUNK_MAX_WORKERS: int = 2  # 동시에 처리할 청크 수
+    CHUNK_GRAPH_MODE: str = "parallel"  # 청크별 처리 그래프 모드
     
     # 기본 회의 정보
     DEFAULT_MEETING_TITLE: str = "회의록"
@@ -33,11 +108,12 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+    
+    def ensure_directories(self):
+        """출력/샘플 데이터 디렉토리 생성 (import 시에는 만들지 않고 서버 시작 시 호출)"""
+        self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        self.SAMPLE_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # 전역 설정 인스턴스
 settings = Settings()
-
-# 출력 디렉토리 생성
-settings.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-settings.SAMPLE_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -6,7 +6,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from meeting_minutes.core.state_schema import create_initial_state, validate_state, MeetingState
-from meeting_minutes.graph.builder import build_meeting_minutes_graph
+from meeting_minutes.graph.builder import GRAPH_MODES
+from meeting_minutes.graph.registry import graph_registry
+from meeting_minutes.nodes.chunking import needs_chunking
+from meeting_minutes.nodes.preprocessing import PREPROCESS_MODES
 from meeting_minutes.output.document_generator import MeetingMinutesDocGenerator
 from meeting_minutes.core.llm_config import llm_config
 from config import settings
@@ -83,7 +86,9 @@ def generate_meeting_minutes_from_state(
     print("-" * 70)
     
     try:
-        graph = build_meeting_minutes_graph()
+        # 청크 한도를 넘는 긴 대화는 map-reduce로 처리
+        mode = "chunked" if needs_chunking(state["raw_transcript"]) else settings.GRAPH_MODE
+        graph = graph_registry.get(mode)
         final_state = graph.invoke(state)
     except Exception as e:
         print(f"\n오류: {e}")
@@ -113,6 +118,17 @@ def generate_meeting_minutes_from_state(
     print(f"  - 결정 사항: {len(final_state['decisions'])}개")
     print(f"  - 액션 아이템: {len(final_state['action_items'])}개")
     
+    generation_stats = final_state.get("generation_stats", [])
+    if generation_stats:
+        generated = sum(stats["generated_tokens"] for stats in generation_stats)
+        budget = sum(stats["budget"] for stats in generation_stats)
+        print(f"\n🧮 생성 토큰 (LLM 호출 {len(generation_stats)}회): {generated}/{budget} 예산")
+        for stats in generation_stats:
+            print(
+                f"  - {stats['profile']}: {stats['generated_tokens']}/{stats['budget']} "
+                f"({stats['stop_reason']})"
+            )
+    
     if final_state.get("errors"):
         print(f"\n⚠ 발생한 오류 ({len(final_state['errors'])}개):")
         for error in final_state["errors"]:
@@ -161,9 +177,32 @@ if __name__ == "__main__":
     parser.add_argument("--title", "-t", default="회의록", help="회의 제목")
     parser.add_argument("--date", "-d", help="회의 날짜 (YYYY-MM-DD)")
     parser.add_argument("--sample", "-s", action="store_true", help="샘플 데이터 사용")
+    parser.add_argument(
+        "--graph-mode", "-g",
+        choices=GRAPH_MODES,
+        help="그래프 실행 모드 (기본값: 설정의 GRAPH_MODE)"
+    )
+    parser.add_argument(
+        "--preprocess-mode", "-p",
+        choices=PREPROCESS_MODES,
+        help="전처리 모드 (기본값: 설정의 PREPROCESS_MODE)"
+    )
     
     args = parser.parse_args()
     
+    if args.graph_mode:
+        settings.GRAPH_MODE = args.graph_mode
+    if args.preprocess_mode:
+        settings.PREPROCESS_MODE = args.preprocess_mode
+    
+    # 연속 배칭 스케줄러 (parallel 모드의 동시 노드 호출을 하나의 배치로 디코딩)
+    if settings.SCHEDULER_ENABLED and llm_config.backend_name == "transformers":
+        from meeting_minutes.core.scheduler import InferenceScheduler
+        
+        llm_config.attach_dispatcher(
+            InferenceScheduler(llm_config, max_batch_size=settings.SCHEDULER_MAX_BATCH_SIZE)
+        )
+    
     # 입력 데이터 결정
     transcript = None
     
@@ -1,11 +1,24 @@
-"""회의록 생성 패키지"""
+"""회의록 생성 패키지
+
+공개 이름은 처음 접근할 때 해당 모듈을 import합니다. 패키지 import만으로는
+torch/transformers/LangGraph/python-docx를 불러오지 않습니다.
+"""
+import importlib
 
 __version__ = "0.1.0"
 
-from .core.state_schema import MeetingState, create_initial_state, validate_state
-from .core.llm_config import LightweightLLMConfig, llm_config
-from .graph.builder import build_meeting_minutes_graph, visualize_graph
-from .output.document_generator import MeetingMinutesDocGenerator
+# 이름 → 모듈 (처음 접근할 때 import)
+_LAZY_EXPORTS = {
+    "MeetingState": ".core.state_schema",
+    "create_initial_state": ".core.state_schema",
+    "validate_state": ".core.state_schema",
+    "LightweightLLMConfig": ".core.transformers_backend",
+    "llm_config": ".core.llm_config",
+    "build_meeting_minutes_graph": ".graph.builder",
+    "visualize_graph": ".graph.builder",
+    "graph_registry": ".graph.registry",
+    "MeetingMinutesDocGenerator": ".output.document_generator",
+}
 
 __all__ = [
     "MeetingState",
@@ -15,5 +28,13 @@ __all__ = [
     "llm_config",
     "build_meeting_minutes_graph",
     "visualize_graph",
+    "graph_registry",
     "MeetingMinutesDocGenerator",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __package__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ from ..core.llm_config import llm_config
 
 async def verify_llm_loaded():
     """LLM 모델이 로드되었는지 확인"""
-    if not llm_config._is_loaded:
+    if not llm_config.is_loaded:
         try:
             llm_config.load_model()
         except Exception as e:
@@ -0,0 +1,176 @@
+"""비동기 작업 관리 - 회의록 생성 작업 큐"""
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelledError(Exception):
+    """작업 취소 요청으로 파이프라인이 중단됨"""
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업 수가 한도를 넘음"""
+
+
+class Job:
+    """회의록 생성 작업
+    
+    상태 흐름: queued → running → completed / failed / cancelled
+    실행 중 취소 요청 시 cancelling 상태를 거쳐 다음 노드 경계에서 중단됩니다.
+    마지막 노드 경계를 지난 뒤 취소되어 끝까지 실행된 작업도 cancelled로 보고하고
+    결과는 버립니다.
+    """
+    
+    def __init__(self, payload):
+        self.id = uuid.uuid4().hex
+        self.payload = payload
+        self.status = "queued"
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self.future = None
+    
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+    
+    def to_dict(self) -> dict:
+        """API 응답용 딕셔너리"""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """제한된 워커 풀에서 회의록 생성 작업 실행
+    
+    파이프라인은 이벤트 루프 밖의 스레드 풀에서 실행되므로 API 프로세스는
+    생성 중에도 다른 요청(/health 등)을 처리할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        runner: Callable,
+        max_workers: int = 2,
+        max_pending: int = 100,
+        max_history: int = 200
+    ):
+        """
+        Args:
+            runner: 작업 실행 함수 runner(payload, cancel_event) -> dict
+            max_workers: 동시에 실행할 작업 수
+            max_pending: 대기 중인 작업의 최대 수
+            max_history: 보관할 완료 작업의 최대 수
+        """
+        self.runner = runner
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="minutes-job"
+        )
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def submit(self, payload) -> Job:
+        """작업 등록 (즉시 반환)"""
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if pending >= self.max_pending:
+                raise JobQueueFullError(f"대기 중인 작업이 너무 많습니다 ({pending}개)")
+            
+            job = Job(payload)
+            self._jobs[job.id] = job
+            self._prune()
+        
+        job.future = self._executor.submit(self._run, job)
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """작업 취소
+        
+        대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 다음 노드 경계에서
+        중단됩니다. 이미 끝난 작업은 그대로 반환합니다.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return job
+            
+            job.cancel_event.set()
+            if job.future is not None and job.future.cancel():
+                job.status = "cancelled"
+                job.finished_at = datetime.now()
+            else:
+                job.status = "cancelling"
+            return job
+    
+    def stats(self) -> dict:
+        """상태별 작업 수"""
+        with self._lock:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return counts
+    
+    def shutdown(self, wait: bool = False):
+        """워커 풀 종료 (대기 중인 작업은 취소)"""
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.is_finished:
+                    job.cancel_event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _run(self, job: Job):
+        """워커 스레드에서 작업 실행"""
+        with self._lock:
+            if job.cancel_event.is_set():
+                job.status = "cancelled"
+                job.finished_at = datetime.now()
+                return
+            job.status = "running"
+            job.started_at = datetime.now()
+        
+        try:
+            result = self.runner(job.payload, job.cancel_event)
+            status, error = "completed", None
+            if job.cancel_event.is_set():
+                # 마지막 노드 경계 이후에 취소됨 - 요청한 취소를 그대로 반영
+                result, status = None, "cancelled"
+        except JobCancelledError:
+            result, status, error = None, "cancelled", None
+        except Exception as e:
+            logger.error(f"작업 실패 ({job.id}): {str(e)}")
+            result, status, error = None, "failed", str(e)
+        
+        with self._lock:
+            job.result = result
+            job.status = status
+            job.error = error
+            job.finished_at = datetime.now()
+    
+    def _prune(self):
+        """오래된 완료 작업 정리 (락을 잡은 상태에서 호출)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
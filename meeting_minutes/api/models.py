@@ -25,6 +25,7 @@ class MeetingStateInput(BaseModel):
     processed_text: str = ""
     summary: str = ""
     participants: List[str] = []
+    participants_source: str = ""
     agenda_items: List[str] = []
     discussions: List[Dict[str, str]] = []
     decisions: List[str] = []
@@ -65,6 +66,7 @@ class MeetingMinutesResponse(BaseModel):
     message: str
     output_file: Optional[str] = None
     meeting_info: Optional[Dict] = None
+    generation_stats: List[Dict] = []
     errors: List[str] = []
 
 
@@ -74,4 +76,67 @@ class HealthResponse(BaseModel):
     app_name: str
     version: str
     model_loaded: bool
+    worker_pid: int
+    memory: Optional[Dict[str, int]] = Field(
+        None,
+        description="워커 메모리 (rss/pss/shared/private 바이트, PRELOAD_MODEL이면 가중치가 shared에 잡힘)"
+    )
     timestamp: str
+
+
+class JobResponse(BaseModel):
+    """비동기 작업 상태 응답"""
+    job_id: str
+    status: str = Field(
+        ...,
+        description="queued | running | cancelling | completed | failed | cancelled"
+    )
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[MeetingMinutesResponse] = None
+    error: Optional[str] = None
+
+
+class SessionCreateInput(BaseModel):
+    """실시간 회의 세션 생성 요청"""
+    meeting_title: str = Field(
+        default="회의록",
+        description="회의 제목"
+    )
+    meeting_date: Optional[str] = Field(
+        default=None,
+        description="회의 날짜 (YYYY-MM-DD)",
+        pattern=r"^\d{4}-\d{2}-\d{2}$"
+    )
+
+
+class SessionSegmentInput(BaseModel):
+    """실시간 회의 세션 대화 추가 요청"""
+    text: str = Field(
+        ...,
+        description="새로 추가된 대화 (\"화자: 발언\" 줄)",
+        min_length=1
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "text": "박부장: 다음 안건으로 넘어가죠.\n이과장: 네, 예산 집행 현황을 보고드리겠습니다."
+            }
+        }
+
+
+class SessionResponse(BaseModel):
+    """실시간 회의 세션 상태 (현재까지의 회의록 초안)"""
+    session_id: str
+    meeting_title: str
+    meeting_date: str
+    created_at: str
+    updated_at: str
+    segment_count: int
+    transcript_length: int
+    last_update: Dict = {}
+    minutes: Dict
+    generation_stats: List[Dict] = []
+    errors: List[str] = []
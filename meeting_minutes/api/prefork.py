@@ -0,0 +1,170 @@
+"""프리포크 서버 - 마스터에서 모델을 한 번 로드한 뒤 uvicorn 워커를 fork
+
+uvicorn --workers는 워커를 spawn으로 새로 시작하므로 워커마다 모델을 따로 로드해
+메모리가 워커 수만큼 늘어납니다. 여기서는 마스터가 앱 import, 그래프 컴파일,
+모델 로드를 마친 뒤 워커를 fork하므로 워커는 읽기 전용 가중치를 copy-on-write로
+공유합니다. 워커별 공유/전용 메모리는 /api/v1/health의 memory 필드로 확인합니다.
+"""
+import gc
+import logging
+import os
+import signal
+import time
+from typing import Dict
+
+from config import settings
+from ..core.backend import process_memory_stats
+from ..core.replica_pool import available_cores
+
+logger = logging.getLogger(__name__)
+
+# 마스터에서 미리 로드해도 fork한 워커에서 그대로 쓸 수 있는 백엔드
+# (onnx: ONNX Runtime 스레드 풀이 fork를 지원하지 않음, openai: 프로세스에 가중치 없음)
+PRELOAD_BACKENDS = ("transformers", "llamacpp")
+
+# 워커가 비정상 종료했을 때 다시 fork하기 전 대기 시간 (초, 재시작 반복 방지)
+RESTART_DELAY = 1.0
+
+
+def format_memory(stats: dict) -> str:
+    """process_memory_stats() 결과를 로그용 문자열로"""
+    if stats is None:
+        return "메모리 정보 없음"
+    return (
+        f"RSS {stats['rss_bytes'] / 1024 ** 2:.0f}MB "
+        f"(공유 {stats['shared_bytes'] / 1024 ** 2:.0f}MB, "
+        f"전용 {stats['private_bytes'] / 1024 ** 2:.0f}MB)"
+    )
+
+
+def preload():
+    """fork 전에 마스터에서 그래프 컴파일과 모델 로드
+    
+    마스터는 생성을 실행하지 않습니다 (스레드 풀이 fork 전에 만들어지지 않도록).
+    로드 중 워밍업 forward(int4 커널 확인)도 생략하고, 응답 캐시의 SQLite 연결은
+    워커가 처음 사용할 때 각자 엽니다.
+    """
+    from ..core.llm_config import llm_config
+    from ..graph.registry import graph_registry
+    
+    elapsed = graph_registry.warmup()
+    logger.info(f"✓ 그래프 {graph_registry.stats()['count']}개 컴파일 완료 ({elapsed * 1000:.1f}ms)")
+    
+    if settings.LLM_BACKEND not in PRELOAD_BACKENDS:
+        logger.warning(
+            f"⚠ {settings.LLM_BACKEND} 백엔드는 미리 로드하지 않습니다 (워커마다 로드)"
+        )
+        return
+    
+    if settings.REPLICA_ENABLED:
+        # 복제본은 워커마다 모델을 다시 로드하므로 공유 효과가 없어짐
+        logger.warning("⚠ PRELOAD_MODEL에서는 모델 복제본을 사용하지 않습니다")
+        settings.REPLICA_ENABLED = False
+    
+    try:
+        logger.info("LLM 모델 로드 중 (마스터)...")
+        llm_config.preload_for_fork = True
+        llm_config.load_model()
+        logger.info(f"✓ LLM 모델 로드 완료 - {format_memory(process_memory_stats())}")
+    except Exception as e:
+        logger.warning(f"⚠ LLM 사전 로드 실패 (워커가 첫 요청 시 각자 로드): {e}")
+    finally:
+        # 워커에서 다시 로드할 때는 워밍업 forward를 그대로 실행
+        llm_config.preload_for_fork = False
+
+
+def _run_worker(config, sockets: list, threads: int):
+    """워커 프로세스 본체: 스레드 수 조정 → uvicorn 서버 실행 (종료 신호는 uvicorn이 처리)"""
+    import uvicorn
+    
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    
+    if settings.LLM_BACKEND == "transformers":
+        import torch
+        
+        # 워커들이 같은 코어를 나눠 쓰므로 워커당 torch 스레드 수를 줄임
+        torch.set_num_threads(threads)
+    
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def serve(app: str = "app:app", workers: int = None):
+    """마스터에서 모델을 로드하고 워커를 fork하여 서버 실행
+    
+    워커가 비정상 종료하면 같은 방식으로 다시 fork합니다 (모델을 다시 로드하지 않음).
+    SIGINT/SIGTERM을 받으면 워커에 SIGTERM을 보내고 모두 종료될 때까지 기다립니다.
+    
+    Args:
+        app: uvicorn 앱 경로 ("모듈:변수")
+        workers: 워커 수 (None이면 settings.API_WORKERS)
+    """
+    import uvicorn
+    
+    if not hasattr(os, "fork"):
+        raise RuntimeError("PRELOAD_MODEL은 fork를 지원하는 OS(Linux/macOS)에서만 사용할 수 있습니다")
+    
+    workers = max(1, workers or settings.API_WORKERS)
+    threads = max(1, len(available_cores()) // workers)
+    
+    config = uvicorn.Config(app, host=settings.API_HOST, port=settings.API_PORT)
+    config.load()
+    sockets = [config.bind_socket()]
+    
+    preload()
+    
+    # fork 전 객체를 GC 대상에서 제외 (GC가 객체 헤더를 건드려 공유 페이지가 복사되지 않도록)
+    gc.collect()
+    gc.freeze()
+    
+    children: Dict[int, int] = {}
+    stopping = False
+    
+    def spawn(index: int):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(config, sockets, threads)
+            except BaseException:
+                logger.exception(f"워커 {index} 실행 실패")
+                os._exit(1)
+            os._exit(0)
+        children[pid] = index
+    
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    
+    for index in range(workers):
+        spawn(index)
+    logger.info(
+        f"✓ 워커 {workers}개 시작 (워커당 스레드 {threads}개, "
+        f"http://{settings.API_HOST}:{settings.API_PORT})"
+    )
+    
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        index = children.pop(pid, None)
+        if index is None or stopping:
+            continue
+        logger.warning(
+            f"⚠ 워커 {index} (pid {pid}) 종료 (코드 {os.waitstatus_to_exitcode(status)}) - 다시 시작"
+        )
+        time.sleep(RESTART_DELAY)
+        if not stopping:
+            spawn(index)
+    
+    for sock in sockets:
+        sock.close()
+    logger.info("서버 종료")
@@ -1,21 +1,35 @@
 """API 라우트"""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional
+import asyncio
+import json
 import logging
+import os
+import threading
 
 from .models import (
     MeetingStateInput,
     SimpleMeetingInput,
     MeetingMinutesResponse,
-    HealthResponse
+    HealthResponse,
+    JobResponse,
+    SessionCreateInput,
+    SessionSegmentInput,
+    SessionResponse
 )
+from .jobs import JobManager, JobCancelledError, JobQueueFullError
+from .sessions import SessionManager, SessionLimitError
 from ..utils.state_converter import dict_to_meeting_state, validate_state_dict
 from ..core.state_schema import MeetingState
-from ..graph.builder import build_meeting_minutes_graph
+from ..graph.registry import graph_registry
+from ..nodes.chunking import needs_chunking
 from ..output.document_generator import MeetingMinutesDocGenerator
-from ..core.llm_config import llm_config
+from ..core.backend import process_memory_stats
+from ..core.llm_config import llm_config, stream_tokens
 from config import settings
 
 # 로거 설정
@@ -25,43 +39,199 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def generate_from_state(state: MeetingState) -> tuple[dict, str]:
+def run_graph(
+    state: MeetingState,
+    cancel_event: Optional[threading.Event] = None,
+    on_task: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """회의록 그래프 실행
+    
+    Args:
+        state: 입력 상태
+        cancel_event: 설정되면 다음 노드 경계에서 JobCancelledError로 중단
+        on_task: 노드 시작/종료 시 호출할 함수 (LangGraph "tasks" 스트림 항목)
+    
+    Returns:
+        dict: 최종 상태
+    """
+    # 청크 한도를 넘는 긴 대화는 map-reduce로 처리
+    mode = "chunked" if needs_chunking(state["raw_transcript"]) else settings.GRAPH_MODE
+    graph = graph_registry.get(mode)
+    if cancel_event is None and on_task is None:
+        return graph.invoke(state)
+    
+    final_state = state
+    for stream_mode, chunk in graph.stream(state, stream_mode=["tasks", "values"]):
+        if stream_mode == "values":
+            final_state = chunk
+        elif on_task is not None:
+            on_task(chunk)
+        if cancel_event is not None and cancel_event.is_set():
+            raise JobCancelledError()
+    return final_state
+
+
+def generate_from_state(
+    state: MeetingState,
+    cancel_event: Optional[threading.Event] = None,
+    on_task: Optional[Callable[[dict], None]] = None
+) -> tuple[dict, str]:
     """State로부터 회의록 생성
     
+    Args:
+        state: 입력 상태
+        cancel_event: 설정되면 다음 노드 경계에서 JobCancelledError로 중단
+        on_task: 노드 시작/종료 시 호출할 함수
+    
     Returns:
         tuple: (최종 상태, 출력 파일 경로)
     """
     # 그래프 실행
-    graph = build_meeting_minutes_graph()
-    final_state = graph.invoke(state)
+    final_state = run_graph(state, cancel_event, on_task)
+    
+    return final_state, write_document(final_state)
+
+
+def write_document(final_state: dict) -> str:
+    """최종 상태로 Word 문서 생성
     
-    # 문서 생성
+    Returns:
+        str: 출력 파일 경로
+    """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_filename = f"회의록_{timestamp}.docx"
-    output_path = settings.OUTPUT_DIR / output_filename
+    output_path = settings.OUTPUT_DIR / f"회의록_{timestamp}.docx"
+    
+    settings.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    doc_generator = MeetingMinutesDocGenerator()
-    doc_generator.generate(final_state, str(output_path))
+    # 동시 작업이 같은 초에 끝나도 파일이 겹치지 않도록 번호 부여
+    # (exists 확인 후 쓰면 경쟁이 생기므로 배타적 생성으로 파일 이름을 먼저 확보)
+    suffix = 1
+    while True:
+        try:
+            open(output_path, "x").close()
+            break
+        except FileExistsError:
+            output_path = settings.OUTPUT_DIR / f"회의록_{timestamp}_{suffix}.docx"
+            suffix += 1
     
-    return final_state, str(output_path)
+    try:
+        doc_generator = MeetingMinutesDocGenerator()
+        doc_generator.generate(final_state, str(output_path))
+    except Exception:
+        output_path.unlink(missing_ok=True)
+        raise
+    
+    return str(output_path)
+
+
+def prepare_state(state_input: MeetingStateInput) -> MeetingState:
+    """요청 모델을 검증하여 MeetingState로 변환
+    
+    Raises:
+        HTTPException: 입력이 유효하지 않은 경우 (400)
+    """
+    # State로 변환
+    state_dict = state_input.model_dump()
+    
+    # 유효성 검증
+    is_valid, error_msg = validate_state_dict(state_dict)
+    if not is_valid:
+        raise HTTPException(status_code=400, detail=error_msg)
+    
+    # 날짜 기본값 설정
+    if not state_dict.get("meeting_date"):
+        state_dict["meeting_date"] = datetime.now().strftime("%Y-%m-%d")
+    
+    return dict_to_meeting_state(state_dict)
+
+
+def build_minutes_response(final_state: dict, output_path: str) -> MeetingMinutesResponse:
+    """최종 상태로 응답 모델 생성"""
+    return MeetingMinutesResponse(
+        success=True,
+        message="회의록이 성공적으로 생성되었습니다",
+        output_file=output_path,
+        meeting_info={
+            "title": final_state["meeting_title"],
+            "date": final_state["meeting_date"],
+            "participants": final_state["participants"],
+            "participants_source": final_state.get("participants_source", ""),
+            "agenda_count": len(final_state["agenda_items"]),
+            "action_items_count": len(final_state["action_items"])
+        },
+        generation_stats=final_state.get("generation_stats", []),
+        errors=final_state.get("errors", [])
+    )
+
+
+def run_job(state: MeetingState, cancel_event: threading.Event) -> dict:
+    """작업 큐 워커에서 회의록 생성"""
+    final_state, output_path = generate_from_state(state, cancel_event)
+    logger.info(f"회의록 생성 완료 (작업): {output_path}")
+    return build_minutes_response(final_state, output_path).model_dump()
+
+
+def format_sse(event: str, data: dict) -> str:
+    """SSE 이벤트 문자열 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def current_node_name() -> Optional[str]:
+    """현재 실행 중인 LangGraph 노드 이름 (그래프 밖이면 None)"""
+    try:
+        from langgraph.config import get_config
+        return get_config()["metadata"].get("langgraph_node")
+    except Exception:
+        return None
+
+
+# 비동기 작업 관리자
+job_manager = JobManager(
+    run_job,
+    max_workers=settings.JOB_MAX_WORKERS,
+    max_pending=settings.JOB_MAX_PENDING,
+    max_history=settings.JOB_MAX_HISTORY
+)
+
+# 실시간 회의 세션 관리자
+session_manager = SessionManager(
+    max_sessions=settings.SESSION_MAX_ACTIVE,
+    idle_timeout=settings.SESSION_IDLE_TIMEOUT_SECONDS
+)
+
+
+def get_session_or_404(session_id: str):
+    """세션 조회 (없으면 404)"""
+    session = session_manager.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    return session
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """헬스 체크"""
     try:
-        model_loaded = llm_config._is_loaded
+        model_loaded = llm_config.is_loaded
         return HealthResponse(
             status="healthy",
             app_name=settings.APP_NAME,
             version=settings.APP_VERSION,
             model_loaded=model_loaded,
+            worker_pid=os.getpid(),
+            memory=process_memory_stats(),
             timestamp=datetime.now().isoformat()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/graphs")
+async def graph_stats():
+    """컴파일된 그래프 목록과 컴파일 시간"""
+    return graph_registry.stats()
+
+
 @router.post("/generate-minutes", response_model=MeetingMinutesResponse)
 async def generate_minutes_full(state_input: MeetingStateInput):
     """완전한 State 객체로 회의록 생성
@@ -76,39 +246,15 @@ async def generate_minutes_full(state_input: MeetingStateInput):
     try:
         logger.info(f"회의록 생성 요청: {state_input.meeting_title}")
         
-        # State로 변환
-        state_dict = state_input.model_dump()
+        meeting_state = prepare_state(state_input)
         
-        # 유효성 검증
-        is_valid, error_msg = validate_state_dict(state_dict)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # 날짜 기본값 설정
-        if not state_dict.get("meeting_date"):
-            state_dict["meeting_date"] = datetime.now().strftime("%Y-%m-%d")
-        
-        meeting_state = dict_to_meeting_state(state_dict)
-        
-        # 회의록 생성
-        final_state, output_path = generate_from_state(meeting_state)
+        # 회의록 생성 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+        final_state, output_path = await run_in_threadpool(generate_from_state, meeting_state)
         
         logger.info(f"회의록 생성 완료: {output_path}")
         
-        return MeetingMinutesResponse(
-            success=True,
-            message="회의록이 성공적으로 생성되었습니다",
-            output_file=output_path,
-            meeting_info={
-                "title": final_state["meeting_title"],
-                "date": final_state["meeting_date"],
-                "participants": final_state["participants"],
-                "agenda_count": len(final_state["agenda_items"]),
-                "action_items_count": len(final_state["action_items"])
-            },
-            errors=final_state.get("errors", [])
-        )
-        
+        return build_minutes_response(final_state, output_path)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -137,6 +283,88 @@ async def generate_minutes_simple(input_data: SimpleMeetingInput):
     return await generate_minutes_full(state_input)
 
 
+@router.post("/generate-minutes/stream")
+async def generate_minutes_stream(state_input: MeetingStateInput, request: Request):
+    """회의록 생성 진행 상황을 SSE로 스트리밍
+    
+    이벤트 종류:
+    - start: 요청 접수 (즉시 전송)
+    - node_start / node_end: 그래프 노드 시작/종료
+    - token: 생성 중인 텍스트 조각 ({"node": ..., "text": ...})
+    - result: 최종 MeetingMinutesResponse
+    - cancelled / error: 중단 또는 실패
+    
+    이벤트가 없는 동안에는 keep-alive 주석을 보내 프록시가 연결을 끊지 않도록 합니다.
+    클라이언트 연결이 끊기면 다음 노드 경계에서 생성을 중단합니다.
+    """
+    meeting_state = prepare_state(state_input)
+    logger.info(f"회의록 생성 요청 (스트리밍): {state_input.meeting_title}")
+    
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    cancel_event = threading.Event()
+    
+    def emit(event: Optional[str], data: Optional[dict] = None):
+        loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+    
+    def on_token(text: str):
+        emit("token", {"node": current_node_name(), "text": text})
+    
+    def on_task(chunk: dict):
+        if "result" in chunk or "error" in chunk:
+            error = chunk.get("error")
+            emit("node_end", {"node": chunk["name"], "error": str(error) if error else None})
+        else:
+            emit("node_start", {"node": chunk["name"]})
+    
+    def worker():
+        try:
+            with stream_tokens(on_token):
+                final_state, output_path = generate_from_state(
+                    meeting_state, cancel_event, on_task
+                )
+            logger.info(f"회의록 생성 완료 (스트리밍): {output_path}")
+            emit("result", build_minutes_response(final_state, output_path).model_dump())
+        except JobCancelledError:
+            logger.info("스트리밍 요청 취소됨 (클라이언트 연결 종료)")
+            emit("cancelled", {})
+        except Exception as e:
+            logger.error(f"회의록 생성 오류 (스트리밍): {str(e)}")
+            emit("error", {"message": str(e)})
+        finally:
+            emit(None)
+    
+    async def event_stream():
+        yield format_sse("start", {
+            "meeting_title": meeting_state["meeting_title"],
+            "meeting_date": meeting_state["meeting_date"]
+        })
+        loop.run_in_executor(None, worker)
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(
+                        queue.get(), timeout=settings.SSE_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield format_sse(event, data)
+        finally:
+            # 클라이언트가 끊긴 경우 다음 노드 경계에서 생성 중단
+            cancel_event.set()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/download/{filename}")
 async def download_file(filename: str):
     """생성된 회의록 다운로드"""
@@ -164,7 +392,7 @@ async def generate_minutes_with_download(state_input: MeetingStateInput):
         meeting_state = dict_to_meeting_state(state_dict)
         
         # 회의록 생성
-        final_state, output_path = generate_from_state(meeting_state)
+        final_state, output_path = await run_in_threadpool(generate_from_state, meeting_state)
         
         # 파일 직접 반환
         return FileResponse(
@@ -172,6 +400,118 @@ async def generate_minutes_with_download(state_input: MeetingStateInput):
             filename=Path(output_path).name,
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         )
-        
+    
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(state_input: MeetingStateInput):
+    """회의록 생성 작업 등록 (즉시 작업 ID 반환)
+    
+    생성은 워커 풀에서 진행되며 GET /jobs/{job_id}로 상태와 결과를 조회합니다.
+    """
+    meeting_state = prepare_state(state_input)
+    
+    try:
+        job = job_manager.submit(meeting_state)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    logger.info(f"작업 등록: {job.id} ({state_input.meeting_title})")
+    return JobResponse(**job.to_dict())
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """작업 상태/결과 조회"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    return JobResponse(**job.to_dict())
+
+
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str):
+    """작업 취소 (실행 중이면 다음 노드 경계에서 중단)"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    logger.info(f"작업 취소 요청: {job_id} ({job.status})")
+    return JobResponse(**job.to_dict())
+
+
+@router.post("/sessions", response_model=SessionResponse, status_code=201)
+async def create_session(session_input: SessionCreateInput):
+    """실시간 회의 세션 생성
+    
+    회의 중 POST /sessions/{session_id}/segments로 대화를 이어 붙이면
+    새로 추가된 부분만 처리하여 회의록 초안을 갱신합니다.
+    """
+    meeting_date = session_input.meeting_date or datetime.now().strftime("%Y-%m-%d")
+    try:
+        session = session_manager.create(session_input.meeting_title, meeting_date)
+    except SessionLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    logger.info(f"세션 생성: {session.id} ({session_input.meeting_title})")
+    return SessionResponse(**session.to_dict())
+
+
+@router.get("/sessions/{session_id}", response_model=SessionResponse)
+async def get_session(session_id: str):
+    """현재까지의 회의록 초안 조회 (갱신 중이면 직전 초안)"""
+    return SessionResponse(**get_session_or_404(session_id).to_dict())
+
+
+@router.post("/sessions/{session_id}/segments", response_model=SessionResponse)
+async def append_session_segment(session_id: str, segment: SessionSegmentInput):
+    """대화 추가 후 갱신된 회의록 초안 반환
+    
+    추가된 대화만 그래프로 처리하고 이전 구간 결과와 병합하므로
+    처리 비용은 새로 추가된 대화 길이에 비례합니다.
+    """
+    session = get_session_or_404(session_id)
+    if not segment.text.strip():
+        raise HTTPException(status_code=400, detail="추가할 대화 내용이 비어 있습니다")
+    
+    try:
+        update = await run_in_threadpool(session.append, segment.text)
+    except Exception as e:
+        logger.error(f"세션 갱신 실패 ({session_id}): {str(e)}")
+        raise HTTPException(status_code=500, detail=f"세션 갱신 실패: {str(e)}")
+    
+    logger.info(
+        f"세션 갱신: {session_id} (구간 {update['new_segments']}개, {update['seconds']}초)"
+    )
+    return SessionResponse(**session.to_dict())
+
+
+@router.post("/sessions/{session_id}/document", response_model=MeetingMinutesResponse)
+async def create_session_document(session_id: str):
+    """현재까지의 회의록 초안으로 Word 문서 생성"""
+    session = get_session_or_404(session_id)
+    if not session.appended:
+        raise HTTPException(status_code=400, detail="세션에 추가된 대화가 없습니다")
+    
+    final_state = session.to_state()
+    try:
+        output_path = await run_in_threadpool(write_document, final_state)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"문서 생성 실패: {str(e)}")
+    
+    return build_minutes_response(final_state, output_path)
+
+
+@router.delete("/sessions/{session_id}", response_model=SessionResponse)
+async def close_session(session_id: str):
+    """세션 종료 (마지막 초안 반환 후 구간 결과 해제)"""
+    session = session_manager.close(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    
+    logger.info(f"세션 종료: {session_id}")
+    return SessionResponse(**session.to_dict())
@@ -0,0 +1,203 @@
+"""실시간 회의 세션 - 대화를 이어 붙이며 회의록 초안을 점진적으로 갱신"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+from ..core.state_schema import MeetingState, create_initial_state
+from ..nodes.chunking import (
+    split_transcript,
+    process_chunks,
+    merge_chunk_results,
+    reduce_summaries
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLimitError(Exception):
+    """활성 세션 수가 한도를 넘음"""
+
+
+class LiveSession:
+    """진행 중인 회의 세션
+    
+    추가된 대화 구간(segment)만 그래프로 처리하고 구간별 결과를 보관합니다.
+    추출 결과는 보관된 구간 결과를 merge_chunk_results로 병합하고(LLM 호출 없음),
+    요약은 지금까지의 요약과 새 구간 요약만 통합하므로 갱신 비용은 새로 추가된
+    대화 길이에만 비례합니다.
+    """
+    
+    def __init__(self, title: str, date: str):
+        self.id = uuid.uuid4().hex
+        self.title = title
+        self.date = date
+        self.created_at = datetime.now()
+        self.updated_at = self.created_at
+        self.last_active = time.monotonic()
+        self.appended: List[str] = []  # 추가 요청으로 받은 대화 원문 (요청 순서)
+        self.segments: List[str] = []  # 처리한 구간(청크)
+        self.results: List[dict] = []
+        self.summary = ""
+        self.merged: dict = merge_chunk_results([])
+        self.summary_errors: List[str] = []
+        self.last_update: dict = {}
+        # 같은 세션의 추가 요청은 순서대로 처리 (처리 중에도 조회는 이전 초안 반환)
+        self._append_lock = threading.Lock()
+        self._lock = threading.Lock()
+    
+    @property
+    def transcript(self) -> str:
+        """지금까지 추가된 전체 대화 (추가된 원문을 그대로 이어 붙임)"""
+        return "".join(self.appended)
+    
+    def append(self, text: str) -> dict:
+        """대화 구간 추가 후 새 구간만 처리하여 회의록 초안 갱신
+        
+        Args:
+            text: 새로 추가된 대화 ("화자: 발언" 줄)
+        
+        Returns:
+            dict: 이번 갱신 정보 (new_segments, seconds)
+        """
+        with self._append_lock:
+            start = time.perf_counter()
+            segments = split_transcript(text)
+            results = process_chunks(segments, self.title, self.date)
+            
+            all_results = self.results + results
+            merged = merge_chunk_results(all_results)
+            
+            new_summaries = [result.get("summary", "") for result in results]
+            summary_errors = list(self.summary_errors)
+            try:
+                summary = reduce_summaries(
+                    [self.summary] + new_summaries if self.summary else new_summaries
+                )
+            except Exception as e:
+                logger.error(f"세션 요약 통합 오류 ({self.id}): {str(e)}")
+                summary = "\n".join(filter(None, [self.summary] + new_summaries))
+                summary_errors.append(f"요약 통합 오류: {str(e)}")
+            
+            last_update = {
+                "new_segments": len(segments),
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            with self._lock:
+                self.appended = self.appended + [text]
+                self.segments = self.segments + segments
+                self.results = all_results
+                self.merged = merged
+                self.summary = summary
+                self.summary_errors = summary_errors
+                self.updated_at = datetime.now()
+                self.last_active = time.monotonic()
+                self.last_update = last_update
+            return last_update
+    
+    def to_state(self) -> MeetingState:
+        """현재까지의 회의록 초안을 MeetingState로 변환 (문서 생성용)"""
+        with self._lock:
+            state = create_initial_state(
+                transcript=self.transcript,
+                title=self.title,
+                date=self.date
+            )
+            state.update({
+                **self.merged,
+                "processed_text": "\n\n".join(
+                    result.get("processed_text", "") for result in self.results
+                ),
+                "summary": self.summary,
+                "errors": self.merged["errors"] + self.summary_errors,
+                "current_step": "session_updated",
+            })
+            return state
+    
+    def to_dict(self) -> dict:
+        """API 응답용 딕셔너리"""
+        with self._lock:
+            return {
+                "session_id": self.id,
+                "meeting_title": self.title,
+                "meeting_date": self.date,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+                "segment_count": len(self.appended),
+                "transcript_length": sum(len(text) for text in self.appended),
+                "last_update": self.last_update,
+                "minutes": {
+                    "summary": self.summary,
+                    "participants": self.merged["participants"],
+                    "agenda_items": self.merged["agenda_items"],
+                    "discussions": self.merged["discussions"],
+                    "decisions": self.merged["decisions"],
+                    "action_items": self.merged["action_items"],
+                },
+                "generation_stats": self.merged["generation_stats"],
+                "errors": self.merged["errors"] + self.summary_errors,
+            }
+
+
+class SessionManager:
+    """실시간 회의 세션 보관
+    
+    오래 사용하지 않은 세션은 새 세션을 만들 때 정리합니다.
+    """
+    
+    def __init__(self, max_sessions: int = 20, idle_timeout: float = 3600):
+        """
+        Args:
+            max_sessions: 동시에 유지할 최대 세션 수
+            idle_timeout: 이 시간(초) 동안 갱신이 없으면 세션 정리
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def create(self, title: str, date: str) -> LiveSession:
+        """세션 생성"""
+        with self._lock:
+            self._prune()
+            if len(self._sessions) >= self.max_sessions:
+                raise SessionLimitError(f"활성 세션이 너무 많습니다 ({len(self._sessions)}개)")
+            session = LiveSession(title, date)
+            self._sessions[session.id] = session
+            return session
+    
+    def get(self, session_id: str) -> Optional[LiveSession]:
+        """세션 조회 (조회도 사용으로 보고 만료 시간을 늘림)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_active = time.monotonic()
+            return session
+    
+    def close(self, session_id: str) -> Optional[LiveSession]:
+        """세션 종료 (보관된 구간 결과 해제)"""
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+    
+    def stats(self) -> dict:
+        """활성 세션 수와 보관 중인 구간 수"""
+        with self._lock:
+            return {
+                "active": len(self._sessions),
+                "segments": sum(len(session.segments) for session in self._sessions.values()),
+            }
+    
+    def _prune(self):
+        """오래 사용하지 않은 세션 정리 (락을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        expired = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if now - session.last_active > self.idle_timeout
+        ]
+        for session_id in expired:
+            logger.info(f"세션 만료: {session_id}")
+            del self._sessions[session_id]
@@ -1,13 +1,42 @@
-"""Core 모듈 초기화"""
+"""Core 모듈 초기화
+
+torch/transformers가 필요한 이름(LightweightLLMConfig, InferenceScheduler)은
+처음 접근할 때 import합니다.
+"""
+import importlib
+
 from .state_schema import MeetingState, create_initial_state, validate_state
-from .llm_config import LightweightLLMConfig, llm_config
+from .backend import LLMBackend
+from .llm_config import create_llm_backend, llm_config, stream_tokens
 from .prompt_templates import PromptTemplates
+from .generation_profile import GenerationProfile
+from .replica_pool import ReplicaPool, suggest_replica_config
+
+# 이름 → 모듈 (처음 접근할 때 import)
+_LAZY_EXPORTS = {
+    "LightweightLLMConfig": ".transformers_backend",
+    "InferenceScheduler": ".scheduler",
+}
 
 __all__ = [
     "MeetingState",
     "create_initial_state",
     "validate_state",
+    "LLMBackend",
     "LightweightLLMConfig",
+    "create_llm_backend",
     "llm_config",
+    "stream_tokens",
     "PromptTemplates",
-]
\ No newline at end of file
+    "GenerationProfile",
+    "InferenceScheduler",
+    "ReplicaPool",
+    "suggest_replica_config",
+]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __package__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
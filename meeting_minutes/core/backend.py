@@ -0,0 +1,506 @@
+"""LLM 백엔드 인터페이스 - 노드가 사용하는 생성 API와 백엔드 공통 기능"""
+import copy
+import queue
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .response_cache import ResponseCache
+from .generation_profile import GenerationProfile
+
+DEFAULT_SYSTEM_PROMPT = "당신은 한국어 문서 처리 전문 AI입니다."
+
+# 생성 토큰을 받을 콜백 (요청 컨텍스트별로 설정, LangGraph 노드 스레드에도 전파됨)
+token_callback: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "token_callback", default=None
+)
+
+
+@contextmanager
+def stream_tokens(callback: Callable[[str], None]):
+    """이 블록 안에서 실행되는 generate()의 생성 텍스트를 callback으로 전달
+    
+    Args:
+        callback: 디코딩된 텍스트 조각을 받는 함수
+    """
+    token = token_callback.set(callback)
+    try:
+        yield
+    finally:
+        token_callback.reset(token)
+
+
+def process_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 상주 메모리 (RSS, 바이트)"""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def process_memory_stats() -> Optional[Dict[str, int]]:
+    """현재 프로세스 메모리의 공유/전용 구성 (/proc/self/smaps_rollup, 바이트)
+    
+    fork 후 워커가 쓰지 않은 페이지(미리 로드한 모델 가중치 등)는 부모/다른 워커와
+    공유되어 shared_bytes에, 워커가 새로 쓰거나 복사된 페이지는 private_bytes에
+    잡힙니다. pss_bytes는 공유 페이지를 공유 프로세스 수로 나눈 비례 몫입니다.
+    
+    Returns:
+        dict: rss_bytes, pss_bytes, shared_bytes, private_bytes (Linux 외에는 None)
+    """
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    fields[key] = int(value.split()[0]) * 1024
+    except OSError:
+        return None
+    return {
+        "rss_bytes": fields.get("Rss", 0),
+        "pss_bytes": fields.get("Pss", 0),
+        "shared_bytes": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private_bytes": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+class LLMBackend(ABC):
+    """LLM 추론 백엔드 인터페이스
+    
+    노드와 API는 이 인터페이스(generate / generate_batch / stream / count_tokens)만
+    사용하므로 전역 llm_config가 어떤 백엔드인지 알 필요가 없습니다.
+    
+    하위 클래스는 load_model, generate_with_stats, count_tokens, get_model_info를
+    구현합니다. 생성 통계 기록, 응답 캐시 키, 디스패처 연결, 스트리밍은 여기서
+    공통으로 제공하며, 배치 디코딩을 지원하지 않는 백엔드는 기본
+    generate_batch_with_stats(프롬프트를 차례로 생성)를 그대로 사용합니다.
+    """
+    
+    # 백엔드 이름 (설정값 LLM_BACKEND와 같음)
+    backend_name = ""
+    
+    # generate 호출을 여러 스레드에서 동시에 보내도 되는지 (예: 원격 추론 서버)
+    concurrent_requests = False
+    
+    def __init__(
+        self,
+        max_length: int = 2048,
+        temperature: float = 0.2,
+        deterministic: bool = False,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Args:
+            max_length: 최대 생성 길이
+            temperature: 생성 온도
+            deterministic: 그리디 디코딩 사용 (같은 입력 → 같은 출력)
+            response_cache: 디스크 응답 캐시 (None이면 사용 안 함)
+        """
+        self.model_id = ""
+        self.model_name = ""
+        self.max_length = max_length
+        self.temperature = temperature
+        self.deterministic = deterministic
+        self.response_cache = response_cache
+        self._is_loaded = False
+        
+        # fork 전 마스터에서 로드 중 (스레드 풀을 시작하는 워밍업 생성/forward를 하지 않음)
+        self.preload_for_fork = False
+        
+        # 생성 요청을 대신 처리할 디스패처 (예: InferenceScheduler)
+        self._dispatcher = None
+        
+        # 프로필별 생성 통계 (호출 수, 예산 대비 실제 생성 토큰, 종료 사유)
+        self.generation_stats: Dict[str, dict] = {}
+        self._stats_lock = threading.Lock()
+    
+    @property
+    def is_loaded(self) -> bool:
+        """모델 로드 여부"""
+        return self._is_loaded
+    
+    # ========== 하위 클래스 구현 ==========
+    
+    @abstractmethod
+    def load_model(self):
+        """모델 로드 (이미 로드되어 있으면 아무것도 하지 않음)"""
+    
+    @abstractmethod
+    def generate_with_stats(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> tuple:
+        """텍스트 생성 + 생성 통계
+        
+        인자는 generate()와 같습니다.
+        
+        Returns:
+            tuple: (생성된 텍스트, 통계 dict)
+                통계: profile, input_tokens, budget, generated_tokens, stop_reason
+                (stop_reason: eos / length / stop_sequence / repetition / cache)
+        """
+    
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """텍스트 토큰 수 (모델이 없으면 추정치)"""
+    
+    @abstractmethod
+    def get_model_info(self) -> dict:
+        """모델 정보"""
+    
+    # ========== 생성 API ==========
+    
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> str:
+        """텍스트 생성
+        
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
+            prefix: prompt의 공통 접두부 (예: 회의 내용). 백엔드가 지원하면
+                시스템 프롬프트 + 접두부의 KV 캐시를 재사용합니다.
+            profile: 노드별 생성 프로필 (토큰 예산, 중단 문자열, 반복 감지).
+                None이면 max_length까지 생성합니다.
+        
+        Returns:
+            str: 생성된 텍스트
+        
+        stream_tokens() 블록 안에서 호출되면 생성되는 텍스트를 콜백으로도
+        전달합니다 (캐시 적중 시에는 전체 응답을 한 번에 전달).
+        """
+        return self.generate_with_stats(prompt, system_prompt, prefix, profile)[0]
+    
+    def generate_batch(
+        self,
+        prompts: List[str],
+        per_prompt_params: Optional[List[Dict]] = None
+    ) -> List[str]:
+        """여러 프롬프트 생성 (입력 순서대로 결과 반환)
+        
+        Args:
+            prompts: 사용자 프롬프트 목록
+            per_prompt_params: 프롬프트별 설정 목록 (선택)
+                - system_prompt: 시스템 프롬프트
+                - max_new_tokens: 최대 생성 토큰 수 (기본값: profile 예산 또는 max_length)
+                - profile: 생성 프로필 (토큰 예산과 중단 문자열 적용)
+        
+        Returns:
+            List[str]: 프롬프트 순서대로 생성된 텍스트
+        """
+        return self.generate_batch_with_stats(prompts, per_prompt_params)[0]
+    
+    def generate_batch_with_stats(
+        self,
+        prompts: List[str],
+        per_prompt_params: Optional[List[Dict]] = None
+    ) -> tuple:
+        """배치 생성 + 프롬프트별 생성 통계 (기본 구현: 차례로 생성)
+        
+        디스패처가 연결되어 있거나 concurrent_requests인 백엔드는 모든 프롬프트를
+        한꺼번에 제출합니다.
+        
+        Returns:
+            tuple: (프롬프트 순서대로 생성된 텍스트 목록, 통계 dict 목록)
+        """
+        if not prompts:
+            return [], []
+        
+        if per_prompt_params is None:
+            per_prompt_params = [{} for _ in prompts]
+        if len(per_prompt_params) != len(prompts):
+            raise ValueError("prompts와 per_prompt_params의 길이가 다릅니다")
+        
+        profiles = []
+        for params in per_prompt_params:
+            profile = params.get("profile")
+            if params.get("max_new_tokens"):
+                # 명시한 토큰 수를 예산으로 고정
+                profile = copy.copy(profile) if profile is not None else GenerationProfile(
+                    "default", params["max_new_tokens"], repetition_max_period=0
+                )
+                profile.max_new_tokens = params["max_new_tokens"]
+                profile.input_ratio = None
+            profiles.append(profile)
+        
+        if self._dispatcher is not None or self.concurrent_requests:
+            # 디스패처/원격 요청은 서로 기다리지 않도록 스레드에서 동시에 진행
+            threads = []
+            outputs = [None] * len(prompts)
+            
+            def run(idx: int, context):
+                try:
+                    outputs[idx] = context.run(
+                        self.generate_with_stats,
+                        prompts[idx],
+                        per_prompt_params[idx].get("system_prompt"),
+                        None,
+                        profiles[idx]
+                    )
+                except Exception as e:
+                    outputs[idx] = e
+            
+            for idx in range(len(prompts)):
+                thread = threading.Thread(target=run, args=(idx, copy_context()), daemon=True)
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+            for output in outputs:
+                if isinstance(output, Exception):
+                    raise output
+        else:
+            outputs = [
+                self.generate_with_stats(prompt, params.get("system_prompt"), None, profile)
+                for prompt, params, profile in zip(prompts, per_prompt_params, profiles)
+            ]
+        
+        return [text for text, _ in outputs], [stats for _, stats in outputs]
+    
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> Iterator[str]:
+        """생성되는 텍스트 조각을 차례로 반환
+        
+        generate()를 별도 스레드에서 stream_tokens()로 실행하고 콜백으로 받은
+        조각을 넘겨줍니다. 생성 중 예외는 조각을 모두 넘긴 뒤 다시 발생합니다.
+        
+        Yields:
+            str: 생성된 텍스트 조각
+        """
+        pieces = queue.Queue()
+        done = object()
+        error = []
+        
+        def run():
+            try:
+                with stream_tokens(pieces.put):
+                    self.generate(prompt, system_prompt, prefix, profile)
+            except Exception as e:
+                error.append(e)
+            finally:
+                pieces.put(done)
+        
+        context = copy_context()
+        threading.Thread(target=context.run, args=(run,), daemon=True).start()
+        while True:
+            piece = pieces.get()
+            if piece is done:
+                break
+            yield piece
+        if error:
+            raise error[0]
+    
+    # ========== 디스패처 ==========
+    
+    def attach_dispatcher(self, dispatcher):
+        """generate 호출을 디스패처로 넘기도록 연결
+        
+        디스패처는 submit(prompt, system_prompt, max_new_tokens, prefix=None,
+        callback=None, profile=None) -> Future 를 제공해야 하며, Future 결과는
+        (생성 텍스트, {"generated_tokens", "stop_reason"} 통계) 튜플입니다.
+        연결되어 있는 동안 generate/generate_batch는 응답 캐시 확인 후 디스패처에
+        요청을 넘기고 결과를 기다립니다 (모델 로드도 디스패처가 담당).
+        
+        디스패처의 applies_profiles가 True이면 프로필의 제약 디코딩과 중단 조건을
+        디스패처가 생성 중에 적용합니다. 아니면 토큰 예산만 적용합니다.
+        """
+        self._dispatcher = dispatcher
+    
+    def detach_dispatcher(self):
+        """디스패처 연결 해제 (직접 생성으로 복귀)"""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        return dispatcher
+    
+    def _dispatch(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        prefix: Optional[str],
+        profile: Optional[GenerationProfile],
+        input_tokens: int,
+        budget: int,
+        cache_key: Optional[str],
+        callback: Optional[Callable[[str], None]]
+    ) -> tuple:
+        """디스패처로 생성 (프로필 적용 여부는 디스패처의 applies_profiles 참고)"""
+        generated_text, dispatch_stats = self._dispatcher.submit(
+            prompt,
+            system_prompt,
+            budget,
+            prefix=prefix,
+            callback=callback,
+            profile=profile
+        ).result()
+        if cache_key is not None:
+            self.response_cache.put(cache_key, generated_text)
+        stats = self._record_generation(
+            profile, input_tokens, budget,
+            dispatch_stats["generated_tokens"], dispatch_stats["stop_reason"]
+        )
+        if "speculative" in dispatch_stats:
+            stats["speculative"] = dispatch_stats["speculative"]
+        return generated_text, stats
+    
+    # ========== 공통 기능 ==========
+    
+    def _budget(self, profile: Optional[GenerationProfile], input_tokens: int) -> int:
+        """이번 호출의 토큰 예산"""
+        return profile.budget(input_tokens, self.max_length) if profile else self.max_length
+    
+    def _cached_generation(
+        self,
+        cache_key: Optional[str],
+        profile: Optional[GenerationProfile],
+        input_tokens: int,
+        budget: int,
+        callback: Optional[Callable[[str], None]]
+    ) -> Optional[tuple]:
+        """응답 캐시 적중 시 (텍스트, 통계), 아니면 None"""
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        if callback is not None:
+            callback(cached)
+        return cached, self._record_generation(
+            profile, input_tokens, budget, self.count_tokens(cached), "cache"
+        )
+    
+    def _record_generation(
+        self,
+        profile: Optional[GenerationProfile],
+        input_tokens: int,
+        budget: int,
+        generated_tokens: int,
+        stop_reason: str
+    ) -> dict:
+        """생성 통계 기록 (프로필별 누적) 후 이번 호출의 통계 반환"""
+        name = profile.name if profile is not None else "default"
+        with self._stats_lock:
+            totals = self.generation_stats.setdefault(name, {
+                "calls": 0,
+                "budget_tokens": 0,
+                "generated_tokens": 0,
+                "stop_reasons": {},
+            })
+            totals["calls"] += 1
+            totals["budget_tokens"] += budget
+            totals["generated_tokens"] += generated_tokens
+            totals["stop_reasons"][stop_reason] = totals["stop_reasons"].get(stop_reason, 0) + 1
+        return {
+            "profile": name,
+            "input_tokens": input_tokens,
+            "budget": budget,
+            "generated_tokens": generated_tokens,
+            "stop_reason": stop_reason,
+        }
+    
+    def _sampling_kwargs(self) -> dict:
+        """샘플링 파라미터 (deterministic이면 그리디 디코딩)"""
+        if self.deterministic:
+            return {"do_sample": False}
+        return {
+            "do_sample": True,
+            "temperature": self.temperature,
+            "top_p": 0.9,
+        }
+    
+    def _response_cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_new_tokens: int,
+        profile: Optional[GenerationProfile] = None,
+        constrained: bool = False
+    ) -> Optional[str]:
+        """응답 캐시 키 (캐시 비활성화 시 None)
+        
+        모델 ID에 백엔드 이름을 붙여 같은 모델의 다른 백엔드(예: GGUF 양자화)
+        결과가 섞이지 않게 합니다.
+        """
+        if self.response_cache is None:
+            return None
+        params = {**self._sampling_kwargs(), "max_new_tokens": max_new_tokens}
+        if profile is not None:
+            params.update(profile.cache_params())
+        if constrained:
+            params["json_schema"] = profile.json_schema
+        return ResponseCache.make_key(
+            self.model_id if self.backend_name == "transformers"
+            else f"{self.backend_name}:{self.model_id}",
+            prompt,
+            system_prompt or DEFAULT_SYSTEM_PROMPT,
+            params
+        )
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str] = None) -> list:
+        """채팅 메시지 구성"""
+        return [
+            {"role": "system", "content": system_prompt or DEFAULT_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def test_connection(self) -> bool:
+        """모델 테스트"""
+        try:
+            if not self._is_loaded:
+                self.load_model()
+            
+            print("\n[테스트] 모델 응답 확인 중...")
+            test_result = self.generate("안녕하세요. 간단히 인사해주세요.")
+            
+            if test_result and len(test_result) > 0:
+                print(f"✓ 모델 테스트 성공")
+                print(f"  응답 예시: {test_result[:50]}...")
+                return True
+            else:
+                print(f"✗ 모델 응답이 비어있습니다")
+                return False
+        
+        except Exception as e:
+            print(f"✗ 모델 테스트 실패: {e}")
+            return False
+    
+    def generation_stats_summary(self) -> dict:
+        """프로필별 누적 생성 통계 (예산 사용률 포함)"""
+        with self._stats_lock:
+            return {
+                name: {
+                    **copy.deepcopy(totals),
+                    "budget_usage": (
+                        round(totals["generated_tokens"] / totals["budget_tokens"], 3)
+                        if totals["budget_tokens"] else 0.0
+                    ),
+                }
+                for name, totals in self.generation_stats.items()
+            }
+    
+    def close(self):
+        """백엔드 자원 정리 (서버 종료 시, 기본 구현은 아무것도 하지 않음)"""
+    
+    def dispatcher_stats(self) -> Optional[dict]:
+        """연결된 디스패처 통계 (없으면 None)"""
+        if self._dispatcher is not None and hasattr(self._dispatcher, "stats"):
+            return self._dispatcher.stats()
+        return None
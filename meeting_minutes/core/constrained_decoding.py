@@ -0,0 +1,265 @@
+"""제약 디코딩 모듈 - JSON 스키마 기반 JSON 줄(JSON Lines) 출력 강제"""
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+import torch
+from transformers import LogitsProcessor
+
+
+# 유한 상태 기계 상태: (세그먼트 번호, 세그먼트 내 위치, 남은 UTF-8 연속 바이트 수)
+# - 리터럴 세그먼트: 위치 = 리터럴에서 다음에 와야 할 바이트 인덱스
+# - 문자열 세그먼트: 위치 = 0 (아직 빈 문자열) / 1 (한 글자 이상)
+State = Tuple[int, int, int]
+
+_BYTE_TOKEN = re.compile(r"^<0x([0-9A-Fa-f]{2})>$")
+
+
+class JsonLinesGrammar:
+    """문자열 필드만 가진 객체를 한 줄에 하나씩 나열하는 문법
+    
+    JSON 스키마의 properties 순서대로 키를 고정하고 값은 비어 있지 않은
+    문자열로 제한합니다. 예를 들어 {"topic", "content"} 스키마는 다음 형식만
+    허용합니다 (프롬프트 예시와 같은 공백 규칙).
+        
+        {"topic": "...", "content": "..."}\\n{"topic": "...", ...}
+    
+    문자열 값 안에는 따옴표, 역슬래시, 제어 문자를 허용하지 않으므로 생성된
+    줄은 항상 json.loads로 파싱됩니다. 완성된 객체 뒤(또는 출력 시작)에서만
+    EOS를 허용합니다.
+    """
+    
+    def __init__(self, schema: dict):
+        """스키마로 문법 생성
+        
+        Args:
+            schema: JSON 스키마 (type=object, 모든 properties가 type=string)
+        
+        Raises:
+            ValueError: 지원하지 않는 스키마
+        """
+        properties = schema.get("properties") or {}
+        if schema.get("type") != "object" or not properties:
+            raise ValueError("제약 디코딩은 properties가 있는 object 스키마만 지원합니다")
+        for name, prop in properties.items():
+            if prop.get("type") != "string":
+                raise ValueError(f"제약 디코딩은 문자열 필드만 지원합니다: {name}")
+        
+        self.schema = schema
+        self.fields = list(properties)
+        
+        # 리터럴/문자열 세그먼트 목록 (문자열 뒤 리터럴은 항상 닫는 따옴표로 시작)
+        self.segments: List[Optional[bytes]] = []
+        for idx, name in enumerate(self.fields):
+            opening = "{" if idx == 0 else '", '
+            self.segments.append(f'{opening}{json.dumps(name)}: "'.encode("utf-8"))
+            self.segments.append(None)
+        self.segments.append(b'"}\n')
+        
+        self.start: State = (0, 0, 0)
+        last = len(self.segments) - 1
+        # 객체를 닫은 직후(줄바꿈 전)와 줄 시작에서 종료 가능
+        self.accepting = {self.start, (last, len(self.segments[last]) - 1, 0)}
+    
+    @property
+    def key(self) -> str:
+        """문법 식별자 (캐시 키)"""
+        return json.dumps(self.schema, sort_keys=True, ensure_ascii=False)
+    
+    def advance(self, state: Optional[State], data: bytes) -> Optional[State]:
+        """바이트열을 읽은 뒤의 상태 (허용되지 않으면 None)"""
+        for byte in data:
+            if state is None:
+                return None
+            state = self._step(state, byte)
+        return state
+    
+    def _step(self, state: State, byte: int) -> Optional[State]:
+        segment, position, need = state
+        literal = self.segments[segment]
+        
+        if literal is not None:
+            if literal[position] != byte:
+                return None
+            position += 1
+            if position < len(literal):
+                return (segment, position, 0)
+            # 마지막 리터럴을 마치면 다음 줄의 객체 시작으로
+            return ((segment + 1) % len(self.segments), 0, 0)
+        
+        # 문자열 값 내부
+        if need:
+            return (segment, 1, need - 1) if 0x80 <= byte <= 0xBF else None
+        if byte == 0x22:
+            # 빈 문자열은 허용하지 않음, 닫는 따옴표는 다음 리터럴의 첫 바이트
+            return (segment + 1, 1, 0) if position else None
+        if byte < 0x20 or byte == 0x5C:
+            return None
+        if byte < 0x80:
+            return (segment, 1, 0)
+        if 0xC2 <= byte <= 0xDF:
+            return (segment, 1, 1)
+        if 0xE0 <= byte <= 0xEF:
+            return (segment, 1, 2)
+        if 0xF0 <= byte <= 0xF4:
+            return (segment, 1, 3)
+        return None
+    
+    def expected_byte(self, state: State) -> Optional[int]:
+        """리터럴 상태에서 다음에 와야 할 바이트 (문자열 상태면 None)"""
+        literal = self.segments[state[0]]
+        return literal[state[1]] if literal is not None else None
+
+
+def _byte_level_decoder() -> Dict[str, int]:
+    """바이트 수준 BPE(GPT-2 계열)의 문자 → 바이트 매핑"""
+    printable = (
+        list(range(ord("!"), ord("~") + 1))
+        + list(range(ord("¡"), ord("¬") + 1))
+        + list(range(ord("®"), ord("ÿ") + 1))
+    )
+    chars = list(printable)
+    extra = 0
+    for byte in range(256):
+        if byte not in printable:
+            printable.append(byte)
+            chars.append(256 + extra)
+            extra += 1
+    return {chr(char): byte for byte, char in zip(printable, chars)}
+
+
+def token_bytes_table(tokenizer) -> List[Optional[bytes]]:
+    """토큰 ID별 원시 바이트열 (특수 토큰은 None)
+    
+    바이트 수준 BPE(GPT-2 계열)는 토큰 문자열을 바이트로 되돌리고,
+    SentencePiece 계열은 "▁"를 공백으로, "<0xXX>"를 해당 바이트로 바꿉니다.
+    """
+    byte_decoder = _byte_level_decoder()
+    special_ids = set(tokenizer.all_special_ids)
+    tokens = tokenizer.convert_ids_to_tokens(list(range(len(tokenizer))))
+    
+    table = []
+    for token_id, token in enumerate(tokens):
+        if token is None or token_id in special_ids:
+            table.append(None)
+            continue
+        match = _BYTE_TOKEN.match(token)
+        if match:
+            table.append(bytes([int(match.group(1), 16)]))
+        elif all(char in byte_decoder for char in token):
+            table.append(bytes(byte_decoder[char] for char in token))
+        else:
+            table.append(token.replace("▁", " ").encode("utf-8"))
+    return table
+
+
+class TokenGrammar:
+    """토크나이저에 묶인 문법 - 상태별 허용 토큰 마스크를 캐시
+    
+    상태마다 전체 어휘를 한 번씩만 검사하고 결과 마스크를 재사용합니다.
+    리터럴 상태는 첫 바이트가 맞는 토큰만 검사하므로 빠르고, 문자열 상태는
+    UTF-8 연속 바이트 수에 따라 몇 가지뿐이라 캐시가 금방 채워집니다.
+    """
+    
+    def __init__(self, grammar: JsonLinesGrammar, tokenizer, vocab_bytes: List[Optional[bytes]]):
+        self.grammar = grammar
+        self.vocab_bytes = vocab_bytes
+        self.eos_token_id = tokenizer.eos_token_id
+        self._masks: Dict[State, torch.Tensor] = {}
+        self._lock = threading.Lock()
+        
+        self._by_first_byte: Dict[int, List[int]] = {}
+        for token_id, data in enumerate(vocab_bytes):
+            if data:
+                self._by_first_byte.setdefault(data[0], []).append(token_id)
+    
+    def mask(self, state: State, vocab_size: int) -> torch.Tensor:
+        """상태에서 허용되는 토큰 마스크 (True = 허용)"""
+        mask = self._masks.get(state)
+        if mask is None:
+            mask = self._build_mask(state)
+            with self._lock:
+                self._masks[state] = mask
+        if mask.shape[0] < vocab_size:
+            # 모델 출력 차원이 토크나이저 어휘보다 크면 나머지는 금지
+            mask = torch.cat([mask, torch.zeros(vocab_size - mask.shape[0], dtype=torch.bool)])
+        return mask[:vocab_size]
+    
+    def _build_mask(self, state: State) -> torch.Tensor:
+        expected = self.grammar.expected_byte(state)
+        candidates = (
+            self._by_first_byte.get(expected, [])
+            if expected is not None
+            else range(len(self.vocab_bytes))
+        )
+        allowed = [
+            token_id
+            for token_id in candidates
+            if self.vocab_bytes[token_id]
+            and self.grammar.advance(state, self.vocab_bytes[token_id]) is not None
+        ]
+        if state in self.grammar.accepting and self.eos_token_id is not None:
+            allowed.append(self.eos_token_id)
+        mask = torch.zeros(len(self.vocab_bytes), dtype=torch.bool)
+        mask[torch.tensor(allowed, dtype=torch.long)] = True
+        return mask
+    
+    def advance(self, state: Optional[State], token_id: int) -> Optional[State]:
+        """토큰 하나를 읽은 뒤의 상태"""
+        if state is None or token_id >= len(self.vocab_bytes):
+            return None
+        data = self.vocab_bytes[token_id]
+        return self.grammar.advance(state, data) if data else None
+    
+    @property
+    def cached_states(self) -> int:
+        return len(self._masks)
+
+
+class JsonLinesLogitsProcessor(LogitsProcessor):
+    """문법에 맞지 않는 토큰의 점수를 -inf로 만드는 LogitsProcessor
+    
+    배치의 행마다 다른 문법을 지정할 수 있고, 지정하지 않은 행은 그대로
+    둡니다. 행이 EOS를 생성하면 이후 스텝(패딩)은 건드리지 않습니다.
+    """
+    
+    def __init__(self, grammars: Dict[int, TokenGrammar], prompt_length: int):
+        """
+        Args:
+            grammars: 배치 행 번호 → TokenGrammar
+            prompt_length: 프롬프트 토큰 수 (왼쪽 패딩 포함)
+        """
+        self.grammars = grammars
+        self.prompt_length = prompt_length
+        self.states: Dict[int, Optional[State]] = {
+            row: grammar.grammar.start for row, grammar in grammars.items()
+        }
+        self.done = set()
+        self.violations = 0
+    
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        generated = input_ids.shape[-1] - self.prompt_length
+        for row, grammar in self.grammars.items():
+            if row in self.done:
+                continue
+            if generated > 0:
+                token_id = int(input_ids[row, -1])
+                if token_id == grammar.eos_token_id:
+                    self.done.add(row)
+                    continue
+                self.states[row] = grammar.advance(self.states[row], token_id)
+            
+            state = self.states[row]
+            if state is None:
+                # 문법을 벗어난 경우 (예: 다른 처리기가 토큰을 바꿈) 제약을 풀고 계속
+                self.violations += 1
+                self.done.add(row)
+                continue
+            allowed = grammar.mask(state, scores.shape[-1]).to(scores.device)
+            if not allowed.any():
+                # 어휘로 이어갈 수 없는 상태 (바이트 토큰이 없는 토크나이저 등)
+                self.violations += 1
+                self.done.add(row)
+                continue
+            scores[row] = scores[row].masked_fill(~allowed, float("-inf"))
+        return scores
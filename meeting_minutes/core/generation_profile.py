@@ -0,0 +1,160 @@
+"""생성 프로필 모듈 - 노드별 토큰 예산과 조기 종료 조건"""
+from typing import Optional, Sequence
+
+
+# 종료 사유
+STOP_EOS = "eos"
+STOP_LENGTH = "length"
+STOP_SEQUENCE = "stop_sequence"
+STOP_REPETITION = "repetition"
+
+
+class GenerationProfile:
+    """노드별 생성 설정
+    
+    모든 노드가 같은 max_length(2048)로 생성하면 한 줄이면 충분한 출력도
+    작은 모델이 계속 이어 쓰는 경우가 많습니다. 프로필은 입력 길이에 비례한
+    토큰 예산, 중단 문자열, 반복 감지 조건을 노드마다 정의합니다.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        max_new_tokens: int,
+        min_new_tokens: int = 32,
+        input_ratio: Optional[float] = None,
+        stop_sequences: Sequence[str] = (),
+        repetition_max_period: int = 32,
+        repetition_min_repeats: int = 3,
+        repetition_min_span: int = 16,
+        json_schema: Optional[dict] = None,
+        speculative: bool = False
+    ):
+        """프로필 초기화
+        
+        Args:
+            name: 프로필 이름 (통계 보고용, 보통 노드/필드 이름)
+            max_new_tokens: 토큰 예산 상한
+            min_new_tokens: 토큰 예산 하한 (input_ratio 사용 시)
+            input_ratio: 입력 토큰 수 대비 예산 비율 (None이면 항상 max_new_tokens)
+            stop_sequences: 출력에 나타나면 생성을 멈출 문자열 (예: "\\n\\n")
+            repetition_max_period: 반복으로 볼 최대 토큰 주기 (0이면 반복 감지 끔)
+            repetition_min_repeats: 같은 구간이 연속으로 몇 번 나오면 반복으로 볼지
+            repetition_min_span: 반복 구간 전체의 최소 토큰 수 (짧은 주기 오탐 방지)
+            json_schema: 한 줄에 하나씩 출력할 레코드의 JSON 스키마. 지정하면
+                제약 디코딩이 켜져 있을 때 스키마에 맞는 토큰만 생성합니다.
+            speculative: 초안 모델이 설정되어 있으면 추측 디코딩 사용 (긴 출력에 유리)
+        """
+        self.name = name
+        self.max_new_tokens = max_new_tokens
+        self.min_new_tokens = min_new_tokens
+        self.input_ratio = input_ratio
+        self.stop_sequences = tuple(stop_sequences)
+        self.repetition_max_period = repetition_max_period
+        self.repetition_min_repeats = repetition_min_repeats
+        self.repetition_min_span = repetition_min_span
+        self.json_schema = json_schema
+        self.speculative = speculative
+    
+    def budget(self, input_tokens: int, limit: Optional[int] = None) -> int:
+        """입력 길이에 맞춘 토큰 예산
+        
+        Args:
+            input_tokens: 프롬프트(회의 내용 포함) 토큰 수
+            limit: 전체 상한 (보통 llm.max_length)
+        
+        Returns:
+            int: 최대 생성 토큰 수
+        """
+        if self.input_ratio is None:
+            budget = self.max_new_tokens
+        else:
+            budget = int(input_tokens * self.input_ratio)
+            budget = max(self.min_new_tokens, min(self.max_new_tokens, budget))
+        if limit:
+            budget = min(budget, limit)
+        return budget
+    
+    def cache_params(self) -> dict:
+        """응답 캐시 키에 포함할 설정 (같은 예산이라도 중단 조건이 다르면 결과가 다름)"""
+        return {
+            "stop_sequences": list(self.stop_sequences),
+            "repetition": [
+                self.repetition_max_period,
+                self.repetition_min_repeats,
+                self.repetition_min_span,
+            ],
+        }
+    
+    def stopping_criteria(self, tokenizer, prompt_length: int) -> list:
+        """단일 시퀀스 생성에 사용할 StoppingCriteria 목록 (transformers generate용)"""
+        from .stopping_criteria import RepetitionCriteria, StopSequenceCriteria
+        
+        criteria = []
+        if self.stop_sequences:
+            criteria.append(StopSequenceCriteria(tokenizer, prompt_length, self.stop_sequences))
+        if self.repetition_max_period > 0:
+            criteria.append(RepetitionCriteria(
+                prompt_length,
+                self.repetition_max_period,
+                self.repetition_min_repeats,
+                self.repetition_min_span
+            ))
+        return criteria
+    
+    def __repr__(self) -> str:
+        return f"GenerationProfile(name={self.name!r}, max_new_tokens={self.max_new_tokens})"
+
+
+def find_repetition(
+    tokens: Sequence,
+    max_period: int = 32,
+    min_repeats: int = 3,
+    min_span: int = 16
+) -> Optional[int]:
+    """토큰 끝부분이 주기적으로 반복되는지 확인
+    
+    Args:
+        tokens: 생성된 토큰 (또는 토큰 단위 텍스트 조각) 목록
+        max_period / min_repeats / min_span: RepetitionCriteria와 같음
+    
+    Returns:
+        Optional[int]: 첫 번째 반복만 남기기 위해 잘라낼 개수 (반복이 없으면 None)
+    """
+    for period in range(1, max_period + 1):
+        repeats = max(min_repeats, -(-min_span // period))
+        length = period * repeats
+        if length > len(tokens):
+            continue
+        window = tokens[-length:]
+        if all(window[i] == window[i - period] for i in range(period, length)):
+            return length - period
+    return None
+
+
+def trim_stop_sequences(text: str, stop_sequences: Sequence[str]) -> tuple:
+    """첫 번째 중단 문자열 이후를 잘라냄
+    
+    Returns:
+        tuple: (잘린 텍스트, 중단 문자열이 있었는지 여부)
+    """
+    stripped = text.lstrip()
+    cut = min(
+        (index for index in (stripped.find(stop) for stop in stop_sequences) if index >= 0),
+        default=-1
+    )
+    if cut < 0:
+        return text, False
+    return stripped[:cut], True
+
+
+def format_generation_stats(stats: dict) -> str:
+    """생성 통계 한 줄 요약 (예: "생성 토큰 37/64, 종료: stop_sequence")"""
+    text = (
+        f"생성 토큰 {stats['generated_tokens']}/{stats['budget']}, "
+        f"종료: {stats['stop_reason']}"
+    )
+    speculative = stats.get("speculative")
+    if speculative:
+        text += f", 초안 수락률: {speculative['acceptance_rate']:.0%}"
+    return text
@@ -0,0 +1,253 @@
+"""ONNX Runtime 백엔드 - scripts/export_onnx.py로 내보낸 모델로 CPU 생성"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import torch
+from transformers import AutoTokenizer, StoppingCriteriaList
+
+from ..utils.text_utils import estimate_tokens
+from .backend import LLMBackend, process_rss_bytes, token_callback
+from .response_cache import ResponseCache
+from .generation_profile import (
+    GenerationProfile,
+    STOP_EOS,
+    STOP_LENGTH,
+    STOP_REPETITION,
+    STOP_SEQUENCE,
+    trim_stop_sequences
+)
+from .stopping_criteria import RepetitionCriteria, StopSequenceCriteria
+from .transformers_backend import CallbackStreamer, LightweightLLMConfig
+
+# export_onnx.py가 만드는 파일 이름 (int8은 ORTQuantizer 기본 접미사)
+ONNX_FILE_NAME = "model.onnx"
+ONNX_INT8_FILE_NAME = "model_quantized.onnx"
+
+
+def onnx_model_dir(base_dir, model_name: str) -> Path:
+    """모델 이름별 ONNX 내보내기 디렉토리 (예: models/onnx/exaone-2.4b)"""
+    return Path(base_dir) / model_name.split("/")[-1]
+
+
+class OnnxRuntimeBackend(LLMBackend):
+    """ONNX Runtime 추론 백엔드 (optimum ORTModelForCausalLM)
+    
+    KV 캐시 입력/출력을 가진 ONNX 그래프를 ONNX Runtime CPU 실행 공급자로
+    실행합니다. 그래프 최적화(연산 융합)를 모두 켜고, 연산 내부/연산 간 스레드 수를
+    직접 지정할 수 있습니다. 생성 루프와 중단 조건(생성 프로필, 스트리밍 콜백)은
+    transformers generate를 그대로 사용하므로 출력은 torch 경로와 같아야 합니다
+    (scripts/onnx_parity.py로 확인). int8 그래프는 동적 양자화라 조금 다를 수 있습니다.
+    
+    접두부 KV 캐시, 제약 디코딩, 추측 디코딩, 스케줄러/복제본 풀은 transformers
+    백엔드에서만 적용됩니다.
+    """
+    
+    backend_name = "onnx"
+    
+    def __init__(
+        self,
+        model_name: str = "exaone-2.4b",
+        model_dir: str = "./models/onnx",
+        quantized: bool = False,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 1,
+        max_length: int = 2048,
+        temperature: float = 0.2,
+        deterministic: bool = False,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Args:
+            model_name: 모델 이름 (RECOMMENDED_MODELS 이름 또는 HuggingFace ID)
+            model_dir: ONNX 내보내기 기본 디렉토리 (모델 이름별 하위 디렉토리 사용)
+            quantized: int8 양자화 그래프(model_quantized.onnx) 사용
+            intra_op_threads: 연산 내부 스레드 수 (0이면 물리 코어 수)
+            inter_op_threads: 연산 간 스레드 수 (1이면 순차 실행)
+            max_length: 최대 생성 길이
+            temperature: 생성 온도
+            deterministic: 그리디 디코딩 사용 (같은 입력 → 같은 출력)
+            response_cache: 디스크 응답 캐시 (None이면 사용 안 함)
+        """
+        super().__init__(max_length, temperature, deterministic, response_cache)
+        
+        source_id = LightweightLLMConfig.RECOMMENDED_MODELS.get(model_name, model_name)
+        self.model_name = model_name.split("/")[-1]
+        self.model_dir = onnx_model_dir(model_dir, model_name)
+        self.file_name = ONNX_INT8_FILE_NAME if quantized else ONNX_FILE_NAME
+        self.precision = "int8" if quantized else "fp32"
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = max(1, inter_op_threads)
+        # 응답 캐시 키에 원본 모델과 그래프 종류를 함께 기록
+        self.model_id = f"{source_id}:{self.file_name}"
+        
+        self._model = None
+        self._tokenizer = None
+        self._load_lock = threading.Lock()
+    
+    def load_model(self):
+        """ONNX 그래프와 토크나이저 로드"""
+        with self._load_lock:
+            if self._is_loaded:
+                print(f"✓ 모델이 이미 로드되어 있습니다: {self.model_name}")
+                return
+            
+            try:
+                import onnxruntime as ort
+                from optimum.onnxruntime import ORTModelForCausalLM
+            except ImportError as e:
+                raise ImportError(
+                    "ONNX 백엔드에는 onnxruntime과 optimum이 필요합니다 "
+                    "(pip install \"optimum[onnxruntime]\")"
+                ) from e
+            
+            if not (self.model_dir / self.file_name).exists():
+                raise FileNotFoundError(
+                    f"ONNX 모델이 없습니다: {self.model_dir / self.file_name} "
+                    f"(python scripts/export_onnx.py --model {self.model_name}"
+                    f"{' --int8' if self.precision == 'int8' else ''}로 먼저 내보내세요)"
+                )
+            
+            print(f"\n[모델 로드] {self.model_dir / self.file_name} (ONNX Runtime)")
+            start = time.perf_counter()
+            
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = self.intra_op_threads
+            options.inter_op_num_threads = self.inter_op_threads
+            options.execution_mode = (
+                ort.ExecutionMode.ORT_PARALLEL if self.inter_op_threads > 1
+                else ort.ExecutionMode.ORT_SEQUENTIAL
+            )
+            
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_dir, trust_remote_code=True)
+            self._model = ORTModelForCausalLM.from_pretrained(
+                self.model_dir,
+                file_name=self.file_name,
+                session_options=options,
+                provider="CPUExecutionProvider",
+                use_cache=True,
+                use_io_binding=False,
+                trust_remote_code=True
+            )
+            
+            self._is_loaded = True
+            print(
+                f"✓ 모델 로드 완료 ({time.perf_counter() - start:.1f}초, {self.precision}, "
+                f"스레드 {self.intra_op_threads or '자동'}/{self.inter_op_threads})"
+            )
+    
+    def generate_with_stats(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> tuple:
+        """텍스트 생성 + 생성 통계 (LLMBackend.generate_with_stats 참고)"""
+        callback = token_callback.get()
+        
+        input_tokens = estimate_tokens(prompt)
+        budget = self._budget(profile, input_tokens)
+        
+        cache_key = self._response_cache_key(prompt, system_prompt, budget, profile)
+        cached = self._cached_generation(cache_key, profile, input_tokens, budget, callback)
+        if cached is not None:
+            return cached
+        
+        if self._dispatcher is not None:
+            return self._dispatch(
+                prompt, system_prompt, prefix, profile, input_tokens, budget, cache_key, callback
+            )
+        
+        if not self._is_loaded:
+            self.load_model()
+        
+        input_ids = self._tokenizer.apply_chat_template(
+            self._build_messages(prompt, system_prompt),
+            tokenize=True,
+            add_generation_prompt=True,
+            return_tensors="pt",
+            return_dict=False
+        )
+        
+        prompt_length = input_ids.shape[-1]
+        generate_kwargs = {}
+        if callback is not None:
+            generate_kwargs["streamer"] = CallbackStreamer(self._tokenizer, callback)
+        criteria = profile.stopping_criteria(self._tokenizer, prompt_length) if profile else []
+        if criteria:
+            generate_kwargs["stopping_criteria"] = StoppingCriteriaList(criteria)
+        
+        with torch.no_grad():
+            output = self._model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                max_new_tokens=budget,
+                **self._sampling_kwargs(),
+                eos_token_id=self._tokenizer.eos_token_id,
+                pad_token_id=self._tokenizer.pad_token_id or self._tokenizer.eos_token_id,
+                use_cache=True,
+                **generate_kwargs
+            )
+        
+        generated = output[0][prompt_length:]
+        generated_tokens = len(generated)
+        stop_reason = STOP_LENGTH if generated_tokens >= budget else STOP_EOS
+        for criterion in criteria:
+            if isinstance(criterion, RepetitionCriteria) and criterion.triggered:
+                # 반복 구간은 첫 번째만 남김
+                generated = generated[:generated_tokens - criterion.trim_tokens]
+                stop_reason = STOP_REPETITION
+            elif isinstance(criterion, StopSequenceCriteria) and criterion.triggered:
+                stop_reason = STOP_SEQUENCE
+        
+        generated_text = self._tokenizer.decode(generated, skip_special_tokens=True).strip()
+        if profile is not None and profile.stop_sequences:
+            generated_text = trim_stop_sequences(generated_text, profile.stop_sequences)[0].strip()
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, generated_text)
+        
+        return generated_text, self._record_generation(
+            profile, input_tokens, budget, generated_tokens, stop_reason
+        )
+    
+    def count_tokens(self, text: str) -> int:
+        """텍스트 토큰 수 계산
+        
+        토크나이저가 로드되어 있으면 실제 토큰 수를, 아니면 추정치를 반환합니다.
+        """
+        if self._tokenizer is not None:
+            return len(self._tokenizer(text, add_special_tokens=False).input_ids)
+        return estimate_tokens(text)
+    
+    def get_model_info(self) -> dict:
+        """모델 정보"""
+        onnx_path = self.model_dir / self.file_name
+        # 2GB를 넘는 그래프는 가중치가 외부 데이터 파일로 저장됨
+        weights = [onnx_path, *self.model_dir.glob(f"{self.file_name}_data")]
+        return {
+            "backend": self.backend_name,
+            "model_id": self.model_id,
+            "model_name": self.model_name,
+            "model_dir": str(self.model_dir),
+            "device": "CPU",
+            "is_loaded": self._is_loaded,
+            "max_length": self.max_length,
+            "temperature": self.temperature,
+            "precision": self.precision,
+            "intra_op_threads": self.intra_op_threads or None,
+            "inter_op_threads": self.inter_op_threads,
+            "weights_memory_bytes": (
+                sum(os.path.getsize(path) for path in weights if path.exists())
+                if onnx_path.exists() else None
+            ),
+            "process_rss_bytes": process_rss_bytes(),
+            "deterministic": self.deterministic,
+            "response_cache": self.response_cache.stats() if self.response_cache else None,
+            "generation_stats": self.generation_stats_summary(),
+            "dispatcher": self.dispatcher_stats(),
+        }
@@ -0,0 +1,424 @@
+"""OpenAI 호환 HTTP 백엔드 - 별도 추론 서버(vLLM, llama-server 등)에 생성 요청"""
+import asyncio
+import json
+import threading
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from ..utils.text_utils import estimate_tokens
+from .backend import LLMBackend, process_rss_bytes, token_callback
+from .response_cache import ResponseCache
+from .generation_profile import (
+    GenerationProfile,
+    STOP_EOS,
+    STOP_LENGTH,
+    STOP_REPETITION,
+    STOP_SEQUENCE,
+    find_repetition,
+    trim_stop_sequences
+)
+
+# 다시 시도할 HTTP 상태 (과부하, 일시적 서버 오류)
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# OpenAI API가 한 요청에 받는 최대 중단 문자열 수
+MAX_STOP_SEQUENCES = 4
+
+
+class OpenAIBackendError(RuntimeError):
+    """추론 서버 요청 실패 (재시도 후에도 실패하거나 응답 형식이 잘못됨)"""
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """OpenAI 호환 /v1/chat/completions 추론 서버 백엔드
+    
+    모델은 별도 추론 서버에서 실행하고, API 프로세스는 HTTP 요청만 보내므로
+    가볍게 유지됩니다 (추론 서버는 따로 확장).
+    
+    전용 이벤트 루프 스레드 하나가 httpx.AsyncClient 연결 풀(keep-alive)을
+    가지고, 노드 스레드의 generate 호출은 이 루프에서 실행됩니다. 동시 요청 수는
+    세마포어로 max_concurrency개로 제한하며, 연결 오류나 429/5xx 응답은 지수
+    백오프로 다시 시도합니다 (이미 토큰을 받기 시작한 스트림은 재시도하지 않음).
+    응답은 SSE 스트림으로 받아 콜백에 전달하고, 반복이 감지되면 스트림을 닫아
+    서버 생성을 멈춥니다.
+    """
+    
+    backend_name = "openai"
+    
+    # 동시 요청이 서버에서 배치 처리되므로 generate_batch도 동시에 제출
+    concurrent_requests = True
+    
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8080/v1",
+        model: str = "",
+        api_key: str = "",
+        max_concurrency: int = 8,
+        timeout: float = 120.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_length: int = 2048,
+        temperature: float = 0.2,
+        deterministic: bool = False,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Args:
+            base_url: 추론 서버 주소 (/v1까지, 예: http://127.0.0.1:8080/v1)
+            model: 요청에 보낼 모델 이름 (비우면 서버 /models의 첫 번째 모델)
+            api_key: Bearer 인증 키 (비우면 보내지 않음)
+            max_concurrency: 동시 요청 수 상한 (연결 풀 크기와 같음)
+            timeout: 요청 타임아웃 (초, 스트림은 조각 사이 대기 시간)
+            max_retries: 실패 시 재시도 횟수
+            retry_backoff: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+            max_length: 최대 생성 길이
+            temperature: 생성 온도
+            deterministic: 그리디 디코딩 사용 (같은 입력 → 같은 출력)
+            response_cache: 디스크 응답 캐시 (None이면 사용 안 함)
+        """
+        super().__init__(max_length, temperature, deterministic, response_cache)
+        
+        self.base_url = base_url.rstrip("/")
+        self.model_id = model
+        self.model_name = model
+        self.api_key = api_key
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._start_lock = threading.Lock()
+        
+        # 요청 통계
+        self.request_stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "total_seconds": 0.0,
+        }
+    
+    # ========== 이벤트 루프 / 연결 풀 ==========
+    
+    def _ensure_client(self):
+        """이벤트 루프 스레드와 연결 풀 시작 (처음 한 번)"""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="openai-backend-loop", daemon=True
+            ).start()
+            
+            async def create():
+                headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
+                self._client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    headers=headers,
+                    timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 10.0)),
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    )
+                )
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            asyncio.run_coroutine_threadsafe(create(), loop).result()
+            self._loop = loop
+    
+    def _run(self, coroutine):
+        """이벤트 루프에서 코루틴을 실행하고 결과를 기다림 (노드 스레드에서 호출)"""
+        self._ensure_client()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    def close(self):
+        """연결 풀과 이벤트 루프 종료"""
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+            if loop is None:
+                return
+            client, self._client = self._client, None
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self._is_loaded = False
+    
+    # ========== LLMBackend 구현 ==========
+    
+    def load_model(self):
+        """추론 서버 연결 확인 (모델 이름이 없으면 서버의 첫 번째 모델 사용)
+        
+        /models를 지원하지 않는 서버(404)는 모델 이름이 지정되어 있으면 그대로 사용합니다.
+        """
+        if self._is_loaded:
+            return
+        
+        print(f"\n[추론 서버 연결] {self.base_url}")
+        response = self._run(self._request("GET", "/models"))
+        if response is not None:
+            models = [model.get("id") for model in response.get("data", [])]
+            if not self.model_id:
+                if not models:
+                    raise OpenAIBackendError(f"추론 서버에 모델이 없습니다: {self.base_url}")
+                self.model_id = models[0]
+            elif models and self.model_id not in models:
+                print(f"⚠ 서버 모델 목록에 없는 모델입니다: {self.model_id} (서버: {', '.join(models)})")
+        elif not self.model_id:
+            raise OpenAIBackendError("서버가 /models를 지원하지 않으면 모델 이름(OPENAI_MODEL)이 필요합니다")
+        
+        self.model_name = self.model_name or self.model_id
+        self._is_loaded = True
+        print(f"✓ 추론 서버 연결 완료 (모델: {self.model_id}, 동시 요청 {self.max_concurrency})")
+    
+    def generate_with_stats(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> tuple:
+        """텍스트 생성 + 생성 통계 (LLMBackend.generate_with_stats 참고)
+        
+        prefix는 서버의 프롬프트 캐시(vLLM prefix caching 등)가 처리하므로 따로 보내지 않습니다.
+        """
+        callback = token_callback.get()
+        
+        input_tokens = estimate_tokens(prompt)
+        budget = self._budget(profile, input_tokens)
+        
+        # 응답 캐시 조회 (서버 연결 전에 확인, 모델 이름을 서버에서 받아야 할 때만 먼저 연결)
+        if not self.model_id:
+            self.load_model()
+        cache_key = self._response_cache_key(prompt, system_prompt, budget, profile)
+        cached = self._cached_generation(cache_key, profile, input_tokens, budget, callback)
+        if cached is not None:
+            return cached
+        
+        if self._dispatcher is not None:
+            return self._dispatch(
+                prompt, system_prompt, prefix, profile, input_tokens, budget, cache_key, callback
+            )
+        
+        if not self._is_loaded:
+            self.load_model()
+        
+        text, generated_tokens, stop_reason = self._run(
+            self._complete(self._build_messages(prompt, system_prompt), budget, profile, callback)
+        )
+        
+        generated_tokens = min(generated_tokens or estimate_tokens(text), budget)
+        generated_text = text.strip()
+        if profile is not None and profile.stop_sequences:
+            generated_text, stopped = trim_stop_sequences(generated_text, profile.stop_sequences)
+            generated_text = generated_text.strip()
+            if stopped:
+                stop_reason = STOP_SEQUENCE
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, generated_text)
+        
+        return generated_text, self._record_generation(
+            profile, input_tokens, budget, generated_tokens, stop_reason
+        )
+    
+    def count_tokens(self, text: str) -> int:
+        """텍스트 토큰 수 (서버 토크나이저를 쓰지 않으므로 추정치)"""
+        return estimate_tokens(text)
+    
+    def get_model_info(self) -> dict:
+        """모델 정보"""
+        stats = dict(self.request_stats)
+        stats["avg_seconds"] = (
+            round(stats["total_seconds"] / stats["requests"], 3) if stats["requests"] else 0.0
+        )
+        stats["total_seconds"] = round(stats["total_seconds"], 3)
+        return {
+            "backend": self.backend_name,
+            "model_id": self.model_id,
+            "model_name": self.model_name,
+            "base_url": self.base_url,
+            "device": "remote",
+            "is_loaded": self._is_loaded,
+            "max_length": self.max_length,
+            "temperature": self.temperature,
+            "precision": None,
+            "max_concurrency": self.max_concurrency,
+            "requests": stats,
+            "process_rss_bytes": process_rss_bytes(),
+            "deterministic": self.deterministic,
+            "response_cache": self.response_cache.stats() if self.response_cache else None,
+            "generation_stats": self.generation_stats_summary(),
+            "dispatcher": self.dispatcher_stats(),
+        }
+    
+    # ========== HTTP 요청 (이벤트 루프에서 실행) ==========
+    
+    async def _request(self, method: str, path: str) -> Optional[dict]:
+        """JSON 요청 (재시도 포함, 404면 None)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.request(method, path)
+                if response.status_code == 404:
+                    return None
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+                error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            except httpx.HTTPStatusError as e:
+                raise OpenAIBackendError(f"추론 서버 요청 실패: {e}") from e
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+        raise OpenAIBackendError(f"추론 서버에 연결할 수 없습니다 ({self.base_url}): {error}")
+    
+    async def _complete(
+        self,
+        messages: list,
+        budget: int,
+        profile: Optional[GenerationProfile],
+        callback: Optional[Callable[[str], None]]
+    ) -> tuple:
+        """채팅 완성 요청 (동시 요청 수 제한, 재시도)
+        
+        Returns:
+            tuple: (생성 텍스트, 서버가 보고한 생성 토큰 수 또는 None, 종료 사유)
+        """
+        payload = {
+            "model": self.model_id,
+            "messages": messages,
+            "max_tokens": budget,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            **self._openai_sampling_kwargs(),
+        }
+        if profile is not None and profile.stop_sequences:
+            payload["stop"] = list(profile.stop_sequences[:MAX_STOP_SEQUENCES])
+        
+        async with self._semaphore:
+            stats = self.request_stats
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            start = time.perf_counter()
+            try:
+                for attempt in range(self.max_retries + 1):
+                    pieces = []
+                    try:
+                        return await self._stream_completion(payload, profile, callback, pieces)
+                    except (httpx.TransportError, _RetryableStatus) as e:
+                        # 이미 콜백으로 보낸 조각이 있으면 다시 생성할 수 없음
+                        if pieces or attempt >= self.max_retries:
+                            stats["failures"] += 1
+                            raise OpenAIBackendError(f"추론 서버 생성 실패: {e}") from e
+                        stats["retries"] += 1
+                        delay = self.retry_backoff * 2 ** attempt
+                        if getattr(e, "retry_after", None) is not None:
+                            delay = min(e.retry_after, self.timeout)
+                        await asyncio.sleep(delay)
+                    except OpenAIBackendError:
+                        stats["failures"] += 1
+                        raise
+            finally:
+                stats["in_flight"] -= 1
+                stats["requests"] += 1
+                stats["total_seconds"] += time.perf_counter() - start
+    
+    async def _stream_completion(
+        self,
+        payload: dict,
+        profile: Optional[GenerationProfile],
+        callback: Optional[Callable[[str], None]],
+        pieces: list
+    ) -> tuple:
+        """한 번의 스트리밍 요청 (SSE 응답, 스트리밍을 지원하지 않는 서버의 JSON 응답도 처리)"""
+        repetition = profile is not None and profile.repetition_max_period > 0
+        generated_tokens = None
+        stop_reason = STOP_EOS
+        
+        async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+            if response.status_code in RETRY_STATUS_CODES:
+                raise _RetryableStatus(response)
+            if response.status_code >= 400:
+                body = (await response.aread()).decode("utf-8", "replace")[:200]
+                raise OpenAIBackendError(f"추론 서버 오류 HTTP {response.status_code}: {body}")
+            
+            if response.headers.get("content-type", "").startswith("application/json"):
+                data = json.loads(await response.aread())
+                choice = data["choices"][0]
+                text = choice["message"].get("content") or ""
+                if callback is not None and text:
+                    callback(text)
+                if choice.get("finish_reason") == "length":
+                    stop_reason = STOP_LENGTH
+                usage = data.get("usage") or {}
+                return text, usage.get("completion_tokens"), stop_reason
+            
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    # 끝까지 읽어야 연결이 keep-alive 풀로 돌아감
+                    continue
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError as e:
+                    raise OpenAIBackendError(f"잘못된 스트림 응답: {data[:100]}") from e
+                
+                if chunk.get("usage"):
+                    generated_tokens = chunk["usage"].get("completion_tokens")
+                if not chunk.get("choices"):
+                    continue
+                choice = chunk["choices"][0]
+                piece = (choice.get("delta") or {}).get("content") or ""
+                if piece:
+                    pieces.append(piece)
+                    if callback is not None:
+                        callback(piece)
+                    if repetition:
+                        trim = find_repetition(
+                            pieces,
+                            profile.repetition_max_period,
+                            profile.repetition_min_repeats,
+                            profile.repetition_min_span
+                        )
+                        if trim is not None:
+                            # 반복 구간은 첫 번째만 남기고 스트림을 닫아 서버 생성을 멈춤
+                            del pieces[len(pieces) - trim:]
+                            return "".join(pieces), None, STOP_REPETITION
+                
+                finish_reason = choice.get("finish_reason")
+                if finish_reason == "length":
+                    stop_reason = STOP_LENGTH
+                elif finish_reason == "stop" and choice.get("stop_reason") in (
+                    profile.stop_sequences if profile is not None else ()
+                ):
+                    # vLLM은 일치한 중단 문자열을 stop_reason으로 알려줌
+                    stop_reason = STOP_SEQUENCE
+        
+        return "".join(pieces), generated_tokens, stop_reason
+    
+    def _openai_sampling_kwargs(self) -> dict:
+        """OpenAI API 샘플링 파라미터 (온도 0이면 그리디 디코딩)"""
+        if self.deterministic:
+            return {"temperature": 0.0}
+        return {"temperature": self.temperature, "top_p": 0.9}
+
+
+class _RetryableStatus(Exception):
+    """다시 시도할 HTTP 상태 응답 (Retry-After 헤더가 있으면 그만큼 대기)"""
+    
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        try:
+            self.retry_after = float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            self.retry_after = None
@@ -5,8 +5,19 @@ class PromptTemplates:
     """회의록 생성을 위한 프롬프트 템플릿 모음
     
     각 노드에서 사용할 프롬프트를 정적 메서드로 제공합니다.
+    
+    추출/요약 프롬프트는 모두 동일한 회의 내용 접두부로 시작하므로
+    LLM이 접두부의 KV 캐시를 노드 간에 재사용할 수 있습니다.
     """
     
+    @staticmethod
+    def get_transcript_prefix() -> str:
+        """추출/요약 프롬프트 공통 접두부 (회의 내용)"""
+        return """회의 내용:
+{text}
+
+"""
+    
     @staticmethod
     def get_preprocessing_prompt() -> str:
         """전처리 프롬프트"""
@@ -26,10 +37,7 @@ class PromptTemplates:
     @staticmethod
     def get_participant_extraction_prompt() -> str:
         """참석자 추출 프롬프트"""
-        return """다음 회의 내용에서 참석자 이름을 추출하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용에서 참석자 이름을 추출하세요.
 
 지침:
 - 명확하게 언급된 사람의 이름만 추출
@@ -42,10 +50,7 @@ class PromptTemplates:
     @staticmethod
     def get_summary_prompt() -> str:
         """요약 프롬프트"""
-        return """다음 회의 내용을 간결하게 요약하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용을 간결하게 요약하세요.
 
 요구사항:
 - 주요 논의 사항 중심으로 요약
@@ -58,10 +63,7 @@ class PromptTemplates:
     @staticmethod
     def get_agenda_extraction_prompt() -> str:
         """안건 추출 프롬프트"""
-        return """다음 회의 내용에서 논의된 안건 항목들을 추출하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용에서 논의된 안건 항목들을 추출하세요.
 
 형식:
 각 안건을 한 줄씩, 번호나 기호 없이 나열하세요.
@@ -76,10 +78,7 @@ class PromptTemplates:
     @staticmethod
     def get_discussion_extraction_prompt() -> str:
         """논의 내용 추출 프롬프트"""
-        return """다음 회의 내용에서 각 안건별 논의 내용을 추출하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용에서 각 안건별 논의 내용을 추출하세요.
 
 출력 형식 (JSON):
 각 논의 내용을 다음 형식의 JSON으로 작성하고, 한 줄에 하나씩 나열하세요.
@@ -94,10 +93,7 @@ class PromptTemplates:
     @staticmethod
     def get_decision_extraction_prompt() -> str:
         """결정 사항 추출 프롬프트"""
-        return """다음 회의 내용에서 합의되거나 결정된 사항을 추출하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용에서 합의되거나 결정된 사항을 추출하세요.
 
 지침:
 - 명확하게 결정된 사항만 추출
@@ -114,10 +110,7 @@ class PromptTemplates:
     @staticmethod
     def get_action_item_extraction_prompt() -> str:
         """액션 아이템 추출 프롬프트"""
-        return """다음 회의 내용에서 액션 아이템(실행 과제)을 추출하세요.
-
-회의 내용:
-{text}
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용에서 액션 아이템(실행 과제)을 추출하세요.
 
 출력 형식 (JSON):
 각 액션 아이템을 다음 형식의 JSON으로 작성하고, 한 줄에 하나씩 나열하세요.
@@ -133,3 +126,43 @@ class PromptTemplates:
 {{"task": "테스트 시나리오 작성", "assignee": "이영희", "deadline": "2025-11-20"}}
 
 액션 아이템:"""
+
+    @staticmethod
+    def get_structured_extraction_prompt() -> str:
+        """단일 패스 구조화 추출 프롬프트 (모든 항목을 하나의 JSON으로)"""
+        return PromptTemplates.get_transcript_prefix() + """위 회의 내용을 분석하여 회의록 항목을 하나의 JSON 객체로 작성하세요.
+
+출력 형식 (JSON):
+{{
+  "summary": "회의 요약 (3~5문장)",
+  "participants": ["참석자 이름"],
+  "agenda_items": ["안건"],
+  "discussions": [{{"topic": "논의 주제", "content": "논의 내용 요약"}}],
+  "decisions": ["결정 사항"],
+  "action_items": [{{"task": "작업 내용", "assignee": "담당자", "deadline": "마감일"}}]
+}}
+
+지침:
+- 참석자는 직급, 부서, 호칭을 제외하고 이름만 작성
+- 결정 사항은 명확하게 결정된 사항만 구체적으로 작성 (날짜, 금액, 담당자 등)
+- 액션 아이템의 마감일이 없으면 "미정", 담당자가 없으면 "미지정"으로 표시
+- 해당 항목이 없으면 빈 배열([])로 작성
+- JSON 객체만 반환하세요. 추가 설명이나 주석은 불필요합니다.
+
+JSON:"""
+
+    @staticmethod
+    def get_summary_reduce_prompt() -> str:
+        """구간 요약 통합 프롬프트 (긴 회의 map-reduce용)"""
+        return """다음은 긴 회의를 구간별로 나누어 요약한 내용입니다. 이를 하나의 회의 요약으로 통합하세요.
+
+구간별 요약:
+{summaries}
+
+요구사항:
+- 구간 간 중복 내용은 한 번만 언급
+- 3~5문장으로 간결하게 작성
+- 핵심 내용과 결론 위주로 정리
+- 객관적이고 사실적인 톤 유지
+
+통합 요약:"""
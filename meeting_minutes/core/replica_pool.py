@@ -0,0 +1,453 @@
+"""모델 복제본 풀 - 멀티 코어 CPU 서버용 멀티 프로세스 추론"""
+import copy
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from .generation_profile import GenerationProfile
+
+logger = logging.getLogger(__name__)
+
+
+# 모델별 파라미터 수 (메모리 추정용, 목록에 없으면 DEFAULT_MODEL_PARAMETERS 사용)
+MODEL_PARAMETERS = {
+    "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct": 2.67e9,
+    "Qwen/Qwen2.5-1.5B-Instruct": 1.54e9,
+    "Qwen/Qwen2.5-3B-Instruct": 3.09e9,
+}
+DEFAULT_MODEL_PARAMETERS = 3e9
+
+# 정밀도별 파라미터당 바이트 (임베딩 등 양자화되지 않는 부분을 감안한 근사치)
+PRECISION_BYTES_PER_PARAM = {"fp32": 4.0, "bf16": 2.0, "int8": 1.5, "int4": 1.0}
+
+
+def available_cores() -> List[int]:
+    """현재 프로세스가 사용할 수 있는 CPU 코어 번호"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def available_memory_bytes() -> Optional[int]:
+    """사용 가능한 메모리 (바이트, 알 수 없으면 None)"""
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def estimate_model_bytes(model_id: str, bytes_per_param: float = 4.0) -> int:
+    """모델 복제본 하나의 메모리 사용량 추정 (기본 float32)"""
+    return int(MODEL_PARAMETERS.get(model_id, DEFAULT_MODEL_PARAMETERS) * bytes_per_param)
+
+
+def suggest_replica_config(
+    model_bytes: int,
+    cpu_count: Optional[int] = None,
+    memory_bytes: Optional[int] = None,
+    min_threads: int = 4,
+    memory_overhead: float = 1.3
+) -> dict:
+    """코어 수와 메모리로 복제본 수/복제본당 스레드 수 제안
+    
+    CPU 디코딩은 메모리 대역폭에 묶이므로 복제본 하나에 너무 많은 스레드를
+    주면 효율이 떨어집니다. 복제본당 최소 min_threads 코어를 보장하는 범위에서
+    메모리(모델 크기 × memory_overhead)가 허용하는 만큼 복제본을 늘립니다.
+    
+    Args:
+        model_bytes: 복제본 하나의 모델 메모리 (바이트)
+        cpu_count: 사용 가능한 코어 수 (None이면 자동 감지)
+        memory_bytes: 사용 가능한 메모리 (None이면 자동 감지)
+        min_threads: 복제본당 최소 스레드 수
+        memory_overhead: 모델 크기 대비 복제본 메모리 배수 (KV 캐시, 활성값 등)
+    
+    Returns:
+        dict: replicas, threads_per_replica, cpu_count, memory_bytes, per_replica_bytes
+    """
+    cpu_count = cpu_count or len(available_cores())
+    if memory_bytes is None:
+        memory_bytes = available_memory_bytes()
+    per_replica_bytes = int(model_bytes * memory_overhead)
+    
+    by_cores = max(1, cpu_count // max(1, min_threads))
+    by_memory = (
+        max(1, memory_bytes // per_replica_bytes)
+        if memory_bytes and per_replica_bytes else by_cores
+    )
+    replicas = int(min(by_cores, by_memory))
+    
+    return {
+        "replicas": replicas,
+        "threads_per_replica": max(1, cpu_count // replicas),
+        "cpu_count": cpu_count,
+        "memory_bytes": memory_bytes,
+        "per_replica_bytes": per_replica_bytes,
+    }
+
+
+def llm_kwargs_from(llm) -> dict:
+    """LightweightLLMConfig 인스턴스와 같은 설정의 생성 인자 (복제본 생성용)"""
+    return {
+        "model_name": llm.model_id,
+        "device": llm.device,
+        "max_length": llm.max_length,
+        "temperature": llm.temperature,
+        "load_in_8bit": llm.load_in_8bit,
+        "prefix_cache_size": llm.prefix_cache.max_entries if llm.prefix_cache else 0,
+        "prefix_cache_max_tokens": llm.prefix_cache.max_tokens if llm.prefix_cache else 0,
+        "deterministic": llm.deterministic,
+        "response_cache": llm.response_cache,
+        "cpu_precision": llm.cpu_precision,
+        "constrained_decoding": llm.constrained_decoding,
+        "draft_model_name": llm.draft_model_name,
+        "draft_num_tokens": llm.draft_num_tokens,
+    }
+
+
+def _replica_worker(
+    index: int,
+    llm_kwargs: dict,
+    cores: List[int],
+    threads: int,
+    requests,
+    responses
+):
+    """복제본 프로세스 본체: 코어 고정 → 모델 로드 → 요청 처리 반복"""
+    import torch
+    
+    from .backend import stream_tokens
+    from .transformers_backend import LightweightLLMConfig
+    
+    if cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(threads)
+    
+    llm = LightweightLLMConfig(**llm_kwargs)
+    try:
+        llm.load_model()
+    except Exception as e:
+        responses.put(("failed", index, str(e)))
+        return
+    responses.put(("ready", index, os.getpid()))
+    
+    while True:
+        item = requests.get()
+        if item is None:
+            break
+        request_id, prompt, system_prompt, max_new_tokens, prefix, profile, stream = item
+        try:
+            # 부모가 정한 토큰 예산으로 고정 (프로필의 중단 조건/제약 디코딩은 그대로 적용)
+            profile = copy.copy(profile) if profile is not None else GenerationProfile(
+                "default", max_new_tokens, repetition_max_period=0
+            )
+            profile.max_new_tokens = max_new_tokens
+            profile.input_ratio = None
+            if stream:
+                with stream_tokens(lambda text: responses.put(("token", request_id, text))):
+                    result = llm.generate_with_stats(prompt, system_prompt, prefix, profile)
+            else:
+                result = llm.generate_with_stats(prompt, system_prompt, prefix, profile)
+            responses.put(("done", request_id, result))
+        except Exception as e:
+            responses.put(("error", request_id, f"{type(e).__name__}: {e}"))
+
+
+class _Replica:
+    """부모 프로세스에서 관리하는 복제본 상태"""
+    
+    def __init__(self, index: int, cores: List[int], process, requests, responses):
+        self.index = index
+        self.cores = cores
+        self.process = process
+        self.requests = requests
+        self.responses = responses
+        self.receiver: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+        self.alive = True
+        self.in_flight = 0
+        self.completed = 0
+        self.last_prefix: Optional[int] = None
+
+
+class ReplicaPool:
+    """모델 복제본 N개를 별도 프로세스로 띄우고 요청을 분배
+    
+    각 복제본은 지정된 코어 집합에 고정(sched_setaffinity)되고 자체 torch
+    스레드 수와 모델 사본을 가집니다. 요청은 처리 중인 요청이 가장 적은
+    복제본으로 보내며, 부하가 같으면 같은 접두부(회의 내용)를 마지막으로
+    처리한 복제본을 우선해 복제본별 접두부 KV 캐시를 재사용합니다.
+    
+    llm_config.attach_dispatcher()로 연결하면 파이프라인 노드의 generate
+    호출이 복제본으로 분배됩니다. 복제본은 기준 모델과 같은 설정(제약 디코딩,
+    초안 모델, 응답 캐시 포함)으로 로드되고 요청의 생성 프로필을 그대로 적용합니다.
+    """
+    
+    # 프로필의 제약 디코딩/중단 조건을 복제본이 생성 중에 적용
+    applies_profiles = True
+    
+    def __init__(
+        self,
+        llm_kwargs: dict,
+        num_replicas: int,
+        threads_per_replica: int,
+        core_sets: Optional[List[List[int]]] = None
+    ):
+        """
+        Args:
+            llm_kwargs: 복제본의 LightweightLLMConfig 생성 인자
+            num_replicas: 복제본 수
+            threads_per_replica: 복제본당 torch 스레드 수
+            core_sets: 복제본별 코어 목록 (None이면 사용 가능한 코어를 순서대로 분할)
+        """
+        self.llm_kwargs = llm_kwargs
+        self.num_replicas = num_replicas
+        self.threads_per_replica = threads_per_replica
+        self.core_sets = core_sets or self._split_cores(num_replicas, threads_per_replica)
+        
+        self._context = mp.get_context("spawn")
+        self._replicas: List[_Replica] = []
+        self._pending: Dict[int, tuple] = {}  # request_id -> (replica, future, callback)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+    
+    @classmethod
+    def from_llm(cls, llm, num_replicas: int = 0, threads_per_replica: int = 0) -> "ReplicaPool":
+        """LightweightLLMConfig와 같은 설정의 복제본 풀 생성
+        
+        Args:
+            llm: 기준 LightweightLLMConfig 인스턴스
+            num_replicas: 복제본 수 (0이면 suggest_replica_config 제안값)
+            threads_per_replica: 복제본당 스레드 수 (0이면 코어를 복제본 수로 나눔)
+        """
+        suggestion = suggest_replica_config(estimate_model_bytes(
+            llm.model_id,
+            PRECISION_BYTES_PER_PARAM.get(llm.cpu_precision, 4.0)
+        ))
+        num_replicas = num_replicas or suggestion["replicas"]
+        threads_per_replica = threads_per_replica or max(1, suggestion["cpu_count"] // num_replicas)
+        return cls(llm_kwargs_from(llm), num_replicas, threads_per_replica)
+    
+    @staticmethod
+    def _split_cores(num_replicas: int, threads_per_replica: int) -> List[List[int]]:
+        """사용 가능한 코어를 복제본별로 연속 분할 (부족하면 순환 배정)"""
+        cores = available_cores()
+        return [
+            [cores[(idx * threads_per_replica + offset) % len(cores)]
+             for offset in range(threads_per_replica)]
+            for idx in range(num_replicas)
+        ]
+    
+    # ========== 수명 주기 ==========
+    
+    def start(self, wait: bool = True, timeout: Optional[float] = 600):
+        """복제본 프로세스 시작
+        
+        Args:
+            wait: 모든 복제본의 모델 로드를 기다릴지 여부
+            timeout: 대기 시간 (초)
+        
+        Raises:
+            RuntimeError: 준비된 복제본이 하나도 없는 경우
+        """
+        if self._replicas:
+            return
+        self._stop_event.clear()
+        
+        # 복제본마다 요청/응답 큐를 따로 두어 한 프로세스가 비정상 종료되어도
+        # 다른 복제본의 통신에 영향이 없도록 함
+        for index, cores in enumerate(self.core_sets):
+            requests = self._context.Queue()
+            responses = self._context.Queue()
+            process = self._context.Process(
+                target=_replica_worker,
+                args=(
+                    index,
+                    self.llm_kwargs,
+                    sorted(set(cores)),
+                    self.threads_per_replica,
+                    requests,
+                    responses
+                ),
+                name=f"llm-replica-{index}",
+                daemon=True
+            )
+            process.start()
+            replica = _Replica(index, cores, process, requests, responses)
+            replica.receiver = threading.Thread(
+                target=self._receive_loop,
+                args=(replica,),
+                name=f"replica-receiver-{index}",
+                daemon=True
+            )
+            replica.receiver.start()
+            self._replicas.append(replica)
+        
+        if wait:
+            for replica in self._replicas:
+                replica.ready.wait(timeout)
+            # 로드 실패/종료한 복제본도 대기가 풀리도록 ready가 설정되므로 alive도 확인
+            ready = sum(1 for replica in self._replicas if replica.alive and replica.ready.is_set())
+            if ready == 0:
+                self.stop()
+                raise RuntimeError("모델 복제본을 하나도 시작하지 못했습니다")
+            logger.info(f"✓ 모델 복제본 {ready}/{len(self._replicas)}개 준비 완료")
+    
+    def stop(self, timeout: float = 10.0):
+        """복제본 프로세스 종료 (처리 중인 요청은 실패 처리)"""
+        self._stop_event.set()
+        for replica in self._replicas:
+            if replica.process.is_alive():
+                replica.requests.put(None)
+        for replica in self._replicas:
+            replica.process.join(timeout)
+            if replica.process.is_alive():
+                replica.process.terminate()
+            if replica.receiver is not None:
+                replica.receiver.join(timeout)
+        
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for _, future, _ in pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("모델 복제본 풀이 종료되었습니다"))
+        self._replicas = []
+    
+    # ========== 요청 처리 ==========
+    
+    def submit(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_new_tokens: Optional[int] = None,
+        prefix: Optional[str] = None,
+        callback: Optional[Callable[[str], None]] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> Future:
+        """가장 한가한 복제본에 생성 요청
+        
+        Args:
+            profile: 생성 프로필 (토큰 예산은 max_new_tokens로 고정)
+        
+        Returns:
+            Future: (생성된 텍스트, 생성 통계 dict)
+        """
+        if not self._replicas:
+            self.start()
+        
+        prefix_hash = hash(prefix) if prefix else None
+        future = Future()
+        with self._lock:
+            candidates = [r for r in self._replicas if r.alive and r.ready.is_set()]
+            if not candidates:
+                candidates = [r for r in self._replicas if r.alive]
+            if not candidates:
+                raise RuntimeError("사용 가능한 모델 복제본이 없습니다")
+            replica = min(
+                candidates,
+                key=lambda r: (r.in_flight, r.last_prefix != prefix_hash, r.completed)
+            )
+            replica.in_flight += 1
+            replica.last_prefix = prefix_hash
+            
+            request_id = next(self._ids)
+            self._pending[request_id] = (replica, future, callback)
+        
+        replica.requests.put((
+            request_id,
+            prompt,
+            system_prompt,
+            max_new_tokens or self.llm_kwargs.get("max_length", 2048),
+            prefix,
+            profile,
+            callback is not None
+        ))
+        return future
+    
+    def stats(self) -> dict:
+        """복제본별 상태"""
+        with self._lock:
+            return {
+                "threads_per_replica": self.threads_per_replica,
+                "replicas": [
+                    {
+                        "index": replica.index,
+                        "pid": replica.process.pid,
+                        "cores": replica.cores,
+                        "ready": replica.ready.is_set(),
+                        "alive": replica.alive,
+                        "in_flight": replica.in_flight,
+                        "completed": replica.completed,
+                    }
+                    for replica in self._replicas
+                ],
+            }
+    
+    def _receive_loop(self, replica: _Replica):
+        """복제본 응답을 받아 Future 완료 (복제본이 죽으면 대기 요청 실패 처리)"""
+        while not self._stop_event.is_set():
+            try:
+                kind, key, payload = replica.responses.get(timeout=1.0)
+            except queue.Empty:
+                if not replica.process.is_alive():
+                    self._mark_dead(replica)
+                    break
+                continue
+            except (EOFError, OSError):
+                self._mark_dead(replica)
+                break
+            
+            if kind == "ready":
+                replica.ready.set()
+                continue
+            if kind == "failed":
+                logger.error(f"모델 복제본 {key} 로드 실패: {payload}")
+                replica.alive = False
+                replica.ready.set()
+                break
+            
+            with self._lock:
+                entry = self._pending.get(key)
+                if entry is not None and kind != "token":
+                    del self._pending[key]
+                    entry[0].in_flight -= 1
+                    entry[0].completed += 1
+            if entry is None:
+                continue
+            
+            _, future, callback = entry
+            if kind == "token":
+                if callback is not None:
+                    callback(payload)
+            elif kind == "done":
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+    
+    def _mark_dead(self, replica: _Replica):
+        """종료된 복제본을 제외하고 해당 복제본의 대기 요청 실패 처리"""
+        with self._lock:
+            replica.alive = False
+            replica.ready.set()
+            failed = []
+            for request_id, (owner, future, _) in list(self._pending.items()):
+                if owner is replica:
+                    failed.append(future)
+                    del self._pending[request_id]
+            replica.in_flight = 0
+        logger.error(f"모델 복제본 {replica.index} 프로세스가 종료되었습니다")
+        for future in failed:
+            if not future.done():
+                future.set_exception(RuntimeError("모델 복제본 프로세스가 종료되었습니다"))
@@ -0,0 +1,177 @@
+"""LLM 응답 캐시 모듈 - SQLite 기반 내용 주소 캐시"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """디스크 기반 LLM 응답 캐시
+    
+    모델 ID, 프롬프트, 시스템 프롬프트, 샘플링 파라미터로 만든 해시를 키로
+    생성 결과를 SQLite에 저장합니다. 같은 회의록을 다시 처리할 때
+    (재시도, 클라이언트 타임아웃, 반복 테스트) 생성 비용 없이 결과를 반환합니다.
+    
+    항목 수(max_entries)와 총 크기(max_bytes)를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거합니다 (LRU).
+    
+    SQLite 연결은 fork를 넘어 사용할 수 없으므로 프로세스마다 처음 사용할 때
+    따로 엽니다 (프리포크 서버의 마스터에서 만든 캐시를 워커가 그대로 사용).
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 5000,
+        max_bytes: int = 200 * 1024 * 1024
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 최대 항목 수
+            max_bytes: 저장된 응답의 최대 총 크기 (바이트)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        # fork 전 부모 프로세스의 연결 (자식에서 사용하거나 닫지 않도록 참조만 유지)
+        self._parent_conns = []
+        
+        conn = sqlite3.connect(str(self.path))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스의 SQLite 연결 (락을 잡은 상태에서 호출, 처음 사용할 때 연결)"""
+        pid = os.getpid()
+        if self._conn_pid != pid:
+            if self._conn is not None:
+                self._parent_conns.append(self._conn)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn_pid = pid
+        return self._conn
+    
+    def __reduce__(self):
+        # 다른 프로세스(모델 복제본)에는 같은 파일을 쓰는 새 캐시로 전달 (연결/락/통계는 복사하지 않음)
+        return (ResponseCache, (self.path, self.max_entries, self.max_bytes))
+    
+    @staticmethod
+    def make_key(
+        model_id: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        params: dict
+    ) -> str:
+        """캐시 키 생성 (입력 전체의 SHA-256)"""
+        payload = json.dumps(
+            {
+                "model_id": model_id,
+                "prompt": prompt,
+                "system_prompt": system_prompt,
+                "params": params,
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            conn.commit()
+            self.hits += 1
+            return row[0]
+    
+    def put(self, key: str, response: str):
+        """응답 저장 후 한도 초과 항목 제거"""
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now)
+            )
+            self._evict(conn)
+            conn.commit()
+    
+    def _evict(self, conn: sqlite3.Connection):
+        """LRU 제거 (락을 잡은 상태에서 호출)"""
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        while count > self.max_entries or total > self.max_bytes:
+            row = conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            count -= 1
+            total -= row[1]
+            self.evictions += 1
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+    
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            count, total = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,491 @@
+"""추론 스케줄러 - 동시 요청의 연속 배칭 (continuous batching)"""
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+import torch
+from transformers import DynamicCache
+
+from .generation_profile import (
+    GenerationProfile,
+    STOP_EOS,
+    STOP_LENGTH,
+    STOP_REPETITION,
+    STOP_SEQUENCE,
+    trim_stop_sequences
+)
+from .stopping_criteria import RepetitionCriteria
+
+
+def _cache_to_layers(cache) -> list:
+    """past_key_values를 레이어별 (key, value) 텐서 목록으로 변환"""
+    if isinstance(cache, (tuple, list)):
+        return [(layer[0], layer[1]) for layer in cache]
+    if hasattr(cache, "layers"):
+        return [(layer.keys, layer.values) for layer in cache.layers]
+    if hasattr(cache, "key_cache"):
+        return list(zip(cache.key_cache, cache.value_cache))
+    return [(layer[0], layer[1]) for layer in cache.to_legacy_cache()]
+
+
+def _layers_to_cache(layers: list):
+    """레이어별 (key, value) 목록으로 DynamicCache 생성"""
+    if hasattr(DynamicCache, "from_legacy_cache"):
+        return DynamicCache.from_legacy_cache(tuple(layers))
+    return DynamicCache(layers)
+
+
+class _Sequence:
+    """스케줄러에서 생성 중인 시퀀스 하나"""
+    
+    def __init__(
+        self,
+        input_ids: torch.Tensor,
+        max_new_tokens: int,
+        future: Future,
+        past_key_values=None,
+        callback: Optional[Callable[[str], None]] = None,
+        profile: Optional[GenerationProfile] = None
+    ):
+        self.input_ids = input_ids
+        self.max_new_tokens = max_new_tokens
+        self.future = future
+        self.past_key_values = past_key_values
+        self.callback = callback
+        self.profile = profile
+        self.generated: List[int] = []
+        self.first_token: Optional[int] = None
+        self.emitted = 0
+        
+        # 프로필의 생성 중 조건 (직접 생성 경로와 같음)
+        self.grammar = None  # TokenGrammar (제약 디코딩 시)
+        self.grammar_state = None
+        self.criteria: list = []  # 생성 토큰만 보는 StoppingCriteria (prompt_length=0)
+        self.stop_reason: Optional[str] = None
+        self.trim_tokens = 0  # 반복 감지 시 결과에서 잘라낼 토큰 수
+
+
+class InferenceScheduler:
+    """여러 파이프라인의 generate 호출을 하나의 동적 배치로 묶어 실행
+    
+    요청은 submit()으로 큐에 들어가고 Future를 돌려받습니다. 전용 스레드가
+    디코딩 루프를 돌며 토큰 단위로 배치를 갱신합니다.
+    
+    - 새 요청은 개별 prefill(가능하면 접두부 KV 캐시 재사용) 후 왼쪽 패딩으로
+      현재 배치의 KV 캐시에 합류합니다.
+    - 매 스텝 배치 전체가 토큰 하나씩 생성합니다 (forward 1회).
+    - 요청의 생성 프로필은 시퀀스별로 적용합니다. 제약 디코딩 문법은 해당 행의
+      logits에만 마스크를 씌우고, 중단 문자열/반복 감지는 매 토큰 확인합니다.
+    - EOS, max_new_tokens 또는 프로필의 중단 조건에 도달한 시퀀스는 즉시 배치에서
+      빠지고 Future가 완료됩니다.
+    
+    CPU에서는 모델 복사본을 늘리지 않고 동시 요청의 전체 처리량을 높이는
+    방법으로, 행렬-벡터 연산이 행렬-행렬 연산으로 바뀌어 스텝당 비용이
+    배치 크기에 비해 완만하게 늘어납니다.
+    """
+    
+    def __init__(self, llm, max_batch_size: int = 8):
+        """
+        Args:
+            llm: LightweightLLMConfig 인스턴스 (모델/토크나이저/샘플링 설정 사용)
+            max_batch_size: 동시에 디코딩할 최대 시퀀스 수
+        """
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        # 프로필의 제약 디코딩/중단 조건을 디코딩 중에 적용 (LLMBackend.attach_dispatcher 참고)
+        self.applies_profiles = True
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._active: List[_Sequence] = []
+        self._layers: Optional[list] = None
+        self._attention_mask: Optional[torch.Tensor] = None
+        self._next_tokens: Optional[torch.Tensor] = None
+        
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        self.steps = 0
+        self.generated_tokens = 0
+        self.completed = 0
+        self._batch_size_sum = 0
+    
+    # ========== 공개 API ==========
+    
+    def start(self):
+        """디코딩 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            name="inference-scheduler",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = 5.0):
+        """디코딩 스레드 종료 (남은 요청은 취소)"""
+        self._stop_event.set()
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        
+        for seq in self._active:
+            seq.future.cancel()
+        self._reset_batch()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+    
+    def submit(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_new_tokens: Optional[int] = None,
+        prefix: Optional[str] = None,
+        callback: Optional[Callable[[str], None]] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> Future:
+        """생성 요청 등록
+        
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
+            max_new_tokens: 최대 생성 토큰 수 (기본값: llm.max_length)
+            prefix: prompt의 공통 접두부 (접두부 KV 캐시 재사용)
+            callback: 생성되는 텍스트 조각을 받을 함수
+            profile: 생성 프로필 (제약 디코딩, 중단 문자열, 반복 감지 적용)
+        
+        Returns:
+            Future: (생성된 텍스트, {"generated_tokens", "stop_reason"})
+        """
+        if self._thread is None:
+            self.start()
+        future = Future()
+        self._queue.put((
+            future,
+            prompt,
+            system_prompt,
+            max_new_tokens or self.llm.max_length,
+            prefix,
+            callback,
+            profile
+        ))
+        return future
+    
+    def stats(self) -> dict:
+        """스케줄러 통계"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "active": len(self._active),
+            "queued": self._queue.qsize(),
+            "steps": self.steps,
+            "generated_tokens": self.generated_tokens,
+            "completed": self.completed,
+            "avg_batch_size": round(self._batch_size_sum / self.steps, 2) if self.steps else 0.0,
+        }
+    
+    # ========== 디코딩 루프 ==========
+    
+    def _loop(self):
+        """요청 수용 → 1토큰 디코딩 → 종료 시퀀스 제거를 반복"""
+        while not self._stop_event.is_set():
+            try:
+                self._admit(block=not self._active)
+                if self._active:
+                    self._step()
+            except Exception as e:
+                # 배치 전체 실패 처리 후 다음 요청부터 다시 시작
+                for seq in self._active:
+                    if not seq.future.done():
+                        seq.future.set_exception(e)
+                self._reset_batch()
+    
+    def _admit(self, block: bool):
+        """대기 중인 요청을 prefill하여 배치에 합류"""
+        while len(self._active) < self.max_batch_size:
+            try:
+                item = self._queue.get(timeout=0.1) if block else self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is None:
+                return
+            block = False
+            
+            future, prompt, system_prompt, max_new_tokens, prefix, callback, profile = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                seq = self._prefill(
+                    prompt, system_prompt, max_new_tokens, prefix, future, callback, profile
+                )
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            if seq is not None:
+                self._join(seq)
+    
+    def _prefill(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_new_tokens: int,
+        prefix: Optional[str],
+        future: Future,
+        callback: Optional[Callable[[str], None]],
+        profile: Optional[GenerationProfile]
+    ) -> Optional[_Sequence]:
+        """프롬프트 하나를 prefill하고 첫 토큰 생성"""
+        llm = self.llm
+        if not llm._is_loaded:
+            llm.load_model()
+        tokenizer = llm._tokenizer
+        model = llm._model
+        
+        messages = llm._build_messages(prompt, system_prompt)
+        try:
+            text = tokenizer.apply_chat_template(
+                messages,
+                tokenize=False,
+                add_generation_prompt=True
+            )
+        except Exception:
+            text = f"{system_prompt or ''}\n\n{prompt}"
+        input_ids = tokenizer(
+            text,
+            return_tensors="pt",
+            add_special_tokens=False
+        ).input_ids.to(model.device)
+        
+        past_key_values = None
+        if prefix and llm.prefix_cache is not None and prompt.startswith(prefix):
+            past_key_values = llm._get_prefix_cache(messages, prefix, input_ids)
+        past_length = past_key_values.get_seq_length() if past_key_values is not None else 0
+        
+        with torch.no_grad():
+            outputs = model(
+                input_ids[:, past_length:],
+                past_key_values=past_key_values,
+                use_cache=True
+            )
+        
+        seq = _Sequence(
+            input_ids,
+            max_new_tokens,
+            future,
+            past_key_values=outputs.past_key_values,
+            callback=callback,
+            profile=profile
+        )
+        if profile is not None:
+            seq.criteria = profile.stopping_criteria(tokenizer, 0)
+            if llm._uses_grammar(profile):
+                seq.grammar = llm._token_grammar(profile.json_schema)
+                seq.grammar_state = seq.grammar.grammar.start
+        logits = outputs.logits[:, -1, :]
+        self._constrain(seq, logits, 0)
+        first_token = int(self._sample(logits)[0])
+        if self._append_token(seq, first_token):
+            self._finish(seq)
+            return None
+        seq.first_token = first_token
+        return seq
+    
+    def _join(self, seq: _Sequence):
+        """prefill된 시퀀스를 현재 배치 KV 캐시에 왼쪽 패딩으로 합류"""
+        layers = _cache_to_layers(seq.past_key_values)
+        seq.past_key_values = None
+        length = layers[0][0].shape[-2]
+        device = layers[0][0].device
+        mask = torch.ones((1, length), dtype=torch.long, device=device)
+        next_token = torch.tensor([seq.first_token], device=device)
+        
+        if not self._active:
+            self._layers = layers
+            self._attention_mask = mask
+            self._next_tokens = next_token
+            self._active.append(seq)
+            return
+        
+        batch_length = self._attention_mask.shape[-1]
+        target = max(batch_length, length)
+        
+        def left_pad(tensor, pad):
+            if pad == 0:
+                return tensor
+            shape = list(tensor.shape)
+            shape[-2] = pad
+            return torch.cat([tensor.new_zeros(shape), tensor], dim=-2)
+        
+        self._layers = [
+            (
+                torch.cat([left_pad(bk, target - batch_length), left_pad(k, target - length)], dim=0),
+                torch.cat([left_pad(bv, target - batch_length), left_pad(v, target - length)], dim=0)
+            )
+            for (bk, bv), (k, v) in zip(self._layers, layers)
+        ]
+        self._attention_mask = torch.cat([
+            torch.nn.functional.pad(self._attention_mask, (target - batch_length, 0)),
+            torch.nn.functional.pad(mask, (target - length, 0))
+        ], dim=0)
+        self._next_tokens = torch.cat([self._next_tokens, next_token])
+        self._active.append(seq)
+    
+    def _step(self):
+        """배치 전체에서 토큰 하나 생성"""
+        model = self.llm._model
+        attention_mask = torch.cat([
+            self._attention_mask,
+            self._attention_mask.new_ones((len(self._active), 1))
+        ], dim=-1)
+        # 왼쪽 패딩이 섞여 있으므로 실제 토큰 수로 위치 계산
+        position_ids = self._attention_mask.sum(dim=-1, keepdim=True)
+        
+        with torch.no_grad():
+            outputs = model(
+                self._next_tokens.unsqueeze(-1),
+                attention_mask=attention_mask,
+                position_ids=position_ids,
+                past_key_values=_layers_to_cache(self._layers),
+                use_cache=True
+            )
+        
+        self._layers = _cache_to_layers(outputs.past_key_values)
+        self._attention_mask = attention_mask
+        logits = outputs.logits[:, -1, :]
+        for row, seq in enumerate(self._active):
+            self._constrain(seq, logits, row)
+        next_tokens = self._sample(logits)
+        
+        self.steps += 1
+        self._batch_size_sum += len(self._active)
+        
+        finished = []
+        for idx, (seq, token) in enumerate(zip(self._active, next_tokens.tolist())):
+            if self._append_token(seq, token):
+                finished.append(idx)
+        self._next_tokens = next_tokens
+        
+        if finished:
+            for idx in finished:
+                self._finish(self._active[idx])
+            self._remove(finished)
+    
+    def _constrain(self, seq: _Sequence, logits: torch.Tensor, row: int):
+        """제약 디코딩 중인 시퀀스의 logits 행에서 문법에 맞지 않는 토큰 제외
+        
+        JsonLinesLogitsProcessor와 같이, 어휘로 이어갈 수 없는 상태가 되면
+        제약을 풀고 계속 생성합니다.
+        """
+        if seq.grammar is None:
+            return
+        allowed = seq.grammar.mask(seq.grammar_state, logits.shape[-1]).to(logits.device)
+        if not allowed.any():
+            seq.grammar = None
+            return
+        logits[row] = logits[row].masked_fill(~allowed, float("-inf"))
+    
+    def _append_token(self, seq: _Sequence, token: int) -> bool:
+        """생성 토큰 추가, 종료 여부 반환 (EOS, 토큰 예산, 프로필 중단 조건)"""
+        tokenizer = self.llm._tokenizer
+        is_eos = token == tokenizer.eos_token_id
+        if is_eos:
+            seq.stop_reason = STOP_EOS
+            return True
+        
+        seq.generated.append(token)
+        self.generated_tokens += 1
+        if seq.grammar is not None:
+            seq.grammar_state = seq.grammar.advance(seq.grammar_state, token)
+            if seq.grammar_state is None:
+                seq.grammar = None
+        if seq.callback is not None:
+            text = tokenizer.decode(seq.generated, skip_special_tokens=True)
+            # 멀티바이트 문자가 덜 디코딩된 경우 다음 토큰까지 대기
+            if not text.endswith("�") and len(text) > seq.emitted:
+                seq.callback(text[seq.emitted:])
+                seq.emitted = len(text)
+        
+        if len(seq.generated) >= seq.max_new_tokens:
+            seq.stop_reason = STOP_LENGTH
+        if seq.criteria:
+            generated = torch.tensor([seq.generated])
+            # 직접 생성 경로와 같이 모든 조건을 확인하고 같은 순서로 종료 사유 결정
+            triggered = [criterion(generated, None) for criterion in seq.criteria]
+            for criterion, stopped in zip(seq.criteria, triggered):
+                if not stopped:
+                    continue
+                if isinstance(criterion, RepetitionCriteria):
+                    # 반복 구간은 첫 번째만 남김
+                    seq.trim_tokens = criterion.trim_tokens
+                    seq.stop_reason = STOP_REPETITION
+                else:
+                    seq.stop_reason = STOP_SEQUENCE
+        return seq.stop_reason is not None
+    
+    def _finish(self, seq: _Sequence):
+        """시퀀스 결과로 Future 완료"""
+        generated_tokens = len(seq.generated)
+        text = self.llm._tokenizer.decode(
+            seq.generated[:generated_tokens - seq.trim_tokens],
+            skip_special_tokens=True
+        ).strip()
+        stop_reason = seq.stop_reason or STOP_EOS
+        if seq.profile is not None and seq.profile.stop_sequences:
+            text, stopped = trim_stop_sequences(text, seq.profile.stop_sequences)
+            if stopped:
+                text = text.strip()
+                stop_reason = STOP_SEQUENCE
+        self.completed += 1
+        if not seq.future.done():
+            seq.future.set_result((
+                text,
+                {"generated_tokens": generated_tokens, "stop_reason": stop_reason}
+            ))
+    
+    def _remove(self, indices: List[int]):
+        """종료된 시퀀스를 배치에서 제거하고 공통 패딩 열 정리"""
+        removed = set(indices)
+        keep = [idx for idx in range(len(self._active)) if idx not in removed]
+        self._active = [self._active[idx] for idx in keep]
+        if not self._active:
+            self._reset_batch()
+            return
+        
+        index = torch.tensor(keep, device=self._attention_mask.device)
+        mask = self._attention_mask.index_select(0, index)
+        # 남은 시퀀스 모두가 패딩인 왼쪽 열은 잘라냄
+        offset = int((mask.sum(dim=0) == 0).long().cumprod(dim=0).sum())
+        self._attention_mask = mask[:, offset:]
+        self._layers = [
+            (k.index_select(0, index)[:, :, offset:], v.index_select(0, index)[:, :, offset:])
+            for k, v in self._layers
+        ]
+        self._next_tokens = self._next_tokens.index_select(0, index)
+    
+    def _reset_batch(self):
+        """배치 상태 초기화"""
+        self._active = []
+        self._layers = None
+        self._attention_mask = None
+        self._next_tokens = None
+    
+    def _sample(self, logits: torch.Tensor) -> torch.Tensor:
+        """llm 샘플링 설정으로 다음 토큰 선택 (배치)"""
+        params = self.llm._sampling_kwargs()
+        if not params.get("do_sample"):
+            return logits.argmax(dim=-1)
+        
+        probs = torch.softmax(logits / max(params.get("temperature", 1.0), 1e-5), dim=-1)
+        top_p = params.get("top_p", 1.0)
+        if top_p < 1.0:
+            sorted_probs, sorted_idx = probs.sort(dim=-1, descending=True)
+            cumulative = sorted_probs.cumsum(dim=-1)
+            sorted_probs[cumulative - sorted_probs > top_p] = 0.0
+            probs = torch.zeros_like(probs).scatter(-1, sorted_idx, sorted_probs)
+        return torch.multinomial(probs, num_samples=1).squeeze(-1)
@@ -5,6 +5,15 @@ import operator
 from datetime import datetime
 
 
+def keep_last(current: str, update: str) -> str:
+    """마지막 값 유지 리듀서
+
+    병렬 노드가 같은 슈퍼스텝에서 current_step을 동시에 갱신해도
+    충돌하지 않도록 나중에 도착한 값으로 덮어씁니다.
+    """
+    return update
+
+
 class MeetingState(TypedDict):
     """회의록 생성을 위한 상태 스키마
     
@@ -22,14 +31,16 @@ class MeetingState(TypedDict):
     
     # 추출된 정보 (Annotated로 리스트 누적 지원)
     participants: List[str]  # 참석자 목록
+    participants_source: str  # 참석자 추출 경로 (rule: 화자 표기 규칙, llm: 모델 추출)
     agenda_items: Annotated[List[str], operator.add]  # 안건 항목들
     discussions: Annotated[List[dict], operator.add]  # 논의 내용 (topic, content)
     decisions: Annotated[List[str], operator.add]  # 결정 사항
     action_items: Annotated[List[dict], operator.add]  # 액션 아이템 (task, assignee, deadline)
     
     # 메타데이터
-    current_step: str  # 현재 처리 단계
+    current_step: Annotated[str, keep_last]  # 현재 처리 단계
     errors: Annotated[List[str], operator.add]  # 에러 로그
+    generation_stats: Annotated[List[dict], operator.add]  # LLM 호출별 생성 통계 (예산 대비 생성 토큰, 종료 사유)
 
 
 def create_initial_state(
@@ -62,6 +73,7 @@ def create_initial_state(
         
         # 추출된 정보 (빈 리스트로 초기화)
         "participants": [],
+        "participants_source": "",
         "agenda_items": [],
         "discussions": [],
         "decisions": [],
@@ -69,7 +81,8 @@ def create_initial_state(
         
         # 메타데이터
         "current_step": "initialized",
-        "errors": []
+        "errors": [],
+        "generation_stats": []
     }
 
 
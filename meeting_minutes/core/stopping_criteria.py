@@ -0,0 +1,114 @@
+"""생성 중단 조건 - 생성 프로필의 중단 문자열/반복 감지를 transformers generate에 적용"""
+from typing import List, Optional, Sequence
+import torch
+from transformers import StoppingCriteria
+
+from .generation_profile import (
+    GenerationProfile,
+    STOP_REPETITION,
+    STOP_SEQUENCE,
+    find_repetition
+)
+
+
+class StopSequenceCriteria(StoppingCriteria):
+    """생성된 텍스트 끝부분에 중단 문자열이 나타나면 종료
+    
+    매 스텝 전체를 디코딩하지 않도록 최근 토큰 몇 개만 디코딩합니다.
+    앞쪽 공백/빈 줄은 무시하므로 "\\n\\n" 같은 중단 문자열이 출력 맨 앞에서
+    바로 걸리지는 않습니다.
+    """
+    
+    def __init__(self, tokenizer, prompt_length: int, stop_sequences: Sequence[str]):
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.stop_sequences = tuple(stop_sequences)
+        # 토큰 하나는 한 글자 이상이므로 중단 문자열 글자 수만큼의 토큰(+여유분)이면 충분
+        self.window = max(len(stop) for stop in self.stop_sequences) + 8
+        self.triggered = False
+    
+    def __call__(self, input_ids, scores, **kwargs):
+        generated = input_ids[0, self.prompt_length:]
+        tail = generated[-self.window:]
+        text = self.tokenizer.decode(tail, skip_special_tokens=True)
+        if len(generated) <= self.window:
+            text = text.lstrip()
+        self.triggered = any(stop in text for stop in self.stop_sequences)
+        return self.triggered
+
+
+class RepetitionCriteria(StoppingCriteria):
+    """같은 토큰 구간이 연속 반복되는 퇴화 출력을 감지하면 종료
+    
+    최근 토큰이 주기 p (1 ≤ p ≤ max_period)로 min_repeats번 이상 반복되고
+    반복 구간이 min_span 토큰 이상이면 종료합니다. trim_tokens에는
+    첫 번째 반복만 남기기 위해 잘라낼 토큰 수를 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        prompt_length: int,
+        max_period: int = 32,
+        min_repeats: int = 3,
+        min_span: int = 16
+    ):
+        self.prompt_length = prompt_length
+        self.max_period = max_period
+        self.min_repeats = min_repeats
+        self.min_span = min_span
+        self.triggered = False
+        self.trim_tokens = 0
+    
+    def __call__(self, input_ids, scores, **kwargs):
+        generated = input_ids.shape[-1] - self.prompt_length
+        span = max(self.max_period * self.min_repeats, self.min_span)
+        tokens = input_ids[0, -min(span, generated):].tolist() if generated > 0 else []
+        
+        trim = find_repetition(tokens, self.max_period, self.min_repeats, self.min_span)
+        if trim is None:
+            return False
+        self.triggered = True
+        self.trim_tokens = trim
+        return True
+
+
+class BatchProfileCriteria(StoppingCriteria):
+    """배치 생성 시 행마다 자기 프로필의 중단 문자열/반복 감지를 적용
+    
+    행별로 단일 시퀀스용 조건(StopSequenceCriteria, RepetitionCriteria)을 만들어
+    해당 행에만 적용합니다. 한 번 종료된 행은 다시 확인하지 않으며(이후 패딩),
+    stop_reasons/trim_tokens에 행별 종료 사유와 반복 구간 잘라낼 토큰 수를 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        tokenizer,
+        prompt_length: int,
+        profiles: List[Optional[GenerationProfile]]
+    ):
+        self.criteria = [
+            profile.stopping_criteria(tokenizer, prompt_length) if profile is not None else []
+            for profile in profiles
+        ]
+        self.stop_reasons: List[Optional[str]] = [None] * len(profiles)
+        self.trim_tokens = [0] * len(profiles)
+    
+    def __call__(self, input_ids, scores, **kwargs):
+        stopped = torch.zeros(input_ids.shape[0], dtype=torch.bool, device=input_ids.device)
+        for row, criteria in enumerate(self.criteria):
+            if self.stop_reasons[row] is not None:
+                stopped[row] = True
+                continue
+            sequence = input_ids[row:row + 1]
+            # 단일 시퀀스 경로와 같이 모든 조건을 확인하고 같은 순서로 종료 사유 결정
+            triggered = [criterion(sequence, scores) for criterion in criteria]
+            for criterion, hit in zip(criteria, triggered):
+                if not hit:
+                    continue
+                if isinstance(criterion, RepetitionCriteria):
+                    self.trim_tokens[row] = criterion.trim_tokens
+                    self.stop_reasons[row] = STOP_REPETITION
+                else:
+                    self.stop_reasons[row] = STOP_SEQUENCE
+            stopped[row] = self.stop_reasons[row] is not None
+        return stopped
@@ -0,0 +1,947 @@
+"""transformers 백엔드 - EXAONE 3.5 2.4B (경량 로컬 모델, HuggingFace + PyTorch)"""
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+import torch
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    LogitsProcessorList,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextStreamer
+)
+from typing import Callable, Dict, List, Optional
+import warnings
+
+from ..utils.text_utils import estimate_tokens
+from .response_cache import ResponseCache
+from .backend import LLMBackend, process_rss_bytes, token_callback
+from .generation_profile import (
+    GenerationProfile,
+    STOP_EOS,
+    STOP_LENGTH,
+    STOP_REPETITION,
+    STOP_SEQUENCE,
+    trim_stop_sequences
+)
+from .stopping_criteria import BatchProfileCriteria, RepetitionCriteria, StopSequenceCriteria
+from .constrained_decoding import (
+    JsonLinesGrammar,
+    JsonLinesLogitsProcessor,
+    TokenGrammar,
+    token_bytes_table
+)
+
+warnings.filterwarnings("ignore")
+
+# CPU 정밀도 프로필 (fp32: 기본, bf16: 절반 메모리, int8: Linear 동적 양자화, int4: 가중치 전용 양자화)
+CPU_PRECISIONS = ("fp32", "bf16", "int8", "int4")
+
+# 현재 generate 호출의 모델별 forward 횟수 (추측 디코딩 수락률 계산용)
+_forward_counts: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "forward_counts", default=None
+)
+
+class CallbackStreamer(TextStreamer):
+    """디코딩된 텍스트 조각을 콜백으로 넘기는 스트리머 (프롬프트 제외)"""
+    
+    def __init__(self, tokenizer, callback: Callable[[str], None]):
+        super().__init__(tokenizer, skip_prompt=True, skip_special_tokens=True)
+        self.callback = callback
+    
+    def on_finalized_text(self, text: str, stream_end: bool = False):
+        if text:
+            self.callback(text)
+
+
+def _count_forward(key: str):
+    """모델 forward 호출 수를 현재 호출 컨텍스트의 카운터에 더하는 pre-hook"""
+    def hook(module, args):
+        counts = _forward_counts.get()
+        if counts is not None:
+            counts[key] = counts.get(key, 0) + 1
+    return hook
+
+
+def _tensor_bytes(tensor) -> int:
+    """텐서 메모리 크기 (torchao 등 텐서 서브클래스는 내부 텐서 합)"""
+    if hasattr(tensor, "__tensor_flatten__"):
+        names, _ = tensor.__tensor_flatten__()
+        return sum(_tensor_bytes(getattr(tensor, name)) for name in names)
+    return tensor.numel() * tensor.element_size()
+
+
+def model_footprint(model) -> tuple:
+    """모델 파라미터 수와 가중치/버퍼 메모리 (바이트)
+    
+    동적 양자화 Linear는 가중치를 parameters()가 아닌 패킹된 형태로 보관하므로
+    weight()/bias()로 따로 집계합니다.
+    """
+    param_count = 0
+    memory_bytes = 0
+    for module in model.modules():
+        for param in module.parameters(recurse=False):
+            param_count += param.numel()
+            memory_bytes += _tensor_bytes(param)
+        for buffer in module.buffers(recurse=False):
+            memory_bytes += _tensor_bytes(buffer)
+        if callable(getattr(module, "weight", None)):
+            for tensor in (module.weight(), module.bias()):
+                if tensor is not None:
+                    param_count += tensor.numel()
+                    memory_bytes += _tensor_bytes(tensor)
+    return param_count, memory_bytes
+
+
+def _quantize_int4(model, group_size: int = 128):
+    """torchao 가중치 전용 int4 양자화 (미설치/미지원 환경에서는 예외)"""
+    try:
+        from torchao.quantization import quantize_, Int4WeightOnlyConfig
+        config = Int4WeightOnlyConfig(group_size=group_size)
+    except ImportError:
+        from torchao.quantization import quantize_, int4_weight_only
+        config = int4_weight_only(group_size=group_size)
+    quantize_(model, config)
+
+
+class PrefixKVCache:
+    """공통 프롬프트 접두부의 past_key_values 캐시 (LRU)
+    
+    같은 회의록에 대한 여러 노드 호출은 시스템 프롬프트 + 회의 내용이라는
+    동일한 접두부를 공유합니다. 접두부의 KV 캐시를 한 번만 계산하고
+    이후 호출에서 복사하여 재사용하면 CPU prefill 비용을 크게 줄일 수 있습니다.
+    
+    메모리 사용량은 항목 수(max_entries)와 총 토큰 수(max_tokens)로 제한하며,
+    한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+    
+    def __init__(self, max_entries: int = 4, max_tokens: int = 32768):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수
+            max_tokens: 캐시에 보관할 최대 접두부 토큰 수 합계
+        """
+        self.max_entries = max_entries
+        self.max_tokens = max_tokens
+        self._entries = OrderedDict()  # key -> (prefix_ids, past_key_values)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model_id: str, prefix_ids: List[int]) -> str:
+        """모델 ID와 접두부 토큰으로 캐시 키 생성"""
+        digest = hashlib.sha256(
+            ",".join(map(str, prefix_ids)).encode("utf-8")
+        ).hexdigest()
+        return f"{model_id}:{digest}"
+    
+    def get(self, key: str):
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def peek(self, key: str):
+        """통계에 반영하지 않고 캐시 조회"""
+        with self._lock:
+            return self._entries.get(key)
+    
+    def put(self, key: str, prefix_ids: List[int], past_key_values):
+        """캐시 저장 후 한도 초과 항목 제거"""
+        if len(prefix_ids) > self.max_tokens:
+            return
+        with self._lock:
+            self._entries[key] = (prefix_ids, past_key_values)
+            self._entries.move_to_end(key)
+            while (
+                len(self._entries) > self.max_entries
+                or self._total_tokens() > self.max_tokens
+            ):
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+    
+    def _total_tokens(self) -> int:
+        return sum(len(ids) for ids, _ in self._entries.values())
+    
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "tokens": self._total_tokens(),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class PerSequenceLengthCriteria(StoppingCriteria):
+    """배치 생성 시 시퀀스별 최대 생성 길이 제한
+    
+    시퀀스마다 bool 값을 반환하므로 짧은 출력은 자기 한도에서 먼저 종료되고
+    (이후 패딩), 긴 출력만 계속 생성됩니다.
+    """
+    
+    def __init__(self, prompt_length: int, max_new_tokens: List[int]):
+        self.prompt_length = prompt_length
+        self.max_new_tokens = torch.tensor(max_new_tokens)
+    
+    def __call__(self, input_ids, scores, **kwargs):
+        generated = input_ids.shape[-1] - self.prompt_length
+        return generated >= self.max_new_tokens.to(input_ids.device)
+
+
+class LightweightLLMConfig(LLMBackend):
+    """경량 HuggingFace LLM 설정 (노트북 최적화, transformers 백엔드)"""
+    
+    backend_name = "transformers"
+    
+    # 추천 경량 모델 목록
+    RECOMMENDED_MODELS = {
+        "exaone-2.4b": "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct",  # 가장 추천
+        "qwen-1.5b": "Qwen/Qwen2.5-1.5B-Instruct",
+        "qwen-3b": "Qwen/Qwen2.5-3B-Instruct",
+    }
+    
+    def __init__(
+        self,
+        model_name: str = "exaone-2.4b",
+        device: str = "auto",
+        max_length: int = 2048,
+        temperature: float = 0.2,
+        load_in_8bit: bool = False,
+        prefix_cache_size: int = 4,
+        prefix_cache_max_tokens: int = 32768,
+        deterministic: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        cpu_precision: str = "fp32",
+        constrained_decoding: bool = False,
+        draft_model_name: Optional[str] = None,
+        draft_num_tokens: int = 0
+    ):
+        """경량 모델 설정 초기화
+        
+        Args:
+            model_name: 모델 이름 (exaone-2.4b 권장)
+            device: 디바이스 ("auto", "cpu", "cuda")
+            max_length: 최대 생성 길이
+            temperature: 생성 온도
+            load_in_8bit: 8bit 양자화 사용 (메모리 절약)
+            prefix_cache_size: 접두부 KV 캐시 항목 수 (0이면 비활성화)
+            prefix_cache_max_tokens: 접두부 KV 캐시에 보관할 최대 토큰 수
+            deterministic: 그리디 디코딩 사용 (같은 입력 → 같은 출력)
+            response_cache: 디스크 응답 캐시 (None이면 사용 안 함)
+            cpu_precision: CPU 실행 시 정밀도 ("fp32", "bf16", "int8", "int4")
+            constrained_decoding: json_schema가 있는 프로필의 출력을 스키마에 맞는
+                JSON 줄로 제한 (직접 생성/배치 생성 경로에서 적용)
+            draft_model_name: 추측(speculative) 디코딩용 초안 모델 (같은 토크나이저,
+                예: qwen-3b에 qwen-1.5b). None이면 사용 안 함
+            draft_num_tokens: 한 번에 제안할 초안 토큰 수 (0이면 transformers 기본값)
+        """
+        if cpu_precision not in CPU_PRECISIONS:
+            raise ValueError(
+                f"지원하지 않는 CPU 정밀도입니다: {cpu_precision} (지원: {', '.join(CPU_PRECISIONS)})"
+            )
+        
+        super().__init__(max_length, temperature, deterministic, response_cache)
+        
+        # 모델 ID
+        if model_name in self.RECOMMENDED_MODELS:
+            self.model_id = self.RECOMMENDED_MODELS[model_name]
+            self.model_name = model_name
+        else:
+            self.model_id = model_name
+            self.model_name = model_name.split("/")[-1]
+        
+        self.device = device
+        self.load_in_8bit = load_in_8bit
+        self.cpu_precision = cpu_precision
+        self.constrained_decoding = constrained_decoding
+        self.draft_model_name = draft_model_name or None
+        self.draft_num_tokens = draft_num_tokens
+        self.precision: Optional[str] = None  # 로드 후 실제 적용된 정밀도
+        
+        self._model = None
+        self._tokenizer = None
+        self._draft_model = None
+        
+        # 공통 접두부 KV 캐시
+        self.prefix_cache = (
+            PrefixKVCache(prefix_cache_size, prefix_cache_max_tokens)
+            if prefix_cache_size > 0 else None
+        )
+        self._prefix_lock = threading.Lock()
+        self._tokenizer_lock = threading.Lock()
+        
+        # 제약 디코딩 문법 (스키마별, 상태별 토큰 마스크 캐시 포함)
+        self._vocab_bytes = None
+        self._token_grammars: Dict[str, TokenGrammar] = {}
+        self._grammar_lock = threading.Lock()
+        
+        # 직접 생성 속도 통계 (추측 디코딩 / 일반 디코딩 비교)
+        self.decode_stats = {
+            "speculative": {
+                "calls": 0, "generated_tokens": 0, "seconds": 0.0,
+                "proposed_tokens": 0, "accepted_tokens": 0, "target_forwards": 0,
+            },
+            "baseline": {"calls": 0, "generated_tokens": 0, "seconds": 0.0},
+        }
+    
+    def load_model(self):
+        """모델 로드 (자동 최적화)"""
+        if self._is_loaded:
+            print(f"✓ 모델이 이미 로드되어 있습니다: {self.model_name}")
+            return
+        
+        print(f"\n[모델 로드] {self.model_id}")
+        print("노트북 최적화 중... (1-3분 소요)")
+        
+        try:
+            # 디바이스 설정
+            if torch.cuda.is_available():
+                device_map = "cuda"
+                torch_dtype = torch.float16
+                precision = "int8" if self.load_in_8bit else "fp16"
+                print("✓ GPU 사용 가능 - GPU에서 실행")
+            else:
+                device_map = "cpu"
+                precision = self.cpu_precision
+                if self.load_in_8bit and precision == "fp32":
+                    # CPU에서는 bitsandbytes 8bit 대신 동적 int8 양자화 사용
+                    precision = "int8"
+                torch_dtype = torch.bfloat16 if precision in ("bf16", "int4") else torch.float32
+                print(f"✓ CPU에서 실행 (GPU보다 느림, 정밀도: {precision})")
+            
+            # 토크나이저 로드
+            print("  [1/2] 토크나이저 로드 중...")
+            self._tokenizer = AutoTokenizer.from_pretrained(
+                self.model_id,
+                trust_remote_code=True
+            )
+            # 배치 생성의 패딩용 (로드 시 한 번만 설정해 호출 순서와 무관하게 같은 토크나이저 상태 유지)
+            if self._tokenizer.pad_token is None:
+                self._tokenizer.pad_token = self._tokenizer.eos_token
+            
+            # 모델 로드 (메모리 최적화)
+            print("  [2/2] 모델 로드 중...")
+            load_kwargs = {
+                "pretrained_model_name_or_path": self.model_id,
+                "torch_dtype": torch_dtype,
+                "trust_remote_code": True,
+                "low_cpu_mem_usage": True
+            }
+            
+            # 8bit 양자화 옵션
+            if self.load_in_8bit and torch.cuda.is_available():
+                load_kwargs["load_in_8bit"] = True
+                load_kwargs["device_map"] = "auto"
+                print("  - 8bit 양자화 활성화 (메모리 절약)")
+            else:
+                load_kwargs["device_map"] = device_map
+            
+            self._model = AutoModelForCausalLM.from_pretrained(**load_kwargs)
+            if device_map == "cpu":
+                self._model = self._apply_cpu_precision(self._model, precision)
+            else:
+                self.precision = precision
+            
+            if self.draft_model_name:
+                self._load_draft_model(torch_dtype, device_map)
+            
+            self._is_loaded = True
+            param_count, memory_bytes = model_footprint(self._model)
+            print(f"✓ 모델 로드 완료: {self.model_name}")
+            print(f"  - 파라미터: {param_count / 1e9:.2f}B")
+            print(f"  - 가중치 메모리: {memory_bytes / 1024 ** 3:.2f} GB ({self.precision})")
+            print(f"  - 디바이스: {device_map}")
+        
+        except Exception as e:
+            print(f"✗ 모델 로드 실패: {e}")
+            print("\n해결 방법:")
+            print("  1. 인터넷 연결 확인")
+            print("  2. 메모리 부족 시: LLM_CPU_PRECISION=bf16/int8 (CPU) 또는 load_in_8bit=True (GPU) 설정")
+            print("  3. 재부팅 후 재시도")
+            raise
+    
+    def _load_draft_model(self, torch_dtype, device_map: str):
+        """추측 디코딩용 초안 모델 로드
+        
+        초안 모델은 대상 모델과 토크나이저(어휘)가 같아야 합니다. 다르거나
+        로드에 실패하면 경고만 출력하고 일반 디코딩으로 동작합니다.
+        """
+        draft_id = self.RECOMMENDED_MODELS.get(self.draft_model_name, self.draft_model_name)
+        print(f"  [+] 초안 모델 로드 중 (추측 디코딩): {draft_id}")
+        try:
+            draft_tokenizer = AutoTokenizer.from_pretrained(draft_id, trust_remote_code=True)
+            if (
+                draft_tokenizer.get_vocab() != self._tokenizer.get_vocab()
+                or draft_tokenizer.eos_token_id != self._tokenizer.eos_token_id
+            ):
+                print("  ⚠ 초안 모델의 토크나이저가 대상 모델과 달라 추측 디코딩을 사용하지 않습니다")
+                return
+            
+            draft = AutoModelForCausalLM.from_pretrained(
+                draft_id,
+                torch_dtype=torch_dtype,
+                trust_remote_code=True,
+                low_cpu_mem_usage=True,
+                device_map=device_map
+            )
+            if draft.config.vocab_size != self._model.config.vocab_size:
+                print("  ⚠ 초안 모델의 어휘 크기가 대상 모델과 달라 추측 디코딩을 사용하지 않습니다")
+                return
+        except Exception as e:
+            print(f"  ⚠ 초안 모델 로드 실패, 추측 디코딩 없이 계속합니다: {e}")
+            return
+        
+        if self.draft_num_tokens > 0:
+            # 고정 개수 제안 (기본값은 수락률에 따라 개수를 바꾸고 확신도가 낮으면 일찍 멈춤)
+            draft.generation_config.num_assistant_tokens = self.draft_num_tokens
+            draft.generation_config.num_assistant_tokens_schedule = "constant"
+            draft.generation_config.assistant_confidence_threshold = 0.0
+        
+        self._model.register_forward_pre_hook(_count_forward("target"))
+        draft.register_forward_pre_hook(_count_forward("draft"))
+        self._draft_model = draft
+        param_count, memory_bytes = model_footprint(draft)
+        print(f"  - 초안 모델: {param_count / 1e9:.2f}B, {memory_bytes / 1024 ** 3:.2f} GB")
+    
+    def _apply_cpu_precision(self, model, precision: str):
+        """CPU 양자화 프로필 적용 (int4를 쓸 수 없으면 int8로 대체)"""
+        if precision == "int4":
+            try:
+                _quantize_int4(model)
+                # 커널이 없는 환경은 첫 forward에서 실패하므로 미리 확인
+                # (fork 전 마스터에서는 OpenMP 스레드 풀이 만들어지지 않도록 생략)
+                if not self.preload_for_fork:
+                    with torch.no_grad():
+                        model(torch.zeros((1, 1), dtype=torch.long))
+                print("  - int4 가중치 전용 양자화 적용 (torchao)")
+                self.precision = "int4"
+                return model
+            except Exception as e:
+                print(f"  - int4 양자화 사용 불가 ({type(e).__name__}: {e}) → int8로 대체")
+                model = AutoModelForCausalLM.from_pretrained(
+                    self.model_id,
+                    torch_dtype=torch.float32,
+                    trust_remote_code=True,
+                    low_cpu_mem_usage=True
+                )
+                precision = "int8"
+        
+        if precision == "int8":
+            model = torch.ao.quantization.quantize_dynamic(
+                model,
+                {torch.nn.Linear},
+                dtype=torch.qint8
+            )
+            print("  - int8 동적 양자화 적용 (Linear 가중치)")
+        
+        self.precision = precision
+        return model
+    
+    def generate_with_stats(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        prefix: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None
+    ) -> tuple:
+        """텍스트 생성 + 생성 통계 (LLMBackend.generate_with_stats 참고)"""
+        callback = token_callback.get()
+        
+        input_tokens = estimate_tokens(prompt)
+        budget = self._budget(profile, input_tokens)
+        
+        # 응답 캐시 조회 (모델 로드 전에 확인)
+        cache_key = self._response_cache_key(
+            prompt, system_prompt, budget, profile, self._uses_grammar(profile)
+        )
+        cached = self._cached_generation(cache_key, profile, input_tokens, budget, callback)
+        if cached is not None:
+            return cached
+        
+        # 디스패처가 연결되어 있으면 동적 배치로 처리
+        if self._dispatcher is not None:
+            return self._dispatch(
+                prompt, system_prompt, prefix, profile, input_tokens, budget, cache_key, callback
+            )
+        
+        if not self._is_loaded:
+            self.load_model()
+        
+        # 메시지 구성
+        messages = self._build_messages(prompt, system_prompt)
+        speculative = self._uses_draft(profile)
+        
+        # 토큰화
+        past_key_values = None
+        try:
+            input_ids = self._tokenizer.apply_chat_template(
+                messages,
+                tokenize=True,
+                add_generation_prompt=True,
+                return_tensors="pt",
+                return_dict=False
+            ).to(self._model.device)
+            chat_template = True
+        except:
+            # apply_chat_template 미지원 시 대체 방법
+            text = f"{system_prompt or ''}\n\n{prompt}"
+            input_ids = self._tokenizer(
+                text,
+                return_tensors="pt"
+            ).input_ids.to(self._model.device)
+            chat_template = False
+        
+        # 추측 디코딩은 초안 모델도 전체 프롬프트를 처리하므로 접두부 캐시를 쓰지 않음
+        if (
+            chat_template and prefix and self.prefix_cache is not None
+            and prompt.startswith(prefix) and not speculative
+        ):
+            try:
+                past_key_values = self._get_prefix_cache(messages, prefix, input_ids)
+            except (RuntimeError, ValueError, IndexError) as e:
+                # 캐시 계산/잘라내기 실패 시 같은 입력을 캐시 없이 처리
+                print(f"⚠ 접두부 캐시 사용 실패 (캐시 없이 생성): {e}")
+                past_key_values = None
+        
+        prompt_length = input_ids.shape[-1]
+        generate_kwargs = {}
+        if past_key_values is not None:
+            generate_kwargs["past_key_values"] = past_key_values
+        if callback is not None:
+            generate_kwargs["streamer"] = CallbackStreamer(self._tokenizer, callback)
+        criteria = profile.stopping_criteria(self._tokenizer, prompt_length) if profile else []
+        if criteria:
+            generate_kwargs["stopping_criteria"] = StoppingCriteriaList(criteria)
+        if self._uses_grammar(profile):
+            generate_kwargs["logits_processor"] = LogitsProcessorList([
+                JsonLinesLogitsProcessor(
+                    {0: self._token_grammar(profile.json_schema)}, prompt_length
+                )
+            ])
+        if speculative:
+            generate_kwargs["assistant_model"] = self._draft_model
+        
+        # 생성
+        forward_counts = {}
+        counts_token = _forward_counts.set(forward_counts)
+        start = time.perf_counter()
+        try:
+            with torch.no_grad():
+                output = self._model.generate(
+                    input_ids,
+                    max_new_tokens=budget,
+                    **self._sampling_kwargs(),
+                    eos_token_id=self._tokenizer.eos_token_id,
+                    pad_token_id=self._tokenizer.pad_token_id or self._tokenizer.eos_token_id,
+                    use_cache=True,
+                    **generate_kwargs
+                )
+        finally:
+            _forward_counts.reset(counts_token)
+        seconds = time.perf_counter() - start
+        
+        generated = output[0][prompt_length:]
+        generated_tokens = len(generated)
+        decode_stats = self._record_decode(speculative, generated_tokens, seconds, forward_counts)
+        stop_reason = STOP_LENGTH if generated_tokens >= budget else STOP_EOS
+        for criterion in criteria:
+            if isinstance(criterion, RepetitionCriteria) and criterion.triggered:
+                # 반복 구간은 첫 번째만 남김
+                generated = generated[:generated_tokens - criterion.trim_tokens]
+                stop_reason = STOP_REPETITION
+            elif isinstance(criterion, StopSequenceCriteria) and criterion.triggered:
+                stop_reason = STOP_SEQUENCE
+        
+        # 디코딩
+        generated_text = self._tokenizer.decode(
+            generated,
+            skip_special_tokens=True
+        ).strip()
+        if profile is not None and profile.stop_sequences:
+            generated_text = trim_stop_sequences(generated_text, profile.stop_sequences)[0].strip()
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, generated_text)
+        
+        stats = self._record_generation(profile, input_tokens, budget, generated_tokens, stop_reason)
+        if speculative:
+            stats["speculative"] = decode_stats
+        return generated_text, stats
+    
+    def generate_batch_with_stats(
+        self,
+        prompts: List[str],
+        per_prompt_params: Optional[List[Dict]] = None
+    ) -> tuple:
+        """배치 생성 + 프롬프트별 생성 통계
+        
+        인자는 generate_batch()와 같습니다. 배치 디코딩에서도 단일 생성과 같이
+        시퀀스별 토큰 예산과 프로필의 중단 문자열/반복 감지를 행마다 적용합니다.
+        
+        Returns:
+            tuple: (프롬프트 순서대로 생성된 텍스트 목록, 통계 dict 목록)
+        """
+        if not prompts:
+            return [], []
+        
+        if per_prompt_params is None:
+            per_prompt_params = [{} for _ in prompts]
+        if len(per_prompt_params) != len(prompts):
+            raise ValueError("prompts와 per_prompt_params의 길이가 다릅니다")
+        
+        profiles = [params.get("profile") for params in per_prompt_params]
+        input_tokens = [estimate_tokens(prompt) for prompt in prompts]
+        budgets = [
+            params.get("max_new_tokens")
+            or (profile.budget(tokens, self.max_length) if profile else self.max_length)
+            for params, profile, tokens in zip(per_prompt_params, profiles, input_tokens)
+        ]
+        
+        # 응답 캐시 조회 - 캐시에 없는 프롬프트만 배치로 생성
+        results = [None] * len(prompts)
+        stats = [None] * len(prompts)
+        cache_keys = [
+            self._response_cache_key(
+                prompt, params.get("system_prompt"), budget, profile, self._uses_grammar(profile)
+            )
+            for prompt, params, budget, profile in zip(prompts, per_prompt_params, budgets, profiles)
+        ]
+        for idx, key in enumerate(cache_keys):
+            if key is not None:
+                results[idx] = self.response_cache.get(key)
+                if results[idx] is not None:
+                    stats[idx] = self._record_generation(
+                        profiles[idx], input_tokens[idx], budgets[idx],
+                        self.count_tokens(results[idx]), "cache"
+                    )
+        pending = [idx for idx, result in enumerate(results) if result is None]
+        if not pending:
+            return results, stats
+        
+        def finish(idx: int, text: str, generated_tokens: int, stop_reason: Optional[str] = None):
+            if stop_reason is None:
+                stop_reason = STOP_LENGTH if generated_tokens >= budgets[idx] else STOP_EOS
+            if profiles[idx] is not None and profiles[idx].stop_sequences:
+                text, stopped = trim_stop_sequences(text, profiles[idx].stop_sequences)
+                if stopped:
+                    text = text.strip()
+                    if stop_reason in (STOP_LENGTH, STOP_EOS):
+                        stop_reason = STOP_SEQUENCE
+            results[idx] = text
+            stats[idx] = self._record_generation(
+                profiles[idx], input_tokens[idx], budgets[idx], generated_tokens, stop_reason
+            )
+            if cache_keys[idx] is not None:
+                self.response_cache.put(cache_keys[idx], text)
+        
+        # 디스패처가 연결되어 있으면 각 프롬프트를 개별 요청으로 넘김
+        if self._dispatcher is not None:
+            futures = {
+                idx: self._dispatcher.submit(
+                    prompts[idx],
+                    per_prompt_params[idx].get("system_prompt"),
+                    budgets[idx],
+                    profile=profiles[idx]
+                )
+                for idx in pending
+            }
+            for idx, future in futures.items():
+                text, dispatch_stats = future.result()
+                results[idx] = text
+                stats[idx] = self._record_generation(
+                    profiles[idx], input_tokens[idx], budgets[idx],
+                    dispatch_stats["generated_tokens"], dispatch_stats["stop_reason"]
+                )
+                if cache_keys[idx] is not None:
+                    self.response_cache.put(cache_keys[idx], text)
+            return results, stats
+        
+        if not self._is_loaded:
+            self.load_model()
+        
+        # 채팅 템플릿 적용
+        texts = []
+        for idx in pending:
+            prompt, params = prompts[idx], per_prompt_params[idx]
+            system_prompt = params.get("system_prompt")
+            try:
+                texts.append(self._tokenizer.apply_chat_template(
+                    self._build_messages(prompt, system_prompt),
+                    tokenize=False,
+                    add_generation_prompt=True
+                ))
+            except:
+                texts.append(f"{system_prompt or ''}\n\n{prompt}")
+        
+        max_new_tokens = [budgets[idx] for idx in pending]
+        
+        # 왼쪽 패딩 토큰화 (디코더 모델은 마지막 토큰 위치가 맞아야 함)
+        with self._tokenizer_lock:
+            padding_side = self._tokenizer.padding_side
+            self._tokenizer.padding_side = "left"
+            try:
+                inputs = self._tokenizer(
+                    texts,
+                    return_tensors="pt",
+                    padding=True,
+                    add_special_tokens=False
+                ).to(self._model.device)
+            finally:
+                self._tokenizer.padding_side = padding_side
+        
+        prompt_length = inputs.input_ids.shape[-1]
+        profile_criteria = BatchProfileCriteria(
+            self._tokenizer, prompt_length, [profiles[idx] for idx in pending]
+        )
+        stopping_criteria = StoppingCriteriaList([
+            PerSequenceLengthCriteria(prompt_length, max_new_tokens),
+            profile_criteria
+        ])
+        generate_kwargs = {}
+        grammars = {
+            row: self._token_grammar(profiles[idx].json_schema)
+            for row, idx in enumerate(pending)
+            if self._uses_grammar(profiles[idx])
+        }
+        if grammars:
+            generate_kwargs["logits_processor"] = LogitsProcessorList([
+                JsonLinesLogitsProcessor(grammars, prompt_length)
+            ])
+        
+        # 배치 생성
+        with torch.no_grad():
+            output = self._model.generate(
+                **inputs,
+                max_new_tokens=max(max_new_tokens),
+                **self._sampling_kwargs(),
+                eos_token_id=self._tokenizer.eos_token_id,
+                pad_token_id=self._tokenizer.pad_token_id,
+                stopping_criteria=stopping_criteria,
+                use_cache=True,
+                **generate_kwargs
+            )
+        
+        # 디코딩 (입력 순서 유지) - 생성 토큰 수는 첫 EOS/패딩 전까지
+        end_ids = {self._tokenizer.eos_token_id, self._tokenizer.pad_token_id}
+        for row, (idx, sequence) in enumerate(zip(pending, output)):
+            generated = sequence[prompt_length:].tolist()
+            generated_tokens = next(
+                (pos for pos, token in enumerate(generated) if token in end_ids),
+                len(generated)
+            )
+            # 반복 감지로 종료된 행은 첫 번째 반복만 남김
+            kept = generated_tokens - profile_criteria.trim_tokens[row]
+            text = self._tokenizer.decode(
+                sequence[prompt_length:prompt_length + kept],
+                skip_special_tokens=True
+            ).strip()
+            finish(idx, text, generated_tokens, profile_criteria.stop_reasons[row])
+        
+        return results, stats
+    
+    def _uses_grammar(self, profile: Optional[GenerationProfile]) -> bool:
+        """이번 호출에 제약 디코딩을 적용할지 (프로필을 적용하지 않는 디스패처 경로 제외)"""
+        return (
+            self.constrained_decoding
+            and profile is not None
+            and profile.json_schema is not None
+            and (self._dispatcher is None or getattr(self._dispatcher, "applies_profiles", False))
+        )
+    
+    def _uses_draft(self, profile: Optional[GenerationProfile]) -> bool:
+        """이번 호출에 추측 디코딩을 적용할지 (speculative 프로필의 직접 생성만)
+        
+        제약 디코딩과는 함께 쓰지 않습니다. 보조 생성은 같은 logits processor를
+        초안 모델 생성과 대상 모델의 후보 위치마다 다시 호출하고, 거절된 초안 토큰의
+        상태를 되돌리지 않으므로 문법 상태(FSM)가 어긋납니다.
+        """
+        return (
+            self._draft_model is not None
+            and profile is not None
+            and profile.speculative
+            and not self._uses_grammar(profile)
+        )
+    
+    def _record_decode(
+        self,
+        speculative: bool,
+        generated_tokens: int,
+        seconds: float,
+        forward_counts: Dict[str, int]
+    ) -> dict:
+        """직접 생성 속도 기록, 추측 디코딩이면 이번 호출의 수락 통계 반환
+        
+        대상 모델 forward 한 번은 수락된 초안 토큰 + 1개를 만들므로
+        수락 토큰 수 = 생성 토큰 수 - 대상 모델 forward 수 입니다.
+        """
+        target_forwards = forward_counts.get("target", 0)
+        proposed = forward_counts.get("draft", 0)
+        accepted = max(0, min(proposed, generated_tokens - target_forwards))
+        with self._stats_lock:
+            totals = self.decode_stats["speculative" if speculative else "baseline"]
+            totals["calls"] += 1
+            totals["generated_tokens"] += generated_tokens
+            totals["seconds"] += seconds
+            if speculative:
+                totals["proposed_tokens"] += proposed
+                totals["accepted_tokens"] += accepted
+                totals["target_forwards"] += target_forwards
+        return {
+            "proposed_tokens": proposed,
+            "accepted_tokens": accepted,
+            "acceptance_rate": round(accepted / proposed, 3) if proposed else 0.0,
+            "target_forwards": target_forwards,
+            "tokens_per_second": round(generated_tokens / seconds, 2) if seconds else None,
+        }
+    
+    def speculative_summary(self) -> Optional[dict]:
+        """추측 디코딩 누적 통계 (수락률, 일반 디코딩 대비 속도 향상)"""
+        if self.draft_model_name is None:
+            return None
+        with self._stats_lock:
+            spec = dict(self.decode_stats["speculative"])
+            base = dict(self.decode_stats["baseline"])
+        spec_tps = spec["generated_tokens"] / spec["seconds"] if spec["seconds"] else None
+        base_tps = base["generated_tokens"] / base["seconds"] if base["seconds"] else None
+        return {
+            "draft_model": self.draft_model_name,
+            "active": self._draft_model is not None,
+            "calls": spec["calls"],
+            "acceptance_rate": (
+                round(spec["accepted_tokens"] / spec["proposed_tokens"], 3)
+                if spec["proposed_tokens"] else None
+            ),
+            "tokens_per_target_forward": (
+                round(spec["generated_tokens"] / spec["target_forwards"], 2)
+                if spec["target_forwards"] else None
+            ),
+            "tokens_per_second": round(spec_tps, 2) if spec_tps else None,
+            "baseline_tokens_per_second": round(base_tps, 2) if base_tps else None,
+            "speedup": round(spec_tps / base_tps, 2) if spec_tps and base_tps else None,
+        }
+    
+    def _token_grammar(self, schema: dict) -> TokenGrammar:
+        """스키마의 토큰 문법 (처음 요청될 때 어휘 바이트 표와 함께 생성)"""
+        key = json.dumps(schema, sort_keys=True, ensure_ascii=False)
+        grammar = self._token_grammars.get(key)
+        if grammar is None:
+            with self._grammar_lock:
+                if self._vocab_bytes is None:
+                    self._vocab_bytes = token_bytes_table(self._tokenizer)
+                grammar = self._token_grammars.get(key)
+                if grammar is None:
+                    grammar = TokenGrammar(
+                        JsonLinesGrammar(schema), self._tokenizer, self._vocab_bytes
+                    )
+                    self._token_grammars[key] = grammar
+        return grammar
+    
+    def count_tokens(self, text: str) -> int:
+        """텍스트 토큰 수 계산
+        
+        토크나이저가 로드되어 있으면 실제 토큰 수를, 아니면 추정치를 반환합니다.
+        """
+        if self._tokenizer is not None:
+            return len(self._tokenizer(text, add_special_tokens=False).input_ids)
+        return estimate_tokens(text)
+    
+    def _get_prefix_cache(self, messages: list, prefix: str, input_ids):
+        """공통 접두부의 KV 캐시를 가져오거나 계산
+        
+        채팅 템플릿이 적용된 전체 입력에서 접두부까지의 토큰을 구하고,
+        캐시된 past_key_values를 복사해 반환합니다. 토큰 경계가 접두부 끝에서
+        달라질 수 있으므로 실제 입력과 일치하는 길이만큼만 사용합니다.
+        
+        Returns:
+            past_key_values 복사본 또는 None (재사용 불가 시)
+        """
+        rendered = self._tokenizer.apply_chat_template(
+            messages,
+            tokenize=False,
+            add_generation_prompt=True
+        )
+        prefix_end = rendered.find(prefix)
+        if prefix_end < 0:
+            return None
+        prefix_end += len(prefix)
+        
+        prefix_ids = self._tokenizer(
+            rendered[:prefix_end],
+            add_special_tokens=False
+        ).input_ids
+        
+        # 실제 입력과 일치하는 접두부 길이 (마지막 토큰 1개는 생성 입력으로 남김)
+        full_ids = input_ids[0].tolist()
+        limit = min(len(prefix_ids), len(full_ids) - 1)
+        matched = 0
+        while matched < limit and prefix_ids[matched] == full_ids[matched]:
+            matched += 1
+        if matched == 0:
+            return None
+        
+        key = PrefixKVCache.make_key(self.model_id, prefix_ids)
+        entry = self.prefix_cache.get(key)
+        if entry is None:
+            # 같은 접두부를 여러 노드가 동시에 계산하지 않도록 직렬화
+            with self._prefix_lock:
+                entry = self.prefix_cache.peek(key)
+                if entry is None:
+                    cache_ids = torch.tensor([prefix_ids], device=self._model.device)
+                    with torch.no_grad():
+                        outputs = self._model(cache_ids, use_cache=True)
+                    entry = (prefix_ids, outputs.past_key_values)
+                    self.prefix_cache.put(key, prefix_ids, outputs.past_key_values)
+        
+        # generate가 캐시를 확장하므로 항상 복사본 사용
+        past_key_values = copy.deepcopy(entry[1])
+        if matched < len(prefix_ids):
+            if not hasattr(past_key_values, "crop"):
+                return None
+            past_key_values.crop(matched)
+        
+        return past_key_values
+    
+    def get_model_info(self) -> dict:
+        """모델 정보 (파라미터 수와 메모리는 로드 후 실제 값)"""
+        param_count, memory_bytes = (
+            model_footprint(self._model) if self._model is not None else (None, None)
+        )
+        return {
+            "backend": self.backend_name,
+            "model_id": self.model_id,
+            "model_name": self.model_name,
+            "device": "GPU" if torch.cuda.is_available() else "CPU",
+            "is_loaded": self._is_loaded,
+            "max_length": self.max_length,
+            "temperature": self.temperature,
+            "cuda_available": torch.cuda.is_available(),
+            "parameters": f"{param_count / 1e9:.2f}B" if param_count else None,
+            "parameter_count": param_count,
+            "precision": self.precision or self.cpu_precision,
+            "weights_memory_bytes": memory_bytes,
+            "process_rss_bytes": process_rss_bytes(),
+            "deterministic": self.deterministic,
+            "constrained_decoding": self.constrained_decoding,
+            "prefix_cache": self.prefix_cache.stats() if self.prefix_cache else None,
+            "response_cache": self.response_cache.stats() if self.response_cache else None,
+            "generation_stats": self.generation_stats_summary(),
+            "speculative": self.speculative_summary(),
+            "dispatcher": self.dispatcher_stats()
+        }
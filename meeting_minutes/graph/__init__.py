@@ -1,7 +1,11 @@
 """Graph 모듈 초기화"""
-from .builder import build_meeting_minutes_graph, visualize_graph
+from .builder import build_meeting_minutes_graph, visualize_graph, GRAPH_MODES
+from .registry import GraphRegistry, graph_registry
 
 __all__ = [
     "build_meeting_minutes_graph",
     "visualize_graph",
+    "GRAPH_MODES",
+    "GraphRegistry",
+    "graph_registry",
 ]
\ No newline at end of file
@@ -1,23 +1,43 @@
 """그래프 빌더 - LangGraph 워크플로우 구성"""
-from langgraph.graph import StateGraph, END
+from typing import Optional
 from ..core.state_schema import MeetingState
 from ..nodes.preprocessing import preprocess_node
 from ..nodes.summarization import summarize_node
+from ..nodes.chunking import map_reduce_node
 from ..nodes.extraction import (
     extract_participants_node,
     extract_agenda_node,
     extract_discussions_node,
     extract_decisions_node,
-    extract_action_items_node
+    extract_action_items_node,
+    extract_batched_node,
+    extract_structured_node
 )
 
 
-def build_meeting_minutes_graph():
+# 지원하는 그래프 실행 모드
+GRAPH_MODES = ("sequential", "parallel", "batched", "single_pass", "chunked")
+
+# preprocess 이후 processed_text만 읽는 독립 노드들
+EXTRACTION_NODES = [
+    ("extract_participants", extract_participants_node),
+    ("summarize", summarize_node),
+    ("extract_agenda", extract_agenda_node),
+    ("extract_discussions", extract_discussions_node),
+    ("extract_decisions", extract_decisions_node),
+    ("extract_action_items", extract_action_items_node),
+]
+
+
+def build_meeting_minutes_graph(
+    mode: str = "sequential",
+    max_concurrency: Optional[int] = None
+):
     """회의록 생성 그래프 구축
     
-    7개의 노드를 순차적으로 연결한 LangGraph 워크플로우를 생성합니다.
+    7개의 노드로 구성된 LangGraph 워크플로우를 생성합니다.
     
-    워크플로우 순서:
+    워크플로우 순서 (sequential):
     1. preprocess: 텍스트 전처리
     2. extract_participants: 참석자 추출
     3. summarize: 회의 요약
@@ -26,34 +46,84 @@ def build_meeting_minutes_graph():
     6. extract_decisions: 결정 사항 추출
     7. extract_action_items: 액션 아이템 추출
     
+    parallel 모드에서는 preprocess 이후 6개 노드가 동시에 실행(fan-out)되고
+    모두 끝난 뒤 종료(fan-in)됩니다. 리스트 필드는 operator.add 리듀서로
+    병합되므로 전체 소요 시간은 가장 느린 노드에 맞춰집니다.
+    
+    batched 모드에서는 preprocess 이후 extract_batched 노드 하나가
+    요약과 5개 추출 프롬프트를 한 번의 배치 디코딩으로 처리합니다.
+    
+    single_pass 모드에서는 preprocess 이후 extract_structured 노드가
+    모든 항목을 하나의 JSON 응답으로 생성하고, 파싱에 실패한 필드만
+    개별 노드로 보완합니다.
+    
+    chunked 모드에서는 map_reduce 노드가 긴 대화를 화자 발언 단위 청크로
+    나누어 청크별 그래프를 병렬 실행하고 결과를 병합합니다.
+    
+    Args:
+        mode: 실행 모드 ("sequential", "parallel", "batched", "single_pass", "chunked")
+        max_concurrency: parallel 모드에서 동시에 실행할 최대 노드 수
+            (None이면 제한 없음)
+    
     Returns:
         CompiledGraph: 컴파일된 LangGraph 객체
     """
+    if mode not in GRAPH_MODES:
+        raise ValueError(
+            f"지원하지 않는 그래프 모드입니다: {mode} (지원: {', '.join(GRAPH_MODES)})"
+        )
+    
+    # LangGraph는 그래프를 처음 만들 때 로드 (패키지 import 시간 단축)
+    from langgraph.graph import StateGraph, END
+    
     # StateGraph 생성
     workflow = StateGraph(MeetingState)
     
+    if mode == "chunked":
+        workflow.add_node("map_reduce", map_reduce_node)
+        workflow.set_entry_point("map_reduce")
+        workflow.add_edge("map_reduce", END)
+        return workflow.compile()
+    
     # 노드 추가
     workflow.add_node("preprocess", preprocess_node)
-    workflow.add_node("extract_participants", extract_participants_node)
-    workflow.add_node("summarize", summarize_node)
-    workflow.add_node("extract_agenda", extract_agenda_node)
-    workflow.add_node("extract_discussions", extract_discussions_node)
-    workflow.add_node("extract_decisions", extract_decisions_node)
-    workflow.add_node("extract_action_items", extract_action_items_node)
-    
-    # 엣지 정의 (순차 실행)
     workflow.set_entry_point("preprocess")
-    workflow.add_edge("preprocess", "extract_participants")
-    workflow.add_edge("extract_participants", "summarize")
-    workflow.add_edge("summarize", "extract_agenda")
-    workflow.add_edge("extract_agenda", "extract_discussions")
-    workflow.add_edge("extract_discussions", "extract_decisions")
-    workflow.add_edge("extract_decisions", "extract_action_items")
-    workflow.add_edge("extract_action_items", END)
+    
+    if mode == "batched":
+        workflow.add_node("extract_batched", extract_batched_node)
+        workflow.add_edge("preprocess", "extract_batched")
+        workflow.add_edge("extract_batched", END)
+        return workflow.compile()
+    
+    if mode == "single_pass":
+        workflow.add_node("extract_structured", extract_structured_node)
+        workflow.add_edge("preprocess", "extract_structured")
+        workflow.add_edge("extract_structured", END)
+        return workflow.compile()
+    
+    for name, node in EXTRACTION_NODES:
+        workflow.add_node(name, node)
+    
+    if mode == "parallel":
+        # 엣지 정의 (fan-out / fan-in)
+        for name, _ in EXTRACTION_NODES:
+            workflow.add_edge("preprocess", name)
+            workflow.add_edge(name, END)
+    else:
+        # 엣지 정의 (순차 실행)
+        previous = "preprocess"
+        for name, _ in EXTRACTION_NODES:
+            workflow.add_edge(previous, name)
+            previous = name
+        workflow.add_edge(previous, END)
     
     # 컴파일
     graph = workflow.compile()
     
+    # 동시 실행 제한
+    if max_concurrency:
+        graph = graph.with_config(max_concurrency=max_concurrency)
+    
     return graph
 
 
@@ -0,0 +1,101 @@
+"""그래프 레지스트리 - 컴파일된 그래프 재사용"""
+import threading
+import time
+from typing import Iterable, Optional
+from .builder import build_meeting_minutes_graph, GRAPH_MODES
+from config import settings
+
+
+class GraphRegistry:
+    """모드/옵션별로 한 번만 컴파일한 그래프를 공유
+    
+    StateGraph 컴파일은 요청마다 반복할 필요가 없으므로, (mode, max_concurrency)
+    조합마다 처음 요청될 때(또는 warmup 시) 한 번 컴파일하고 이후 요청은
+    같은 객체를 사용합니다. 컴파일된 그래프는 체크포인터 없이 실행되므로
+    여러 스레드에서 동시에 invoke/stream 해도 안전합니다.
+    """
+    
+    def __init__(self):
+        self._graphs = {}
+        self._compile_times = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(mode: str, max_concurrency: Optional[int] = None) -> tuple:
+        """그래프 캐시 키"""
+        return (mode, max_concurrency or None)
+    
+    def get(self, mode: Optional[str] = None, max_concurrency: Optional[int] = None):
+        """컴파일된 그래프 반환 (없으면 컴파일 후 등록)
+        
+        Args:
+            mode: 실행 모드 (None이면 settings.GRAPH_MODE)
+            max_concurrency: 동시 실행 노드 수 (None이면 settings.GRAPH_MAX_CONCURRENCY)
+        
+        Returns:
+            CompiledGraph: 컴파일된 LangGraph 객체
+        """
+        mode = mode or settings.GRAPH_MODE
+        if max_concurrency is None:
+            max_concurrency = settings.GRAPH_MAX_CONCURRENCY
+        key = self.make_key(mode, max_concurrency)
+        
+        graph = self._graphs.get(key)
+        if graph is not None:
+            return graph
+        
+        with self._lock:
+            # 다른 스레드가 먼저 컴파일했는지 다시 확인
+            graph = self._graphs.get(key)
+            if graph is None:
+                start = time.perf_counter()
+                graph = build_meeting_minutes_graph(mode=key[0], max_concurrency=key[1])
+                self._compile_times[key] = time.perf_counter() - start
+                self._graphs[key] = graph
+            return graph
+    
+    def warmup(
+        self,
+        modes: Iterable[str] = GRAPH_MODES,
+        max_concurrency: Optional[int] = None
+    ) -> float:
+        """여러 모드를 미리 컴파일
+        
+        Args:
+            modes: 컴파일할 모드 목록
+            max_concurrency: 동시 실행 노드 수 (None이면 settings 값)
+        
+        Returns:
+            float: 전체 소요 시간 (초)
+        """
+        start = time.perf_counter()
+        for mode in modes:
+            self.get(mode, max_concurrency)
+        return time.perf_counter() - start
+    
+    def clear(self):
+        """등록된 그래프 비우기 (설정 변경 후 다시 컴파일할 때)"""
+        with self._lock:
+            self._graphs.clear()
+            self._compile_times.clear()
+    
+    def stats(self) -> dict:
+        """등록된 그래프와 컴파일 시간"""
+        with self._lock:
+            graphs = [
+                {
+                    "mode": mode,
+                    "max_concurrency": max_concurrency,
+                    "compile_ms": round(seconds * 1000, 2),
+                }
+                for (mode, max_concurrency), seconds in self._compile_times.items()
+            ]
+        return {
+            "count": len(graphs),
+            "total_compile_ms": round(sum(g["compile_ms"] for g in graphs), 2),
+            "graphs": graphs,
+        }
+
+
+# 전역 레지스트리
+graph_registry = GraphRegistry()
@@ -1,20 +1,26 @@
 """노드 함수들을 export하는 초기화 파일"""
 from .preprocessing import preprocess_node
 from .summarization import summarize_node
+from .chunking import map_reduce_node
 from .extraction import (
     extract_participants_node,
     extract_agenda_node,
     extract_discussions_node,
     extract_decisions_node,
-    extract_action_items_node
+    extract_action_items_node,
+    extract_batched_node,
+    extract_structured_node
 )
 
 __all__ = [
     "preprocess_node",
     "summarize_node",
+    "map_reduce_node",
     "extract_participants_node",
     "extract_agenda_node",
     "extract_discussions_node",
     "extract_decisions_node",
     "extract_action_items_node",
+    "extract_batched_node",
+    "extract_structured_node",
 ]
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""청크 처리 노드 - 긴 회의록 map-reduce"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from ..core.state_schema import MeetingState, create_initial_state
+from ..core.llm_config import llm_config
+from ..core.prompt_templates import PromptTemplates
+from ..utils.text_utils import chunk_by_speaker
+from config import settings
+
+
+# 청크 병합 시 제외할 대체(placeholder) 값
+PLACEHOLDER_VALUES = {
+    "participants": {"참석자 미상"},
+    "agenda_items": {"안건 내용 없음", "안건 추출 실패"},
+    "decisions": {"특별한 결정 사항 없음", "결정 사항 추출 실패"},
+    "discussions": {"논의 내용", "일반 논의"},
+    "action_items": {"후속 조치 없음", "추출 실패"},
+}
+
+
+def needs_chunking(text: str) -> bool:
+    """대화가 청크 한도를 넘어 map-reduce 처리가 필요한지 확인"""
+    return settings.CHUNK_AUTO and llm_config.count_tokens(text) > settings.CHUNK_MAX_TOKENS
+
+
+def _dedup(items: list, key=lambda item: item) -> list:
+    """순서를 유지하며 중복 제거 (공백 차이는 무시)"""
+    seen = set()
+    result = []
+    for item in items:
+        normalized = " ".join(str(key(item)).split())
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        result.append(item)
+    return result
+
+
+def _without_placeholders(field: str, items: list, key=lambda item: item) -> list:
+    """실제 값이 하나라도 있으면 대체 값 제거"""
+    real = [item for item in items if key(item) not in PLACEHOLDER_VALUES[field]]
+    return real or items[:1]
+
+
+def merge_chunk_results(results: List[dict]) -> dict:
+    """청크별 추출 결과 병합
+    
+    - 참석자: 합집합 (등장 순서 유지)
+    - 안건/결정 사항: 중복 제거 후 병합
+    - 논의 내용: (주제, 내용) 기준 중복 제거 후 병합
+    - 액션 아이템: 순서대로 이어 붙임 (완전히 같은 항목만 제거)
+    
+    Args:
+        results: 청크별 최종 상태 목록
+    
+    Returns:
+        dict: 병합된 상태 필드
+    """
+    def collect(field):
+        return [item for result in results for item in result.get(field, [])]
+    
+    participants = _dedup(collect("participants"))
+    agenda_items = _dedup(collect("agenda_items"))
+    decisions = _dedup(collect("decisions"))
+    discussions = _dedup(
+        collect("discussions"),
+        key=lambda disc: (disc["topic"], disc["content"])
+    )
+    action_items = _dedup(
+        collect("action_items"),
+        key=lambda item: (item["task"], item["assignee"], item["deadline"])
+    )
+    
+    errors = [
+        f"[청크 {idx}] {error}"
+        for idx, result in enumerate(results, 1)
+        for error in result.get("errors", [])
+    ]
+    
+    generation_stats = [
+        {**stats, "chunk": idx}
+        for idx, result in enumerate(results, 1)
+        for stats in result.get("generation_stats", [])
+    ]
+    
+    sources = {result.get("participants_source") for result in results} - {""}
+    
+    return {
+        "participants": _without_placeholders("participants", participants),
+        "participants_source": sources.pop() if len(sources) == 1 else "mixed",
+        "agenda_items": _without_placeholders("agenda_items", agenda_items),
+        "discussions": _without_placeholders(
+            "discussions", discussions, key=lambda disc: disc["topic"]
+        ),
+        "decisions": _without_placeholders("decisions", decisions),
+        "action_items": _without_placeholders(
+            "action_items", action_items, key=lambda item: item["task"]
+        ),
+        "errors": errors,
+        "generation_stats": generation_stats,
+    }
+
+
+def reduce_summaries(summaries: List[str], max_tokens: int = None) -> str:
+    """구간 요약을 계층적으로 통합
+    
+    요약들을 토큰 한도 내 그룹으로 묶어 통합 요약을 만들고,
+    하나가 남을 때까지 반복합니다.
+    
+    Args:
+        summaries: 청크별 요약 목록
+        max_tokens: 한 번에 통합할 요약들의 최대 토큰 수
+    
+    Returns:
+        str: 최종 통합 요약
+    """
+    max_tokens = max_tokens or settings.CHUNK_MAX_TOKENS
+    summaries = [s for s in summaries if s and s != "요약 생성 실패"]
+    
+    if not summaries:
+        return "요약 생성 실패"
+    
+    while len(summaries) > 1:
+        groups = []
+        current = []
+        current_tokens = 0
+        for summary in summaries:
+            tokens = llm_config.count_tokens(summary)
+            if current and current_tokens + tokens > max_tokens:
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            current.append(summary)
+            current_tokens += tokens
+        groups.append(current)
+        
+        # 더 이상 묶을 수 없으면 마지막 단계에서 한꺼번에 통합
+        if len(groups) == len(summaries):
+            groups = [summaries]
+        
+        summaries = [
+            group[0] if len(group) == 1 else llm_config.generate(
+                PromptTemplates.get_summary_reduce_prompt().format(
+                    summaries="\n".join(f"- {summary}" for summary in group)
+                )
+            ).strip()
+            for group in groups
+        ]
+    
+    return summaries[0]
+
+
+def split_transcript(text: str) -> List[str]:
+    """대화를 화자 발언 단위의 청크로 분할 (CHUNK_MAX_TOKENS 기준)"""
+    return chunk_by_speaker(
+        text,
+        max_tokens=settings.CHUNK_MAX_TOKENS,
+        count_tokens=llm_config.count_tokens
+    )
+
+
+def process_chunks(chunks: List[str], title: str, date: str) -> List[dict]:
+    """청크마다 전처리/추출 그래프를 병렬로 실행
+    
+    Args:
+        chunks: 청크 텍스트 목록
+        title: 회의 제목
+        date: 회의 날짜
+    
+    Returns:
+        List[dict]: 청크별 최종 상태 (청크 순서 유지)
+    """
+    from ..graph.registry import graph_registry
+    
+    chunk_mode = settings.CHUNK_GRAPH_MODE
+    if chunk_mode == "chunked":
+        chunk_mode = "parallel"
+    graph = graph_registry.get(chunk_mode)
+    
+    def process_chunk(chunk: str) -> dict:
+        chunk_state = create_initial_state(
+            transcript=chunk,
+            title=title,
+            date=date
+        )
+        return graph.invoke(chunk_state)
+    
+    # 요청 컨텍스트(토큰 스트리밍 콜백 등)를 청크 스레드에도 전달
+    with ThreadPoolExecutor(max_workers=max(1, settings.CHUNK_MAX_WORKERS)) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, process_chunk, chunk)
+            for chunk in chunks
+        ]
+        return [future.result() for future in futures]
+
+
+def map_reduce_node(state: MeetingState) -> dict:
+    """긴 회의록 map-reduce 노드
+    
+    원본 대화를 화자 발언 단위의 청크로 나누고, 청크마다 전처리/추출 그래프를
+    병렬로 실행한 뒤 결과를 병합합니다. 요약은 계층적으로 통합합니다.
+    
+    Args:
+        state: 현재 상태 (raw_transcript 필요)
+    
+    Returns:
+        dict: 병합된 상태 업데이트
+    """
+    chunks = split_transcript(state["raw_transcript"])
+    print(f"\n[Map-Reduce] 대화를 {len(chunks)}개 청크로 분할하여 처리합니다")
+    
+    results = process_chunks(chunks, state["meeting_title"], state["meeting_date"])
+    
+    merged = merge_chunk_results(results)
+    
+    try:
+        summary = reduce_summaries([result.get("summary", "") for result in results])
+    except Exception as e:
+        print(f"✗ 요약 통합 오류: {str(e)}")
+        summary = "\n".join(result.get("summary", "") for result in results)
+        merged["errors"].append(f"요약 통합 오류: {str(e)}")
+    
+    print(
+        f"✓ 청크 병합 완료: 참석자 {len(merged['participants'])}명, "
+        f"안건 {len(merged['agenda_items'])}개, "
+        f"액션 {len(merged['action_items'])}개"
+    )
+    
+    return {
+        **merged,
+        "processed_text": "\n\n".join(result.get("processed_text", "") for result in results),
+        "summary": summary,
+        "current_step": "chunks_merged"
+    }
@@ -2,31 +2,254 @@
 from ..core.state_schema import MeetingState
 from ..core.llm_config import llm_config
 from ..core.prompt_templates import PromptTemplates
+from ..core.generation_profile import GenerationProfile, format_generation_stats
+from .summarization import summarize_node, SUMMARY_PROFILE
+from ..utils.text_utils import extract_speakers, truncate_text
+from config import settings
 import json
 
 
+# 한 줄에 하나씩 생성하는 레코드의 JSON 스키마 (제약 디코딩과 프롬프트 형식이 같음)
+DISCUSSION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string"},
+        "content": {"type": "string"},
+    },
+    "required": ["topic", "content"],
+}
+
+ACTION_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "task": {"type": "string"},
+        "assignee": {"type": "string"},
+        "deadline": {"type": "string"},
+    },
+    "required": ["task", "assignee", "deadline"],
+}
+
+# 논의 내용 파싱 실패 시 요약 대신 쓰는 대화 앞부분 길이 (글자)
+DISCUSSION_FALLBACK_CHARS = 300
+
+
+# 필드별 생성 프로필 (개별 노드와 배치 추출에서 공통 사용)
+# - 참석자: 쉼표로 구분된 한 줄이므로 줄바꿈에서 종료
+# - 논의/액션 아이템: 한 줄에 JSON 하나, 빈 줄이나 코드 블록 끝이 나오면 목록이 끝난 것으로 봄
+#   (CONSTRAINED_DECODING이 켜져 있으면 스키마에 맞는 JSON 줄만 생성)
+GENERATION_PROFILES = {
+    "participants": GenerationProfile(
+        "participants",
+        max_new_tokens=64,
+        stop_sequences=("\n",)
+    ),
+    "summary": SUMMARY_PROFILE,
+    "agenda_items": GenerationProfile(
+        "agenda_items",
+        max_new_tokens=256,
+        min_new_tokens=64,
+        input_ratio=0.15
+    ),
+    "discussions": GenerationProfile(
+        "discussions",
+        max_new_tokens=1024,
+        min_new_tokens=128,
+        input_ratio=0.5,
+        stop_sequences=("\n\n", "\n```"),
+        json_schema=DISCUSSION_SCHEMA,
+        speculative=True
+    ),
+    "decisions": GenerationProfile(
+        "decisions",
+        max_new_tokens=256,
+        min_new_tokens=64,
+        input_ratio=0.15
+    ),
+    "action_items": GenerationProfile(
+        "action_items",
+        max_new_tokens=768,
+        min_new_tokens=96,
+        input_ratio=0.3,
+        stop_sequences=("\n\n", "\n```"),
+        json_schema=ACTION_ITEM_SCHEMA,
+        speculative=True
+    ),
+    "structured": GenerationProfile(
+        "structured",
+        max_new_tokens=2048,
+        min_new_tokens=256,
+        input_ratio=1.0,
+        stop_sequences=("\n```",),
+        speculative=True
+    ),
+}
+
+
+def parse_participants(response: str) -> list:
+    """참석자 응답 파싱 (쉼표 구분)"""
+    participants = [p.strip() for p in response.split(",") if p.strip()]
+    
+    if not participants:
+        participants = ["참석자 미상"]
+    
+    return participants
+
+
+def parse_agenda(response: str) -> list:
+    """안건 응답 파싱 (한 줄에 하나)"""
+    agenda_items = [
+        item.strip()
+        for item in response.split("\n")
+        if item.strip() and not item.strip().startswith(("안건", "형식", "예시"))
+    ]
+    
+    if not agenda_items:
+        agenda_items = ["안건 내용 없음"]
+    
+    return agenda_items
+
+
+def discussion_fallback(state: MeetingState, summary: str = "") -> str:
+    """논의 내용 파싱 실패 시 넣을 본문
+    
+    요약이 있으면 요약을, 없으면 대화 앞부분을 사용합니다. parallel 모드에서는
+    요약 노드가 동시에 실행되므로 state의 summary가 항상 비어 있습니다.
+    """
+    summary = summary or state.get("summary", "")
+    if summary and summary != "요약 생성 실패":
+        return summary
+    return truncate_text(state.get("processed_text", ""), DISCUSSION_FALLBACK_CHARS)
+
+
+def parse_discussions(response: str, fallback: str = "") -> list:
+    """논의 내용 응답 파싱 (한 줄에 JSON 하나, 파싱 결과가 없으면 fallback을 본문으로)"""
+    discussions = []
+    
+    for line in response.split("\n"):
+        line = line.strip()
+        if line and line.startswith("{"):
+            try:
+                disc = json.loads(line)
+                if "topic" in disc and "content" in disc:
+                    discussions.append({
+                        "topic": disc["topic"],
+                        "content": disc["content"]
+                    })
+            except json.JSONDecodeError:
+                continue
+    
+    if not discussions:
+        discussions = [{
+            "topic": "일반 논의",
+            "content": fallback or "논의 내용 추출 실패"
+        }]
+    
+    return discussions
+
+
+def parse_decisions(response: str) -> list:
+    """결정 사항 응답 파싱 (한 줄에 하나)"""
+    decisions = [
+        dec.strip()
+        for dec in response.split("\n")
+        if dec.strip() and not dec.strip().startswith(("결정", "지침", "예시"))
+    ]
+    
+    if not decisions:
+        decisions = ["특별한 결정 사항 없음"]
+    
+    return decisions
+
+
+def parse_action_items(response: str) -> list:
+    """액션 아이템 응답 파싱 (한 줄에 JSON 하나)"""
+    action_items = []
+    
+    for line in response.split("\n"):
+        line = line.strip()
+        if line and line.startswith("{"):
+            try:
+                action = json.loads(line)
+                if "task" in action:
+                    action_items.append({
+                        "task": action.get("task", ""),
+                        "assignee": action.get("assignee", "미지정"),
+                        "deadline": action.get("deadline", "미정")
+                    })
+            except json.JSONDecodeError:
+                continue
+    
+    if not action_items:
+        action_items = [{
+            "task": "후속 조치 없음",
+            "assignee": "-",
+            "deadline": "-"
+        }]
+    
+    return action_items
+
+
+def rule_based_participants(state: MeetingState):
+    """화자 표기로 참석자 추출 (규칙 기반 빠른 경로)
+    
+    원본 대화의 "이름: 발언" 형식에서 화자를 추출합니다. 화자 표기가 없거나
+    신뢰도가 PARTICIPANTS_MIN_CONFIDENCE보다 낮으면 None을 반환하여
+    LLM 추출을 사용하도록 합니다.
+    
+    Returns:
+        Optional[list]: 참석자 목록 또는 None
+    """
+    if not settings.PARTICIPANTS_RULE_BASED:
+        return None
+    
+    speakers, confidence = extract_speakers(state["raw_transcript"])
+    if not speakers or confidence < settings.PARTICIPANTS_MIN_CONFIDENCE:
+        print(f"  - 화자 표기 신뢰도 낮음 ({confidence:.2f}), LLM으로 추출합니다")
+        return None
+    
+    return speakers
+
+
 def extract_participants_node(state: MeetingState) -> dict:
-    """참석자 추출 노드"""
+    """참석자 추출 노드
+    
+    화자 표기로 참석자를 확정할 수 있으면 LLM을 호출하지 않고,
+    그렇지 않을 때만 LLM으로 추출합니다. 사용한 경로는
+    participants_source ("rule" / "llm")에 기록합니다.
+    """
     print("\n[Step 3/7] 참석자 추출 중...")
     
+    participants = rule_based_participants(state)
+    if participants:
+        print(f"✓ 참석자 추출 완료 (화자 표기): {', '.join(participants)}")
+        return {
+            "participants": participants,
+            "participants_source": "rule",
+            "current_step": "participants_extracted"
+        }
+    
     try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_participant_extraction_prompt().format(
             text=state["processed_text"]
         )
         
         # HuggingFace 모델로 생성
-        response = llm_config.generate(prompt)
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["participants"]
+        )
         
         # 쉼표로 분리하여 리스트로 변환
-        participants = [p.strip() for p in response.split(",") if p.strip()]
-        
-        if not participants:
-            participants = ["참석자 미상"]
+        participants = parse_participants(response)
         
-        print(f"✓ 참석자 추출 완료: {', '.join(participants)}")
+        print(f"✓ 참석자 추출 완료: {', '.join(participants)} ({format_generation_stats(stats)})")
         
         return {
             "participants": participants,
+            "participants_source": "llm",
+            "generation_stats": [stats],
             "current_step": "participants_extracted"
         }
     
@@ -34,6 +257,7 @@ def extract_participants_node(state: MeetingState) -> dict:
         print(f"✗ 참석자 추출 오류: {str(e)}")
         return {
             "participants": ["참석자 미상"],
+            "participants_source": "llm",
             "errors": [f"참석자 추출 오류: {str(e)}"],
             "current_step": "participants_extracted"
         }
@@ -44,27 +268,26 @@ def extract_agenda_node(state: MeetingState) -> dict:
     print("\n[Step 4/7] 안건 추출 중...")
     
     try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_agenda_extraction_prompt().format(
             text=state["processed_text"]
         )
         
-        response = llm_config.generate(prompt)
-        
-        agenda_items = [
-            item.strip()
-            for item in response.split("\n")
-            if item.strip() and not item.strip().startswith(("안건", "형식", "예시"))
-        ]
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["agenda_items"]
+        )
         
-        if not agenda_items:
-            agenda_items = ["안건 내용 없음"]
+        agenda_items = parse_agenda(response)
         
-        print(f"✓ 안건 추출 완료: {len(agenda_items)}개 안건")
+        print(f"✓ 안건 추출 완료: {len(agenda_items)}개 안건 ({format_generation_stats(stats)})")
         for idx, agenda in enumerate(agenda_items, 1):
             print(f"  {idx}. {agenda}")
         
         return {
             "agenda_items": agenda_items,
+            "generation_stats": [stats],
             "current_step": "agenda_extracted"
         }
     
@@ -82,38 +305,25 @@ def extract_discussions_node(state: MeetingState) -> dict:
     print("\n[Step 5/7] 논의 내용 추출 중...")
     
     try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_discussion_extraction_prompt().format(
             text=state["processed_text"]
         )
         
-        response = llm_config.generate(prompt)
-        discussions = []
-        
-        for line in response.split("\n"):
-            line = line.strip()
-            if line and line.startswith("{"):
-                try:
-                    disc = json.loads(line)
-                    if "topic" in disc and "content" in disc:
-                        discussions.append({
-                            "topic": disc["topic"],
-                            "content": disc["content"]
-                        })
-                except json.JSONDecodeError:
-                    continue
-        
-        if not discussions:
-            discussions = [{
-                "topic": "일반 논의",
-                "content": state.get("summary", "논의 내용 추출 실패")
-            }]
-        
-        print(f"✓ 논의 내용 추출 완료: {len(discussions)}개 논의")
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["discussions"]
+        )
+        discussions = parse_discussions(response, discussion_fallback(state))
+        
+        print(f"✓ 논의 내용 추출 완료: {len(discussions)}개 논의 ({format_generation_stats(stats)})")
         for idx, disc in enumerate(discussions, 1):
             print(f"  {idx}. {disc['topic']}")
         
         return {
             "discussions": discussions,
+            "generation_stats": [stats],
             "current_step": "discussions_extracted"
         }
     
@@ -131,27 +341,26 @@ def extract_decisions_node(state: MeetingState) -> dict:
     print("\n[Step 6/7] 결정 사항 추출 중...")
     
     try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_decision_extraction_prompt().format(
             text=state["processed_text"]
         )
         
-        response = llm_config.generate(prompt)
-        
-        decisions = [
-            dec.strip()
-            for dec in response.split("\n")
-            if dec.strip() and not dec.strip().startswith(("결정", "지침", "예시"))
-        ]
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["decisions"]
+        )
         
-        if not decisions:
-            decisions = ["특별한 결정 사항 없음"]
+        decisions = parse_decisions(response)
         
-        print(f"✓ 결정 사항 추출 완료: {len(decisions)}개 결정")
+        print(f"✓ 결정 사항 추출 완료: {len(decisions)}개 결정 ({format_generation_stats(stats)})")
         for idx, decision in enumerate(decisions, 1):
             print(f"  {idx}. {decision}")
         
         return {
             "decisions": decisions,
+            "generation_stats": [stats],
             "current_step": "decisions_extracted"
         }
     
@@ -169,40 +378,25 @@ def extract_action_items_node(state: MeetingState) -> dict:
     print("\n[Step 7/7] 액션 아이템 추출 중...")
     
     try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_action_item_extraction_prompt().format(
             text=state["processed_text"]
         )
         
-        response = llm_config.generate(prompt)
-        action_items = []
-        
-        for line in response.split("\n"):
-            line = line.strip()
-            if line and line.startswith("{"):
-                try:
-                    action = json.loads(line)
-                    if "task" in action:
-                        action_items.append({
-                            "task": action.get("task", ""),
-                            "assignee": action.get("assignee", "미지정"),
-                            "deadline": action.get("deadline", "미정")
-                        })
-                except json.JSONDecodeError:
-                    continue
-        
-        if not action_items:
-            action_items = [{
-                "task": "후속 조치 없음",
-                "assignee": "-",
-                "deadline": "-"
-            }]
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["action_items"]
+        )
+        action_items = parse_action_items(response)
         
-        print(f"✓ 액션 아이템 추출 완료: {len(action_items)}개 과제")
+        print(f"✓ 액션 아이템 추출 완료: {len(action_items)}개 과제 ({format_generation_stats(stats)})")
         for idx, item in enumerate(action_items, 1):
             print(f"  {idx}. {item['task']} (담당: {item['assignee']}, 마감: {item['deadline']})")
         
         return {
             "action_items": action_items,
+            "generation_stats": [stats],
             "current_step": "action_items_extracted"
         }
     
@@ -217,3 +411,233 @@ def extract_action_items_node(state: MeetingState) -> dict:
             "errors": [f"액션 아이템 추출 오류: {str(e)}"],
             "current_step": "action_items_extracted"
         }
+
+
+def extract_batched_node(state: MeetingState) -> dict:
+    """배치 추출 노드
+    
+    요약과 5개 추출 프롬프트를 llm_config.generate_batch로 한 번에 생성한 뒤
+    필드별 파서로 결과를 채웁니다. 배치 호출이 실패하면 개별 노드로 처리합니다.
+    """
+    print("\n[Step 2/2] 요약 및 정보 일괄 추출 중...")
+    
+    text = state["processed_text"]
+    templates = {
+        "participants": PromptTemplates.get_participant_extraction_prompt(),
+        "summary": PromptTemplates.get_summary_prompt(),
+        "agenda_items": PromptTemplates.get_agenda_extraction_prompt(),
+        "discussions": PromptTemplates.get_discussion_extraction_prompt(),
+        "decisions": PromptTemplates.get_decision_extraction_prompt(),
+        "action_items": PromptTemplates.get_action_item_extraction_prompt(),
+    }
+    
+    # 화자 표기로 참석자를 확정할 수 있으면 배치에서 제외
+    rule_participants = rule_based_participants(state)
+    if rule_participants:
+        del templates["participants"]
+    fields = list(templates)
+    
+    try:
+        responses, stats = llm_config.generate_batch_with_stats(
+            [templates[field].format(text=text) for field in fields],
+            [{"profile": GENERATION_PROFILES[field]} for field in fields]
+        )
+    except Exception as e:
+        print(f"✗ 배치 추출 오류, 개별 추출로 전환: {str(e)}")
+        result = {"errors": [f"배치 추출 오류: {str(e)}"], "generation_stats": []}
+        for node in (
+            extract_participants_node,
+            summarize_node,
+            extract_agenda_node,
+            extract_discussions_node,
+            extract_decisions_node,
+            extract_action_items_node,
+        ):
+            update = node(state)
+            result["errors"] += update.pop("errors", [])
+            result["generation_stats"] += update.pop("generation_stats", [])
+            result.update(update)
+        result["current_step"] = "batch_extracted"
+        return result
+    
+    response = dict(zip(fields, responses))
+    summary = response["summary"].strip() or "요약 생성 실패"
+    
+    result = {
+        "participants": rule_participants or parse_participants(response["participants"]),
+        "participants_source": "rule" if rule_participants else "llm",
+        "summary": summary,
+        "agenda_items": parse_agenda(response["agenda_items"]),
+        "discussions": parse_discussions(response["discussions"], discussion_fallback(state, summary)),
+        "decisions": parse_decisions(response["decisions"]),
+        "action_items": parse_action_items(response["action_items"]),
+        "generation_stats": stats,
+        "current_step": "batch_extracted"
+    }
+    
+    print(
+        f"✓ 일괄 추출 완료: 참석자 {len(result['participants'])}명, "
+        f"안건 {len(result['agenda_items'])}개, "
+        f"논의 {len(result['discussions'])}개, "
+        f"결정 {len(result['decisions'])}개, "
+        f"액션 {len(result['action_items'])}개"
+    )
+    for field, field_stats in zip(fields, stats):
+        print(f"  - {field}: {format_generation_stats(field_stats)}")
+    
+    return result
+
+
+def parse_structured_response(response: str) -> tuple[dict, list]:
+    """단일 패스 JSON 응답 파싱
+    
+    응답에서 JSON 객체를 찾아 필드별로 검증합니다. 형식이 올바른 필드만
+    결과에 포함하고, 누락되었거나 형식이 틀린 필드는 실패 목록에 담습니다.
+    
+    Args:
+        response: 모델 응답 (JSON 객체)
+    
+    Returns:
+        tuple: (파싱된 필드 딕셔너리, 실패한 필드 목록)
+    """
+    fields = ["summary", "participants", "agenda_items", "discussions", "decisions", "action_items"]
+    
+    start = response.find("{")
+    end = response.rfind("}")
+    try:
+        data = json.loads(response[start:end + 1]) if 0 <= start < end else None
+    except json.JSONDecodeError:
+        data = None
+    
+    if not isinstance(data, dict):
+        return {}, fields
+    
+    def string_list(value):
+        if isinstance(value, str):
+            value = value.split(",")
+        if not isinstance(value, list):
+            return None
+        items = [str(item).strip() for item in value if str(item).strip()]
+        return items
+    
+    parsed = {}
+    
+    summary = data.get("summary")
+    if isinstance(summary, str) and summary.strip():
+        parsed["summary"] = summary.strip()
+    
+    participants = string_list(data.get("participants"))
+    if participants:
+        parsed["participants"] = participants
+    
+    agenda_items = string_list(data.get("agenda_items"))
+    if agenda_items is not None:
+        parsed["agenda_items"] = agenda_items or ["안건 내용 없음"]
+    
+    discussions = data.get("discussions")
+    if isinstance(discussions, list):
+        discussions = [
+            {"topic": str(disc["topic"]), "content": str(disc["content"])}
+            for disc in discussions
+            if isinstance(disc, dict) and "topic" in disc and "content" in disc
+        ]
+        if discussions:
+            parsed["discussions"] = discussions
+    
+    decisions = string_list(data.get("decisions"))
+    if decisions is not None:
+        parsed["decisions"] = decisions or ["특별한 결정 사항 없음"]
+    
+    action_items = data.get("action_items")
+    if isinstance(action_items, list):
+        parsed["action_items"] = [
+            {
+                "task": str(action.get("task", "")),
+                "assignee": str(action.get("assignee") or "미지정"),
+                "deadline": str(action.get("deadline") or "미정")
+            }
+            for action in action_items
+            if isinstance(action, dict) and action.get("task")
+        ] or [{"task": "후속 조치 없음", "assignee": "-", "deadline": "-"}]
+    
+    failed = [field for field in fields if field not in parsed]
+    return parsed, failed
+
+
+def extract_structured_node(state: MeetingState) -> dict:
+    """단일 패스 구조화 추출 노드
+    
+    요약, 참석자, 안건, 논의 내용, 결정 사항, 액션 아이템을 하나의 JSON
+    응답으로 생성하여 LLM 호출을 한 번으로 줄입니다. 파싱에 실패한
+    필드만 기존 개별 노드로 다시 추출합니다.
+    """
+    print("\n[Step 2/2] 구조화 정보 일괄 추출 중...")
+    
+    try:
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
+        prompt = PromptTemplates.get_structured_extraction_prompt().format(
+            text=state["processed_text"]
+        )
+        
+        response, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES["structured"]
+        )
+        print(f"  - {format_generation_stats(stats)}")
+        result, failed = parse_structured_response(response)
+        result["participants_source"] = "llm"
+        errors = []
+        generation_stats = [stats]
+    
+    except Exception as e:
+        print(f"✗ 구조화 추출 오류: {str(e)}")
+        result, failed = {}, list(STRUCTURED_FALLBACK_NODES)
+        errors = [f"구조화 추출 오류: {str(e)}"]
+        generation_stats = []
+    
+    # 화자 표기 기반 참석자가 있으면 우선 사용
+    rule_participants = rule_based_participants(state)
+    if rule_participants:
+        result["participants"] = rule_participants
+        result["participants_source"] = "rule"
+        failed = [field for field in failed if field != "participants"]
+    
+    # 파싱 실패 필드만 개별 노드로 재추출
+    if failed:
+        print(f"  - 개별 추출로 보완: {', '.join(failed)}")
+        fallback_state = {**state, "summary": result.get("summary", state.get("summary", ""))}
+        for field in failed:
+            update = STRUCTURED_FALLBACK_NODES[field](fallback_state)
+            errors += update.get("errors", [])
+            generation_stats += update.get("generation_stats", [])
+            result[field] = update.get(field)
+            if field == "participants":
+                result["participants_source"] = update.get("participants_source", "llm")
+            fallback_state[field] = result[field]
+    
+    print(
+        f"✓ 구조화 추출 완료: 참석자 {len(result['participants'])}명, "
+        f"안건 {len(result['agenda_items'])}개, "
+        f"논의 {len(result['discussions'])}개, "
+        f"결정 {len(result['decisions'])}개, "
+        f"액션 {len(result['action_items'])}개"
+    )
+    
+    result["current_step"] = "structured_extracted"
+    result["generation_stats"] = generation_stats
+    if errors:
+        result["errors"] = errors
+    
+    return result
+
+
+# 단일 패스 파싱 실패 시 필드별 대체 노드
+STRUCTURED_FALLBACK_NODES = {
+    "summary": summarize_node,
+    "participants": extract_participants_node,
+    "agenda_items": extract_agenda_node,
+    "discussions": extract_discussions_node,
+    "decisions": extract_decisions_node,
+    "action_items": extract_action_items_node,
+}
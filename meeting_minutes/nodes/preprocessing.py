@@ -2,42 +2,88 @@
 from ..core.state_schema import MeetingState
 from ..core.llm_config import llm_config
 from ..core.prompt_templates import PromptTemplates
+from ..core.generation_profile import GenerationProfile, format_generation_stats
+from ..utils.text_utils import preprocess_transcript, format_turns
+from config import settings
+
+
+# 전처리 모드
+PREPROCESS_MODES = ("rule", "polish", "llm")
+
+# 전처리 생성 프로필 (정제된 대화 전체를 다시 쓰므로 입력과 비슷한 길이, 추측 디코딩 대상)
+PREPROCESS_PROFILE = GenerationProfile(
+    "preprocess",
+    max_new_tokens=2048,
+    min_new_tokens=256,
+    input_ratio=1.2,
+    speculative=True
+)
+
+
+def rule_based_preprocess(transcript: str) -> str:
+    """규칙 기반 전처리 (LLM 호출 없음)
+    
+    간투사와 반복을 제거하고 화자 라벨을 정규화한 "화자: 발언" 줄 목록을 만듭니다.
+    정리 결과가 비면 원본을 그대로 반환합니다.
+    """
+    return format_turns(preprocess_transcript(transcript)) or transcript.strip()
 
 
 def preprocess_node(state: MeetingState) -> dict:
     """텍스트 전처리 노드
     
-    원본 회의 대화 내용을 정제하고 구조화합니다.
+    PREPROCESS_MODE에 따라 원본 회의 대화 내용을 정제합니다.
+    - rule: 규칙 기반 정리만 수행 (출력 토큰 생성 없음)
+    - polish: 규칙 기반으로 정리한 텍스트를 LLM이 다듬음
+    - llm: 원본 전체를 LLM이 재작성
     
     Args:
         state: 현재 상태 (raw_transcript 필요)
     
     Returns:
-        dict: 업데이트할 상태 (processed_text, current_step)
+        dict: 업데이트할 상태 (processed_text, generation_stats, current_step)
     """
     print("\n[Step 1/7] 텍스트 전처리 중...")
     
+    mode = settings.PREPROCESS_MODE
+    transcript = state["raw_transcript"]
+    
     try:
+        if mode != "llm":
+            transcript = rule_based_preprocess(transcript)
+            if mode == "rule":
+                print(f"✓ 전처리 완료 (규칙 기반, 처리된 텍스트 길이: {len(transcript)} 자)")
+                return {
+                    "processed_text": transcript,
+                    "current_step": "preprocessed"
+                }
+        
         # 프롬프트 생성
         prompt = PromptTemplates.get_preprocessing_prompt().format(
-            transcript=state["raw_transcript"]
+            transcript=transcript
         )
         
         # HuggingFace 모델로 생성
-        processed_text = llm_config.generate(prompt)
+        processed_text, stats = llm_config.generate_with_stats(
+            prompt, profile=PREPROCESS_PROFILE
+        )
         
-        print(f"✓ 전처리 완료 (처리된 텍스트 길이: {len(processed_text)} 자)")
+        print(
+            f"✓ 전처리 완료 ({mode}, 처리된 텍스트 길이: {len(processed_text)} 자, "
+            f"{format_generation_stats(stats)})"
+        )
         
         return {
             "processed_text": processed_text.strip(),
+            "generation_stats": [stats],
             "current_step": "preprocessed"
         }
     
     except Exception as e:
         print(f"✗ 전처리 오류 발생: {str(e)}")
-        # 오류 시 원본 텍스트 사용
+        # 오류 시 원본(또는 규칙 기반으로 정리한) 텍스트 사용
         return {
-            "processed_text": state["raw_transcript"],
+            "processed_text": transcript,
             "errors": [f"전처리 오류: {str(e)}"],
             "current_step": "preprocessed"
         }
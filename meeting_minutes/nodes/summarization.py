@@ -2,6 +2,16 @@
 from ..core.state_schema import MeetingState
 from ..core.llm_config import llm_config
 from ..core.prompt_templates import PromptTemplates
+from ..core.generation_profile import GenerationProfile, format_generation_stats
+
+
+# 요약 생성 프로필 (3-5문장이므로 입력 길이에 비례하되 512 토큰 이내)
+SUMMARY_PROFILE = GenerationProfile(
+    "summary",
+    max_new_tokens=512,
+    min_new_tokens=128,
+    input_ratio=0.3
+)
 
 
 def summarize_node(state: MeetingState) -> dict:
@@ -13,23 +23,29 @@ def summarize_node(state: MeetingState) -> dict:
         state: 현재 상태 (processed_text 필요)
     
     Returns:
-        dict: 업데이트할 상태 (summary, current_step)
+        dict: 업데이트할 상태 (summary, generation_stats, current_step)
     """
     print("\n[Step 2/7] 회의 내용 요약 중...")
     
     try:
         # 프롬프트 생성
+        prefix = PromptTemplates.get_transcript_prefix().format(
+            text=state["processed_text"]
+        )
         prompt = PromptTemplates.get_summary_prompt().format(
             text=state["processed_text"]
         )
         
         # HuggingFace 모델로 생성
-        summary = llm_config.generate(prompt)
+        summary, stats = llm_config.generate_with_stats(
+            prompt, prefix=prefix, profile=SUMMARY_PROFILE
+        )
         
-        print(f"✓ 요약 완료 (요약 길이: {len(summary)} 자)")
+        print(f"✓ 요약 완료 (요약 길이: {len(summary)} 자, {format_generation_stats(stats)})")
         
         return {
             "summary": summary.strip(),
+            "generation_stats": [stats],
             "current_step": "summarized"
         }
     
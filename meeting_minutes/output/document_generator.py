@@ -1,8 +1,9 @@
-"""Word 문서 생성 모듈 - 회의록을 Word 파일로 출력"""
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml.ns import qn
+"""Word 문서 생성 모듈 - 회의록을 Word 파일로 출력
+
+python-docx는 문서를 만들 때 처음 import합니다 (서버 시작 시간 단축).
+"""
+from pathlib import Path
+
 from ..core.state_schema import MeetingState
 
 
@@ -14,11 +15,16 @@ class MeetingMinutesDocGenerator:
     
     def __init__(self):
         """문서 생성기 초기화"""
+        from docx import Document
+        
         self.doc = Document()
         self._setup_styles()
     
     def _setup_styles(self):
         """문서 스타일 설정 - 한글 폰트 지원"""
+        from docx.oxml.ns import qn
+        from docx.shared import Pt
+        
         # Normal 스타일 설정
         style = self.doc.styles['Normal']
         font = style.font
@@ -34,6 +40,10 @@ class MeetingMinutesDocGenerator:
         Args:
             title: 회의 제목
         """
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+        from docx.oxml.ns import qn
+        from docx.shared import Pt
+        
         heading = self.doc.add_heading(title, level=0)
         heading.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
         
@@ -52,6 +62,9 @@ class MeetingMinutesDocGenerator:
             title: 섹션 제목
             level: 제목 레벨 (1-3)
         """
+        from docx.oxml.ns import qn
+        from docx.shared import RGBColor
+        
         heading = self.doc.add_heading(title, level=level)
         
         # 섹션 제목 폰트 설정
@@ -70,6 +83,8 @@ class MeetingMinutesDocGenerator:
         Returns:
             Paragraph: 추가된 문단 객체
         """
+        from docx.oxml.ns import qn
+        
         para = self.doc.add_paragraph(text)
         
         # 폰트 설정
@@ -87,6 +102,8 @@ class MeetingMinutesDocGenerator:
         Args:
             items: 리스트 항목들
         """
+        from docx.oxml.ns import qn
+        
         for item in items:
             para = self.doc.add_paragraph(str(item), style='List Bullet')
             # 폰트 설정
@@ -104,6 +121,8 @@ class MeetingMinutesDocGenerator:
         Returns:
             Table: 추가된 테이블 객체
         """
+        from docx.oxml.ns import qn
+        
         table = self.doc.add_table(rows=1, cols=len(headers))
         table.style = 'Light Grid Accent 1'
         
@@ -195,7 +214,8 @@ class MeetingMinutesDocGenerator:
                 ]
                 self._add_table(headers, rows)
         
-        # 8. 문서 저장
+        # 8. 문서 저장 (출력 디렉토리는 여기서 처음 생성)
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         self.doc.save(output_path)
         print(f"✓ 회의록 생성 완료: {output_path}")
         
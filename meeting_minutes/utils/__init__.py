@@ -1,11 +1,25 @@
 """유틸리티 함수 모듈"""
-from .text_utils import clean_text, split_by_speaker, extract_names
+from .text_utils import (
+    clean_text,
+    split_by_speaker,
+    split_turns,
+    extract_names,
+    extract_speakers,
+    chunk_by_speaker,
+    preprocess_transcript,
+    format_turns
+)
 from .validators import validate_transcript, validate_date_format
 
 __all__ = [
     "clean_text",
     "split_by_speaker",
+    "split_turns",
     "extract_names",
+    "extract_speakers",
+    "chunk_by_speaker",
+    "preprocess_transcript",
+    "format_turns",
     "validate_transcript",
     "validate_date_format",
 ]
\ No newline at end of file
@@ -21,12 +21,14 @@ def dict_to_meeting_state(data: Dict[str, Any]) -> MeetingState:
         "processed_text": data.get("processed_text", ""),
         "summary": data.get("summary", ""),
         "participants": data.get("participants", []),
+        "participants_source": data.get("participants_source", ""),
         "agenda_items": data.get("agenda_items", []),
         "discussions": data.get("discussions", []),
         "decisions": data.get("decisions", []),
         "action_items": data.get("action_items", []),
         "current_step": data.get("current_step", "initialized"),
-        "errors": data.get("errors", [])
+        "errors": data.get("errors", []),
+        "generation_stats": data.get("generation_stats", [])
     }
 
 
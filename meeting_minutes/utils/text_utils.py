@@ -1,6 +1,6 @@
 """텍스트 처리 유틸리티 함수"""
 import re
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
 def clean_text(text: str) -> str:
@@ -24,8 +24,67 @@ def clean_text(text: str) -> str:
     return text
 
 
+# 줄 맨 앞의 화자 표기 ("이름:" 또는 "이름님:", "http://" 같은 URL은 제외)
+_SPEAKER_TAG_PATTERN = re.compile(r'[ \t]*([가-힣a-zA-Z]+(?:님)?)[ \t]*:(?!//)[ \t]*')
+
+
+def _turn_spans(text: str) -> List[Tuple[str, int, int, int]]:
+    """원본 텍스트를 빈틈없이 덮는 발언 구간 목록
+    
+    줄 맨 앞의 "이름:"만 화자 표기로 보고, 빈 줄이 나올 때까지 이어지는 줄은 같은
+    발언으로 봅니다. 화자 표기가 없는 줄은 화자 없는 발언(화자 "")이 되고, 빈 줄은
+    앞 발언 구간에 포함합니다. 구간을 순서대로 이으면 원본 텍스트와 같습니다.
+    
+    Args:
+        text: 회의 대화 텍스트
+    
+    Returns:
+        List[Tuple[str, int, int, int]]: (화자, 구간 시작, 발언 시작, 구간 끝) 목록
+    """
+    spans = []
+    continues = False
+    position = 0
+    for line in text.splitlines(keepends=True):
+        start, position = position, position + len(line)
+        match = _SPEAKER_TAG_PATTERN.match(line)
+        if match:
+            spans.append([match.group(1), start, start + match.end(), position])
+            continues = True
+        elif not line.strip():
+            if spans:
+                spans[-1][3] = position
+            else:
+                spans.append(["", start, start, position])
+            continues = False
+        elif continues:
+            spans[-1][3] = position
+        else:
+            spans.append(["", start, start, position])
+    return [tuple(span) for span in spans]
+
+
+def split_turns(text: str) -> List[Tuple[str, str]]:
+    """화자별로 발언 분리 (화자 표기가 없는 텍스트 포함)
+    
+    줄 맨 앞의 "이름:"만 화자 표기로 봅니다. 첫 화자 표기 앞의 텍스트나 빈 줄 뒤의
+    화자 표기 없는 줄은 화자가 빈 문자열인 발언으로 남기므로 원본 내용이 빠지지 않습니다.
+    
+    Args:
+        text: 회의 대화 텍스트
+    
+    Returns:
+        List[Tuple[str, str]]: (화자, 발언) 튜플 리스트 (화자 표기가 없으면 화자는 "")
+    """
+    result = []
+    for speaker, _, body_start, end in _turn_spans(text):
+        content = clean_text(text[body_start:end])
+        if content or speaker:
+            result.append((speaker.replace('님', '').strip(), content))
+    return result
+
+
 def split_by_speaker(text: str) -> List[Tuple[str, str]]:
-    """화자별로 발언 분리
+    """화자별로 발언 분리 (줄 맨 앞에 "이름:" 또는 "이름님:" 표기가 있는 발언만)
     
     Args:
         text: 회의 대화 텍스트
@@ -33,20 +92,176 @@ def split_by_speaker(text: str) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: (화자, 발언) 튜플 리스트
     """
-    # 패턴: "이름:" 또는 "이름님:" 형식
-    pattern = r'([가-힣a-zA-Z]+(?:님)?)\s*:\s*([^\n]+(?:\n(?![가-힣a-zA-Z]+(?:님)?\s*:)[^\n]+)*)'
+    return [(speaker, content) for speaker, content in split_turns(text) if speaker]
+
+
+# 화자 표기에 붙는 직급/호칭
+SPEAKER_TITLES = (
+    "본부장", "팀장", "실장", "부장", "차장", "과장", "대리", "주임", "사원",
+    "이사", "상무", "전무", "사장", "대표", "책임", "선임", "수석", "매니저", "인턴"
+)
+SPEAKER_HONORIFICS = ("님", "씨")
+
+# 화자가 아닌 "단어:" 형식 라벨
+NON_SPEAKER_LABELS = {
+    "회의", "안건", "참석자", "참석", "일시", "장소", "주제", "참고", "비고",
+    "결론", "요약", "시간", "날짜", "예시", "결정", "형식", "메모", "제목"
+}
+
+
+def normalize_speaker_name(label: str) -> str:
+    """화자 라벨에서 호칭을 정리하여 참석자 이름으로 변환
     
-    matches = re.findall(pattern, text)
+    - 호칭(님, 씨)은 제거
+    - "김철수대리", "김철수 과장"처럼 이름이 있으면 직급을 제외한 이름만 사용
+    - "김대리"처럼 성 + 직급만 있으면 그대로 사용 (이름을 알 수 없음)
     
-    result = []
-    for speaker, content in matches:
-        speaker = speaker.replace('님', '').strip()
-        content = clean_text(content)
-        result.append((speaker, content))
+    Args:
+        label: 화자 라벨 (예: "이과장님")
+    
+    Returns:
+        str: 정리된 이름 (예: "이과장")
+    """
+    name = label.strip()
+    for honorific in SPEAKER_HONORIFICS:
+        if name.endswith(honorific) and len(name) > len(honorific) + 1:
+            name = name[:-len(honorific)].strip()
+    
+    for title in SPEAKER_TITLES:
+        if name.endswith(title):
+            base = name[:-len(title)].strip()
+            if len(base) >= 2:
+                return base
+            return base + title
+    
+    return name
+
+
+def extract_speakers(text: str) -> Tuple[List[str], float]:
+    """화자 표기("이름: 발언")로부터 참석자 목록 추출
     
+    split_by_speaker 결과의 화자 라벨을 정리하여 등장 순서대로 반환합니다.
+    신뢰도는 화자 표기가 있는 발언이 전체 텍스트에서 차지하는 비율로,
+    화자 표기가 없거나 일부만 있으면 낮아집니다.
+    
+    Args:
+        text: 회의 대화 텍스트
+    
+    Returns:
+        Tuple[List[str], float]: (참석자 목록, 신뢰도 0.0~1.0)
+    """
+    total = len(re.sub(r'\s', '', text))
+    if total == 0:
+        return [], 0.0
+    
+    speakers = []
+    covered = 0
+    for speaker, content in split_by_speaker(text):
+        name = normalize_speaker_name(speaker)
+        if (
+            len(name) < 2 or len(name) > 10
+            or name in NON_SPEAKER_LABELS
+            or name in SPEAKER_TITLES
+        ):
+            continue
+        covered += len(re.sub(r'\s', '', speaker + content))
+        if name not in speakers:
+            speakers.append(name)
+    
+    confidence = min(1.0, covered / total)
+    return speakers, round(confidence, 3)
+
+
+# 의미 없는 간투사 (단독으로 쓰인 경우만 제거, 예: "음...", "어 그러니까")
+_FILLER_PATTERN = re.compile(
+    r'(?<![가-힣A-Za-z0-9])(?:음+|어+|으+|흠+|엄+|아+)(?:[.,…~]+\s*|\s+|$)'
+)
+# "그"는 지시어로도 쓰이므로 말을 끊거나("그, ...") 반복할 때("그 그 일정")만 제거
+_HESITATION_PATTERN = re.compile(r'(?<![가-힣])그(?:[.,…~]+\s*|\s+(?=그[\s.,…~]))')
+# "네네", "네 네 네" 같은 반복 맞장구는 "네" 하나로
+_REPEATED_ACK_PATTERN = re.compile(r'(?<![가-힣])(네|예)(?:[\s,.]*\1)+(?![가-힣])')
+# 연속으로 반복된 단어 ("그래서 그래서" → "그래서", 숫자가 들어간 단어는 내용이므로 제외)
+_REPEATED_WORD_PATTERN = re.compile(r'(?<!\S)((?:(?!\d)\S)+)(?:\s+\1)+(?!\S)')
+
+
+def remove_fillers(text: str) -> str:
+    """발언에서 간투사(음, 어, 그, 네네 등)와 반복 단어 제거
+    
+    Args:
+        text: 한 화자의 발언
+    
+    Returns:
+        str: 정리된 발언 (남는 내용이 없으면 빈 문자열)
+    """
+    text = _FILLER_PATTERN.sub('', text)
+    text = _HESITATION_PATTERN.sub('', text)
+    text = _REPEATED_ACK_PATTERN.sub(r'\1', text)
+    text = _REPEATED_WORD_PATTERN.sub(r'\1', text)
+    
+    # 제거 후 남은 문장 부호 정리
+    text = re.sub(r'\s+([,.!?])', r'\1', text)
+    text = re.sub(r'([,.!?])(?:\s*,)+', r'\1', text)
+    text = re.sub(r'^[\s,.…~]+', '', text)
+    return clean_text(text)
+
+
+def collapse_repeats(turns: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """반복 제거 - 같은 화자의 연속 발언을 합치고 중복 문장을 한 번만 남김
+    
+    Args:
+        turns: (화자, 발언) 목록
+    
+    Returns:
+        List[Tuple[str, str]]: 정리된 (화자, 발언) 목록
+    """
+    result = []
+    for speaker, content in turns:
+        sentences = []
+        if result and result[-1][0] == speaker:
+            sentences = re.split(r'(?<=[.!?])\s+', result.pop()[1])
+        for sentence in re.split(r'(?<=[.!?])\s+', content):
+            sentence = sentence.strip()
+            if sentence and (not sentences or sentences[-1] != sentence):
+                sentences.append(sentence)
+        if sentences:
+            result.append((speaker, " ".join(sentences)))
     return result
 
 
+def preprocess_transcript(text: str) -> List[Tuple[str, str]]:
+    """규칙 기반 전처리 - LLM 없이 대화를 간결한 발언 목록으로 정리
+    
+    split_turns로 발언을 나누고 화자 라벨을 정규화("이과장님" → "이과장")한 뒤
+    간투사와 반복을 제거합니다. 화자 표기가 없는 텍스트도 화자가 빈 문자열인
+    발언으로 유지합니다.
+    
+    Args:
+        text: 원본 회의 대화 텍스트
+    
+    Returns:
+        List[Tuple[str, str]]: (화자, 발언) 목록
+    """
+    turns = [
+        (normalize_speaker_name(speaker) if speaker else "", content)
+        for speaker, content in split_turns(text)
+    ]
+    
+    cleaned = []
+    for speaker, content in turns:
+        content = remove_fillers(content)
+        if content:
+            cleaned.append((speaker, content))
+    return collapse_repeats(cleaned)
+
+
+def format_turns(turns: List[Tuple[str, str]]) -> str:
+    """(화자, 발언) 목록을 한 줄에 한 발언씩 "화자: 발언" 텍스트로 변환"""
+    return "\n".join(
+        f"{speaker}: {content}" if speaker else content
+        for speaker, content in turns
+    )
+
+
 def extract_names(text: str) -> List[str]:
     """텍스트에서 한글 이름 추출
     
@@ -71,6 +286,100 @@ def extract_names(text: str) -> List[str]:
     return names
 
 
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정
+    
+    한국어는 대략 1.5자당 1토큰으로 계산합니다 (보수적 추정).
+    
+    Args:
+        text: 토큰 수를 추정할 텍스트
+    
+    Returns:
+        int: 추정 토큰 수
+    """
+    return int(len(text) / 1.5) + 1
+
+
+def _split_sentences(text: str) -> List[str]:
+    """문장 단위로 분할 (문장 뒤 공백은 앞 문장에 포함, 이으면 원본과 같음)"""
+    pieces = []
+    start = 0
+    for match in re.finditer(r'[.!?。]\s+', text):
+        pieces.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def chunk_by_speaker(
+    text: str,
+    max_tokens: int = 1500,
+    count_tokens: Optional[Callable[[str], int]] = None
+) -> List[str]:
+    """화자 발언 단위로 텍스트를 토큰 한도 내 청크로 분할
+    
+    원본 텍스트를 발언 구간(줄 맨 앞 화자 표기 기준, 화자 표기가 없는 줄 포함)으로
+    나누어 순서대로 이어 붙이되, 청크의 토큰 수가 max_tokens를 넘지 않도록 발언
+    경계에서 자릅니다. 한 발언이 한도보다 길면 문장 단위로, 문장도 길면 글자 수로
+    다시 나눕니다. 원본을 그대로 자르므로 청크를 이으면("".join) 원본과 같습니다.
+    
+    Args:
+        text: 회의 대화 텍스트
+        max_tokens: 청크당 최대 토큰 수
+        count_tokens: 토큰 수 계산 함수 (기본값: estimate_tokens)
+    
+    Returns:
+        List[str]: 청크 목록 (원본 텍스트의 연속 구간)
+    """
+    count_tokens = count_tokens or estimate_tokens
+    if not text.strip():
+        return []
+    
+    units = [text[start:end] for _, start, _, end in _turn_spans(text)]
+    
+    # 한도를 넘는 발언은 문장 단위로 분할
+    pieces = []
+    for unit in units:
+        if count_tokens(unit) <= max_tokens:
+            pieces.append(unit)
+            continue
+        current = ""
+        for sentence in _split_sentences(unit):
+            while count_tokens(sentence) > max_tokens:
+                # 문장 자체가 너무 길면 글자 수로 자르기
+                cut = max(1, len(sentence) * max_tokens // count_tokens(sentence))
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(sentence[:cut])
+                sentence = sentence[cut:]
+            if current and count_tokens(current + sentence) > max_tokens:
+                pieces.append(current)
+                current = sentence
+            else:
+                current += sentence
+        if current:
+            pieces.append(current)
+    
+    # 발언 경계에서 청크 구성
+    chunks = []
+    current = []
+    current_tokens = 0
+    for piece in pieces:
+        piece_tokens = count_tokens(piece)
+        if current and current_tokens + piece_tokens > max_tokens:
+            chunks.append("".join(current))
+            current = []
+            current_tokens = 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    if current:
+        chunks.append("".join(current))
+    
+    return chunks
+
+
 def truncate_text(text: str, max_length: int = 1000) -> str:
     """텍스트를 지정된 길이로 자르기
     
@@ -0,0 +1,400 @@
+"""일괄 회의록 생성 - 디렉토리/JSONL 입력을 한 프로세스에서 처리"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Tuple
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import settings
+
+
+MANIFEST_NAME = "manifest.jsonl"
+REPORT_NAME = "report.json"
+
+
+def iter_inputs(paths: list) -> Iterator[Tuple[str, dict]]:
+    """입력 경로에서 (회의 ID, 회의 데이터)를 차례로 읽기
+    
+    - 디렉토리: 안의 *.json, *.jsonl 파일 (이름순)
+    - .jsonl: 한 줄에 회의 하나 ("id" 필드가 없으면 "파일명-줄번호")
+    - .json: 파일 하나에 회의 하나 (ID는 파일명)
+    
+    JSONL은 한 줄씩 읽으므로 큰 파일도 메모리에 모두 올리지 않습니다.
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            children = sorted(
+                child for child in path.iterdir()
+                if child.suffix in (".json", ".jsonl")
+            )
+            yield from iter_inputs(children)
+        elif path.suffix == ".jsonl":
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    item_id = f"{path.stem}-{line_number}"
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield item_id, {"_error": f"JSON 파싱 오류: {e}"}
+                        continue
+                    yield str(data.get("id") or item_id), data
+        else:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                yield path.stem, {"_error": f"파일 읽기 오류: {e}"}
+                continue
+            yield str(data.get("id") or path.stem), data
+
+
+def safe_name(item_id: str) -> str:
+    """회의 ID를 파일 이름으로 쓸 수 있게 변환"""
+    return re.sub(r"[^\w.-]", "_", item_id)[:120] or "meeting"
+
+
+class Manifest:
+    """처리 결과 기록 (한 줄에 회의 하나, 추가 전용)
+    
+    완료된 회의 ID를 보관하여 중단 후 다시 실행할 때 건너뜁니다.
+    각 줄은 즉시 디스크에 기록하므로 중간에 종료되어도 완료 기록은 남습니다.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.completed = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 기록 도중 중단된 마지막 줄
+                        continue
+                    if record.get("status") == "completed":
+                        self.completed.add(record["id"])
+                    else:
+                        self.completed.discard(record["id"])
+    
+    def record(self, entry: dict):
+        """처리 결과 한 줄 추가"""
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            if entry["status"] == "completed":
+                self.completed.add(entry["id"])
+
+
+def write_atomic(path: Path, write):
+    """임시 파일에 쓴 뒤 이름을 바꿔 중단 시 불완전한 파일이 남지 않도록 저장"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        write(str(tmp_path))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def process_item(item_id: str, data: dict, output_dir: Path, write_docx: bool) -> dict:
+    """회의 하나 처리 (그래프 실행 → JSON/Word 저장)"""
+    from meeting_minutes.graph.registry import graph_registry
+    from meeting_minutes.nodes.chunking import needs_chunking
+    from meeting_minutes.output.document_generator import MeetingMinutesDocGenerator
+    from meeting_minutes.utils.state_converter import dict_to_meeting_state, validate_state_dict
+    
+    start = time.perf_counter()
+    entry = {"id": item_id, "title": data.get("meeting_title", data.get("title", ""))}
+    
+    if "_error" in data:
+        return {**entry, "status": "failed", "error": data["_error"], "seconds": 0.0}
+    is_valid, error_msg = validate_state_dict(data)
+    if not is_valid:
+        return {**entry, "status": "failed", "error": error_msg, "seconds": 0.0}
+    
+    try:
+        state = dict_to_meeting_state(data)
+        mode = "chunked" if needs_chunking(state["raw_transcript"]) else settings.GRAPH_MODE
+        final_state = graph_registry.get(mode).invoke(state)
+        graph_seconds = time.perf_counter() - start
+        
+        name = safe_name(item_id)
+        json_path = output_dir / f"{name}.json"
+        
+        def dump_json(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(dict(final_state), f, ensure_ascii=False, indent=2, default=str)
+        
+        write_atomic(json_path, dump_json)
+        
+        docx_path = None
+        if write_docx:
+            docx_path = output_dir / f"{name}.docx"
+            write_atomic(
+                docx_path,
+                lambda path: MeetingMinutesDocGenerator().generate(final_state, path)
+            )
+    except Exception as e:
+        return {
+            **entry,
+            "status": "failed",
+            "error": str(e),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+    
+    generation_stats = final_state.get("generation_stats", [])
+    return {
+        **entry,
+        "status": "completed",
+        "mode": mode,
+        "seconds": round(time.perf_counter() - start, 3),
+        "graph_seconds": round(graph_seconds, 3),
+        "transcript_length": len(state["raw_transcript"]),
+        "llm_calls": len(generation_stats),
+        "generated_tokens": sum(stats["generated_tokens"] for stats in generation_stats),
+        "errors": final_state.get("errors", []),
+        "json": str(json_path),
+        "docx": str(docx_path) if docx_path else None,
+    }
+
+
+def run_batch(
+    inputs: list,
+    output_dir: Path,
+    workers: int,
+    resume: bool = True,
+    write_docx: bool = True
+) -> dict:
+    """입력을 제한된 워커 풀로 처리하고 보고서 반환
+    
+    제출 대기열을 워커 수의 두 배로 제한하므로 입력이 아무리 많아도
+    읽어 둔 회의 데이터는 그만큼만 메모리에 있습니다.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(output_dir / MANIFEST_NAME)
+    if not resume:
+        manifest.completed.clear()
+    
+    results = []
+    skipped = 0
+    seen = {}
+    interrupted = False
+    forced = False
+    start = time.perf_counter()
+    
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch")
+    pending = set()
+    
+    def collect(done):
+        for future in done:
+            entry = future.result()
+            entry["finished_at"] = datetime.now().isoformat()
+            manifest.record(entry)
+            results.append(entry)
+            status = "✓" if entry["status"] == "completed" else "✗"
+            detail = entry.get("error") or f"{entry['seconds']}초"
+            print(f"{status} [{len(results)}] {entry['id']} ({detail})")
+    
+    try:
+        for item_id, data in iter_inputs(inputs):
+            # 같은 ID가 여러 번 나오면 번호를 붙여 구분
+            count = seen.get(item_id, 0)
+            seen[item_id] = count + 1
+            if count:
+                item_id = f"{item_id}-{count + 1}"
+            
+            if item_id in manifest.completed:
+                skipped += 1
+                continue
+            
+            while len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(process_item, item_id, data, output_dir, write_docx))
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\n⚠ 중단 요청 - 실행 중인 회의가 끝나면 기록하고 종료합니다 (다시 누르면 즉시 종료)")
+        # 시작하지 않은 회의는 취소 (cancel()은 실행 중이거나 끝난 작업이면 False)
+        running = [future for future in pending if not future.cancel()]
+        try:
+            done, _ = wait(running)
+        except KeyboardInterrupt:
+            forced = True
+            print("\n⚠ 즉시 종료 - 실행 중인 회의는 기록하지 않습니다 (다음 --resume에서 다시 처리)")
+            done = [future for future in running if future.done()]
+        collect(done)
+    finally:
+        executor.shutdown(wait=not forced, cancel_futures=True)
+    
+    report = build_report(results, skipped, time.perf_counter() - start, workers, interrupted)
+    write_atomic(
+        output_dir / REPORT_NAME,
+        lambda path: Path(path).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    )
+    return report
+
+
+def build_report(results: list, skipped: int, wall_seconds: float, workers: int, interrupted: bool) -> dict:
+    """이번 실행 요약 보고서"""
+    completed = [entry for entry in results if entry["status"] == "completed"]
+    seconds = sorted(entry["seconds"] for entry in completed)
+    return {
+        "started_workers": workers,
+        "interrupted": interrupted,
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "skipped": skipped,
+        "wall_seconds": round(wall_seconds, 3),
+        "meetings_per_minute": round(len(completed) / wall_seconds * 60, 2) if wall_seconds else None,
+        "mean_seconds": round(sum(seconds) / len(seconds), 3) if seconds else None,
+        "p50_seconds": seconds[len(seconds) // 2] if seconds else None,
+        "max_seconds": seconds[-1] if seconds else None,
+        "generated_tokens": sum(entry.get("generated_tokens", 0) for entry in completed),
+        "meetings": results,
+    }
+
+
+def print_report(report: dict, output_dir: Path):
+    """보고서 요약 출력"""
+    print("\n" + "=" * 70)
+    print("  일괄 처리 결과")
+    print("=" * 70)
+    print(f"완료: {report['completed']}  실패: {report['failed']}  건너뜀(이미 완료): {report['skipped']}")
+    print(f"전체 시간: {report['wall_seconds']}초 (분당 {report['meetings_per_minute']}건)")
+    if report["mean_seconds"] is not None:
+        print(
+            f"회의당 시간: 평균 {report['mean_seconds']}초, "
+            f"중앙값 {report['p50_seconds']}초, 최대 {report['max_seconds']}초"
+        )
+    for entry in report["meetings"]:
+        if entry["status"] != "completed":
+            print(f"  ✗ {entry['id']}: {entry.get('error')}")
+    print(f"\n보고서: {output_dir / REPORT_NAME}")
+    print("=" * 70)
+
+
+def start_llm():
+    """모델을 한 번만 로드하고 설정에 따라 디스패처 연결 (app.py와 같은 순서)"""
+    from meeting_minutes.core.llm_config import llm_config
+    from meeting_minutes.core.scheduler import InferenceScheduler
+    from meeting_minutes.core.replica_pool import ReplicaPool
+    
+    # 복제본/스케줄러는 transformers 백엔드에서만 사용
+    local_batching = llm_config.backend_name == "transformers"
+    
+    if settings.REPLICA_ENABLED and local_batching:
+        pool = ReplicaPool.from_llm(
+            llm_config,
+            num_replicas=settings.REPLICA_COUNT,
+            threads_per_replica=settings.REPLICA_THREADS
+        )
+        try:
+            pool.start()
+            llm_config.attach_dispatcher(pool)
+            print(f"✓ 모델 복제본 {pool.num_replicas}개 시작")
+            return
+        except Exception as e:
+            print(f"⚠ 모델 복제본 시작 실패 (단일 모델로 실행): {e}")
+    
+    if settings.SCHEDULER_ENABLED and local_batching:
+        scheduler = InferenceScheduler(llm_config, max_batch_size=settings.SCHEDULER_MAX_BATCH_SIZE)
+        scheduler.start()
+        llm_config.attach_dispatcher(scheduler)
+        print(f"✓ 추론 스케줄러 활성화 (최대 배치 {settings.SCHEDULER_MAX_BATCH_SIZE})")
+    
+    llm_config.load_model()
+
+
+def stop_llm():
+    """디스패처 정리"""
+    from meeting_minutes.core.llm_config import llm_config
+    
+    dispatcher = llm_config.detach_dispatcher()
+    if dispatcher is not None:
+        dispatcher.stop()
+
+
+def main():
+    """메인 함수"""
+    from meeting_minutes.graph.builder import GRAPH_MODES
+    from meeting_minutes.nodes.preprocessing import PREPROCESS_MODES
+    
+    parser = argparse.ArgumentParser(
+        description="디렉토리/JSONL 입력으로 회의록 일괄 생성 (모델은 한 번만 로드)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 디렉토리의 JSON 파일 전체 처리
+  python scripts/batch_process.py data/input -o output/batch
+  
+  # JSONL (한 줄에 회의 하나), 동시 처리 2건
+  python scripts/batch_process.py meetings.jsonl --workers 2
+  
+  # 중단 후 다시 실행하면 완료된 회의는 건너뜀 (--no-resume으로 전체 재처리)
+  python scripts/batch_process.py data/input -o output/batch
+        """
+    )
+    parser.add_argument("inputs", nargs="+", help="입력 디렉토리, .json 또는 .jsonl 파일")
+    parser.add_argument("--output-dir", "-o", default="output/batch", help="출력 디렉토리")
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=max(1, settings.JOB_MAX_WORKERS),
+        help="동시에 처리할 회의 수 (기본값: JOB_MAX_WORKERS)"
+    )
+    parser.add_argument("--graph-mode", "-g", choices=GRAPH_MODES, help="그래프 실행 모드")
+    parser.add_argument("--preprocess-mode", "-p", choices=PREPROCESS_MODES, help="전처리 모드")
+    parser.add_argument("--no-resume", action="store_true", help="완료 기록을 무시하고 전체 재처리")
+    parser.add_argument("--no-docx", action="store_true", help="Word 문서 없이 JSON만 저장")
+    
+    args = parser.parse_args()
+    
+    if args.graph_mode:
+        settings.GRAPH_MODE = args.graph_mode
+    if args.preprocess_mode:
+        settings.PREPROCESS_MODE = args.preprocess_mode
+    
+    output_dir = Path(args.output_dir)
+    print("[초기화] LLM 모델 로드 중 (한 번만 로드)...")
+    load_start = time.perf_counter()
+    start_llm()
+    print(f"✓ 준비 완료 ({time.perf_counter() - load_start:.1f}초)")
+    
+    try:
+        report = run_batch(
+            args.inputs,
+            output_dir,
+            workers=max(1, args.workers),
+            resume=not args.no_resume,
+            write_docx=not args.no_docx
+        )
+    finally:
+        stop_llm()
+    
+    print_report(report, output_dir)
+    if report["interrupted"]:
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""추론 백엔드 벤치마크 - transformers / llama.cpp(GGUF) / OpenAI 호환 서버를 같은 프롬프트로 비교"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+BENCHMARK_TRANSCRIPT = """김대리: 안녕하세요, 오늘 신규 프로젝트 킥오프 미팅을 시작하겠습니다.
+이과장: 네, 프로젝트명은 'AI 회의록 자동화 시스템'으로 확정되었습니다.
+박부장: 좋습니다. 개발 일정은 어떻게 되나요?
+김대리: 1단계로 11월 30일까지 프로토타입 개발을 완료할 예정입니다.
+이과장: 2단계는 12월 중순까지 사내 파일럿을 진행하고 피드백을 반영하겠습니다.
+박부장: 예산은 지난 분기 승인된 범위 안에서 집행하도록 하세요.
+김대리: 테스트 시나리오는 이과장님이 11월 20일까지 작성해 주시기로 했습니다."""
+
+# 측정할 노드 프롬프트 (프로필 이름)
+BENCHMARK_FIELDS = ("summary", "decisions", "discussions", "action_items")
+
+
+def run_backend(backend: str, model: str, runs: int, graph: bool) -> dict:
+    """현재 프로세스에서 한 백엔드 측정 (워커 모드)"""
+    from config import settings
+    
+    settings.LLM_BACKEND = backend
+    settings.LLM_MODEL = model
+    settings.LLM_DETERMINISTIC = True
+    settings.RESPONSE_CACHE_ENABLED = False
+    
+    from meeting_minutes.core.backend import process_rss_bytes
+    from meeting_minutes.core.llm_config import llm_config
+    from meeting_minutes.core.prompt_templates import PromptTemplates
+    from meeting_minutes.nodes.extraction import GENERATION_PROFILES
+    
+    templates = {
+        "summary": PromptTemplates.get_summary_prompt(),
+        "decisions": PromptTemplates.get_decision_extraction_prompt(),
+        "discussions": PromptTemplates.get_discussion_extraction_prompt(),
+        "action_items": PromptTemplates.get_action_item_extraction_prompt(),
+    }
+    
+    rss_before = process_rss_bytes()
+    start = time.perf_counter()
+    llm_config.load_model()
+    load_seconds = time.perf_counter() - start
+    rss_loaded = process_rss_bytes()
+    
+    # 첫 호출은 워밍업으로 제외
+    llm_config.generate(templates["summary"].format(text=BENCHMARK_TRANSCRIPT))
+    
+    prefix = PromptTemplates.get_transcript_prefix().format(text=BENCHMARK_TRANSCRIPT)
+    fields = {}
+    total_seconds = 0.0
+    total_tokens = 0
+    for field in BENCHMARK_FIELDS:
+        prompt = templates[field].format(text=BENCHMARK_TRANSCRIPT)
+        latencies = []
+        tokens = 0
+        output = ""
+        for _ in range(runs):
+            start = time.perf_counter()
+            output, stats = llm_config.generate_with_stats(
+                prompt, prefix=prefix, profile=GENERATION_PROFILES[field]
+            )
+            latencies.append(time.perf_counter() - start)
+            tokens += stats["generated_tokens"]
+        total_seconds += sum(latencies)
+        total_tokens += tokens
+        fields[field] = {
+            "latency_mean_seconds": round(sum(latencies) / len(latencies), 3),
+            "generated_tokens": tokens // runs,
+            "tokens_per_second": round(tokens / sum(latencies), 2) if sum(latencies) else None,
+            "sample_output": output[:100],
+        }
+    
+    info = llm_config.get_model_info()
+    result = {
+        "backend": backend,
+        "model_id": info["model_id"],
+        "precision": info["precision"],
+        "load_seconds": round(load_seconds, 2),
+        "rss_before_mb": round(rss_before / 1024 ** 2, 1) if rss_before else None,
+        "rss_loaded_mb": round(rss_loaded / 1024 ** 2, 1) if rss_loaded else None,
+        "tokens_per_second": round(total_tokens / total_seconds, 2) if total_seconds else None,
+        "fields": fields,
+    }
+    
+    if graph:
+        from meeting_minutes.core.state_schema import create_initial_state
+        from meeting_minutes.graph.registry import graph_registry
+        
+        state = create_initial_state(BENCHMARK_TRANSCRIPT, "벤치마크 회의", "2025-11-01")
+        start = time.perf_counter()
+        graph_registry.get().invoke(state)
+        result["graph_mode"] = settings.GRAPH_MODE
+        result["graph_seconds"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def run_in_subprocess(backend: str, model: str, runs: int, graph: bool) -> dict:
+    """백엔드마다 새 프로세스에서 측정 (전역 llm_config와 RSS가 섞이지 않도록)"""
+    command = [
+        sys.executable, __file__,
+        "--worker",
+        "--backends", backend,
+        "--model", model,
+        "--runs", str(runs),
+    ]
+    if graph:
+        command.append("--graph")
+    # 전역 llm_config는 import 시 settings.LLM_BACKEND로 만들어지므로 환경 변수로 전달
+    env = {**os.environ, "LLM_BACKEND": backend}
+    completed = subprocess.run(command, capture_output=True, text=True, env=env)
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    return {
+        "backend": backend,
+        "error": (completed.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1],
+    }
+
+
+def print_table(results: list):
+    """결과 표 출력"""
+    print("\n" + "=" * 104)
+    print(
+        f"{'백엔드':<14}{'정밀도':<10}{'RSS(MB)':>10}{'로드(s)':>10}{'tok/s':>10}"
+        + "".join(f"{field + '(s)':>16}" for field in BENCHMARK_FIELDS)
+    )
+    print("-" * 104)
+    for result in results:
+        if "error" in result:
+            print(f"{result['backend']:<14}실패: {result['error']}")
+            continue
+        print(
+            f"{result['backend']:<14}{result['precision'] or '-':<10}"
+            f"{result['rss_loaded_mb'] or '-':>10}{result['load_seconds']:>10}"
+            f"{result['tokens_per_second'] or '-':>10}"
+            + "".join(
+                f"{result['fields'][field]['latency_mean_seconds']:>16}"
+                for field in BENCHMARK_FIELDS
+            )
+        )
+        if "graph_seconds" in result:
+            print(f"{'':<14}그래프 전체({result['graph_mode']}): {result['graph_seconds']}s")
+    print("=" * 104)
+
+
+def main():
+    """메인 함수"""
+    from meeting_minutes.core.llm_config import LLM_BACKENDS
+    
+    parser = argparse.ArgumentParser(
+        description="추론 백엔드별 로드 시간/생성 속도/메모리 비교 (같은 노드 프롬프트와 프로필)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # transformers와 llama.cpp(추천 GGUF) 비교
+  python scripts/benchmark_backends.py
+  
+  # 그래프 전체 실행 시간까지 측정, 결과 JSON 저장
+  python scripts/benchmark_backends.py --graph --output backends.json
+        """
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=LLM_BACKENDS,
+        default=list(LLM_BACKENDS),
+        help="비교할 백엔드"
+    )
+    parser.add_argument("--model", default="exaone-2.4b", help="모델 이름 (LLM_MODEL)")
+    parser.add_argument("--runs", type=int, default=3, help="프롬프트별 측정 횟수")
+    parser.add_argument("--graph", action="store_true", help="그래프 전체 실행 시간도 측정")
+    parser.add_argument("--output", "-o", help="결과 JSON 저장 경로")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    
+    args = parser.parse_args()
+    
+    if args.worker:
+        result = run_backend(args.backends[0], args.model, args.runs, args.graph)
+        print("RESULT " + json.dumps(result, ensure_ascii=False))
+        return
+    
+    results = []
+    for backend in args.backends:
+        print(f"[측정] {backend} ...")
+        results.append(run_in_subprocess(backend, args.model, args.runs, args.graph))
+    
+    print_table(results)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"✓ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""CPU 정밀도 프로필 벤치마크 - 로드 시간, 생성 지연, 메모리 비교"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+BENCHMARK_PROMPT = """회의 내용:
+김대리: 안녕하세요, 오늘 신규 프로젝트 킥오프 미팅을 시작하겠습니다.
+이과장: 네, 프로젝트명은 'AI 회의록 자동화 시스템'으로 확정되었습니다.
+박부장: 좋습니다. 개발 일정은 어떻게 되나요?
+김대리: 1단계로 11월 30일까지 프로토타입 개발을 완료할 예정입니다.
+
+위 회의 내용을 3-5문장으로 요약하세요."""
+
+
+def run_profile(model: str, precision: str, max_new_tokens: int, runs: int) -> dict:
+    """현재 프로세스에서 한 프로필 측정 (워커 모드)"""
+    from meeting_minutes.core.backend import process_rss_bytes
+    from meeting_minutes.core.transformers_backend import LightweightLLMConfig
+    
+    llm = LightweightLLMConfig(
+        model_name=model,
+        max_length=max_new_tokens,
+        deterministic=True,
+        prefix_cache_size=0,
+        cpu_precision=precision
+    )
+    
+    rss_before = process_rss_bytes()
+    start = time.perf_counter()
+    llm.load_model()
+    load_seconds = time.perf_counter() - start
+    rss_loaded = process_rss_bytes()
+    
+    # 첫 호출은 워밍업으로 제외
+    llm.generate(BENCHMARK_PROMPT)
+    
+    latencies = []
+    tokens = 0
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = llm.generate(BENCHMARK_PROMPT)
+        latencies.append(time.perf_counter() - start)
+        tokens += llm.count_tokens(output)
+    
+    info = llm.get_model_info()
+    return {
+        "requested": precision,
+        "precision": info["precision"],
+        "parameter_count": info["parameter_count"],
+        "weights_memory_mb": round(info["weights_memory_bytes"] / 1024 ** 2, 1),
+        "rss_before_mb": round(rss_before / 1024 ** 2, 1) if rss_before else None,
+        "rss_loaded_mb": round(rss_loaded / 1024 ** 2, 1) if rss_loaded else None,
+        "rss_after_runs_mb": round(process_rss_bytes() / 1024 ** 2, 1) if rss_loaded else None,
+        "load_seconds": round(load_seconds, 2),
+        "latency_mean_seconds": round(sum(latencies) / len(latencies), 3),
+        "latency_min_seconds": round(min(latencies), 3),
+        "tokens_per_second": round(tokens / sum(latencies), 2) if sum(latencies) else None,
+        "sample_output": output[:100],
+    }
+
+
+def run_in_subprocess(model: str, precision: str, max_new_tokens: int, runs: int) -> dict:
+    """프로필마다 새 프로세스에서 측정 (RSS가 서로 섞이지 않도록)"""
+    command = [
+        sys.executable, __file__,
+        "--worker",
+        "--model", model,
+        "--profiles", precision,
+        "--max-new-tokens", str(max_new_tokens),
+        "--runs", str(runs),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    return {
+        "requested": precision,
+        "error": (completed.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1],
+    }
+
+
+def print_table(results: list):
+    """결과 표 출력"""
+    print("\n" + "=" * 90)
+    print(f"{'프로필':<8}{'적용':<8}{'가중치(MB)':>12}{'RSS(MB)':>12}{'로드(s)':>10}{'지연(s)':>10}{'tok/s':>10}")
+    print("-" * 90)
+    for result in results:
+        if "error" in result:
+            print(f"{result['requested']:<8}실패: {result['error']}")
+            continue
+        print(
+            f"{result['requested']:<8}{result['precision']:<8}"
+            f"{result['weights_memory_mb']:>12}{result['rss_loaded_mb'] or '-':>12}"
+            f"{result['load_seconds']:>10}{result['latency_mean_seconds']:>10}"
+            f"{result['tokens_per_second'] or '-':>10}"
+        )
+    print("=" * 90)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description="CPU 정밀도 프로필별 로드 시간/생성 지연/메모리 비교",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 전체 프로필 비교
+  python scripts/benchmark_precision.py
+  
+  # 일부 프로필만, 결과 JSON 저장
+  python scripts/benchmark_precision.py --profiles fp32 int8 --output bench.json
+        """
+    )
+    parser.add_argument("--model", default="exaone-2.4b", help="모델 이름 또는 경로")
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=["fp32", "bf16", "int8", "int4"],
+        help="비교할 정밀도 프로필"
+    )
+    parser.add_argument("--max-new-tokens", type=int, default=64, help="생성 토큰 수")
+    parser.add_argument("--runs", type=int, default=3, help="프로필별 측정 횟수")
+    parser.add_argument("--output", "-o", help="결과 JSON 저장 경로")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    
+    args = parser.parse_args()
+    
+    if args.worker:
+        result = run_profile(args.model, args.profiles[0], args.max_new_tokens, args.runs)
+        print("RESULT " + json.dumps(result, ensure_ascii=False))
+        return
+    
+    results = []
+    for precision in args.profiles:
+        print(f"[측정] {precision} ...")
+        results.append(run_in_subprocess(args.model, precision, args.max_new_tokens, args.runs))
+    
+    print_table(results)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"✓ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
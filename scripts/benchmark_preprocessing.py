@@ -0,0 +1,214 @@
+"""전처리 모드 벤치마크 - 지연, 토큰 사용량, 후속 추출 결과 비교"""
+import argparse
+import json
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import settings
+
+
+# 후속 추출 결과 비교 대상 필드
+EXTRACTION_FIELDS = ("participants", "agenda_items", "discussions", "decisions", "action_items")
+
+
+def load_samples(input_dir: Path) -> list:
+    """입력 디렉토리의 JSON 샘플 로드 (raw_transcript 필수)"""
+    samples = []
+    for path in sorted(input_dir.glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("raw_transcript"):
+            samples.append((path.stem, data))
+    return samples
+
+
+def item_text(item) -> str:
+    """추출 항목을 비교용 문자열로 변환"""
+    if isinstance(item, dict):
+        return " ".join(str(value) for value in item.values())
+    return str(item)
+
+
+def item_recall(reference: list, candidate: list, threshold: float = 0.6) -> float:
+    """기준 결과의 항목 중 후보 결과에 비슷한 항목이 있는 비율"""
+    if not reference:
+        return 1.0 if not candidate else 0.0
+    candidates = [item_text(item) for item in candidate]
+    matched = 0
+    for item in reference:
+        text = item_text(item)
+        if any(SequenceMatcher(None, text, other).ratio() >= threshold for other in candidates):
+            matched += 1
+    return round(matched / len(reference), 3)
+
+
+def run_sample(name: str, data: dict, mode: str, preprocess_only: bool) -> dict:
+    """한 샘플을 한 전처리 모드로 처리"""
+    from meeting_minutes.core.llm_config import llm_config
+    from meeting_minutes.core.state_schema import create_initial_state
+    from meeting_minutes.nodes.preprocessing import preprocess_node
+    
+    settings.PREPROCESS_MODE = mode
+    state = create_initial_state(
+        transcript=data["raw_transcript"],
+        title=data.get("meeting_title", settings.DEFAULT_MEETING_TITLE),
+        date=data.get("meeting_date")
+    )
+    
+    start = time.perf_counter()
+    update = preprocess_node(state)
+    preprocess_seconds = time.perf_counter() - start
+    
+    preprocess_stats = update.get("generation_stats", [])
+    result = {
+        "sample": name,
+        "mode": mode,
+        "preprocess_seconds": round(preprocess_seconds, 3),
+        "preprocess_generated_tokens": sum(stats["generated_tokens"] for stats in preprocess_stats),
+        "raw_tokens": llm_config.count_tokens(data["raw_transcript"]),
+        "processed_tokens": llm_config.count_tokens(update["processed_text"]),
+    }
+    if preprocess_only:
+        return result
+    
+    from meeting_minutes.graph.registry import graph_registry
+    
+    start = time.perf_counter()
+    final_state = graph_registry.get().invoke(state)
+    result["total_seconds"] = round(time.perf_counter() - start, 3)
+    result["total_generated_tokens"] = sum(
+        stats["generated_tokens"] for stats in final_state.get("generation_stats", [])
+    )
+    result["errors"] = len(final_state.get("errors", []))
+    result["extraction"] = {field: final_state.get(field, []) for field in EXTRACTION_FIELDS}
+    return result
+
+
+def compare_extraction(results: list, reference_mode: str):
+    """기준 모드 대비 필드별 항목 재현율 계산 (결과에 recall 추가)"""
+    references = {
+        result["sample"]: result["extraction"]
+        for result in results
+        if result["mode"] == reference_mode and "extraction" in result
+    }
+    for result in results:
+        reference = references.get(result["sample"])
+        if reference is None or "extraction" not in result:
+            continue
+        result["recall_vs_" + reference_mode] = {
+            field: item_recall(reference[field], result["extraction"][field])
+            for field in EXTRACTION_FIELDS
+        }
+
+
+def summarize(results: list, modes: list) -> list:
+    """모드별 평균"""
+    summary = []
+    for mode in modes:
+        rows = [result for result in results if result["mode"] == mode]
+        if not rows:
+            continue
+        row = {"mode": mode}
+        for key in (
+            "preprocess_seconds", "preprocess_generated_tokens", "processed_tokens",
+            "total_seconds", "total_generated_tokens"
+        ):
+            values = [result[key] for result in rows if key in result]
+            if values:
+                row[key] = round(sum(values) / len(values), 3)
+        recalls = [
+            value
+            for result in rows
+            for name, recall in result.items() if name.startswith("recall_vs_")
+            for value in recall.values()
+        ]
+        if recalls:
+            row["mean_recall"] = round(sum(recalls) / len(recalls), 3)
+        summary.append(row)
+    return summary
+
+
+def print_table(summary: list, reference_mode: str):
+    """결과 표 출력"""
+    print("\n" + "=" * 96)
+    print(
+        f"{'모드':<8}{'전처리(s)':>12}{'전처리 토큰':>12}{'정리 후 토큰':>14}"
+        f"{'전체(s)':>10}{'전체 토큰':>12}{'재현율(' + reference_mode + ')':>16}"
+    )
+    print("-" * 96)
+    for row in summary:
+        print(
+            f"{row['mode']:<8}{row['preprocess_seconds']:>12}{row['preprocess_generated_tokens']:>12}"
+            f"{row['processed_tokens']:>14}{row.get('total_seconds', '-'):>10}"
+            f"{row.get('total_generated_tokens', '-'):>12}{row.get('mean_recall', '-'):>16}"
+        )
+    print("=" * 96)
+
+
+def main():
+    """메인 함수"""
+    from meeting_minutes.nodes.preprocessing import PREPROCESS_MODES
+    
+    parser = argparse.ArgumentParser(
+        description="전처리 모드(rule / polish / llm)별 지연, 토큰 사용량, 추출 결과 비교",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # data/input 샘플로 전체 모드 비교 (llm 모드 결과를 기준으로 재현율 계산)
+  python scripts/benchmark_preprocessing.py
+  
+  # 모델 없이 규칙 기반 전처리만 측정
+  python scripts/benchmark_preprocessing.py --modes rule --preprocess-only
+        """
+    )
+    parser.add_argument("--input-dir", default="data/input", help="샘플 JSON 디렉토리")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=PREPROCESS_MODES,
+        default=list(PREPROCESS_MODES),
+        help="비교할 전처리 모드"
+    )
+    parser.add_argument(
+        "--reference",
+        choices=PREPROCESS_MODES,
+        default="llm",
+        help="추출 결과 재현율의 기준 모드"
+    )
+    parser.add_argument(
+        "--preprocess-only",
+        action="store_true",
+        help="전처리 노드만 측정 (후속 추출 생략)"
+    )
+    parser.add_argument("--output", "-o", help="결과 JSON 저장 경로")
+    
+    args = parser.parse_args()
+    
+    samples = load_samples(Path(args.input_dir))
+    if not samples:
+        print(f"✗ 샘플이 없습니다: {args.input_dir}")
+        return
+    
+    results = []
+    for mode in args.modes:
+        for name, data in samples:
+            print(f"[측정] {mode} / {name} ...")
+            results.append(run_sample(name, data, mode, args.preprocess_only))
+    
+    compare_extraction(results, args.reference)
+    summary = summarize(results, args.modes)
+    print_table(summary, args.reference)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"✓ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""추측 디코딩 벤치마크 - 초안 모델 수락률과 일반 디코딩 대비 속도 비교"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+BENCHMARK_PROMPT = """다음 회의 대화를 화자별로 정리하여 다시 작성하세요.
+
+회의 내용:
+김대리: 안녕하세요, 오늘 신규 프로젝트 킥오프 미팅을 시작하겠습니다.
+이과장: 네, 프로젝트명은 'AI 회의록 자동화 시스템'으로 확정되었습니다.
+박부장: 좋습니다. 개발 일정은 어떻게 되나요?
+김대리: 1단계로 11월 30일까지 프로토타입 개발을 완료할 예정입니다.
+이과장: 2단계는 12월 중순까지 사내 파일럿을 진행하고 피드백을 반영하겠습니다.
+박부장: 예산은 지난 분기 승인된 범위 안에서 집행하도록 하세요."""
+
+
+def measure(llm, profile, runs: int) -> dict:
+    """한 프로필로 runs번 생성하여 지연/처리량 측정"""
+    latencies = []
+    tokens = 0
+    output = ""
+    speculative = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output, stats = llm.generate_with_stats(BENCHMARK_PROMPT, profile=profile)
+        latencies.append(time.perf_counter() - start)
+        tokens += stats["generated_tokens"]
+        if "speculative" in stats:
+            speculative.append(stats["speculative"])
+    
+    result = {
+        "latency_mean_seconds": round(sum(latencies) / len(latencies), 3),
+        "tokens_per_second": round(tokens / sum(latencies), 2) if sum(latencies) else None,
+        "output": output,
+    }
+    if speculative:
+        proposed = sum(item["proposed_tokens"] for item in speculative)
+        accepted = sum(item["accepted_tokens"] for item in speculative)
+        result["acceptance_rate"] = round(accepted / proposed, 3) if proposed else 0.0
+    return result
+
+
+def run_benchmark(model: str, draft: str, draft_tokens: int, max_new_tokens: int, runs: int) -> dict:
+    """대상 모델 단독 생성과 초안 모델을 붙인 생성을 같은 프로세스에서 비교"""
+    from meeting_minutes.core.transformers_backend import LightweightLLMConfig
+    from meeting_minutes.core.generation_profile import GenerationProfile
+    
+    llm = LightweightLLMConfig(
+        model_name=model,
+        max_length=max_new_tokens,
+        deterministic=True,
+        prefix_cache_size=0,
+        draft_model_name=draft,
+        draft_num_tokens=draft_tokens
+    )
+    llm.load_model()
+    if llm._draft_model is None:
+        raise RuntimeError("초안 모델을 사용할 수 없습니다 (로드 로그 확인)")
+    
+    # 반복 감지는 끔 (추측 디코딩은 한 스텝에 여러 토큰을 붙이므로 멈추는 위치가 달라짐)
+    baseline_profile = GenerationProfile(
+        "baseline", max_new_tokens=max_new_tokens, repetition_max_period=0
+    )
+    speculative_profile = GenerationProfile(
+        "speculative", max_new_tokens=max_new_tokens, repetition_max_period=0, speculative=True
+    )
+    
+    # 첫 호출은 워밍업으로 제외
+    llm.generate(BENCHMARK_PROMPT, profile=baseline_profile)
+    llm.generate(BENCHMARK_PROMPT, profile=speculative_profile)
+    
+    baseline = measure(llm, baseline_profile, runs)
+    speculative = measure(llm, speculative_profile, runs)
+    
+    return {
+        "model": model,
+        "draft_model": draft,
+        "draft_num_tokens": draft_tokens,
+        "max_new_tokens": max_new_tokens,
+        "baseline_tokens_per_second": baseline["tokens_per_second"],
+        "speculative_tokens_per_second": speculative["tokens_per_second"],
+        "baseline_latency_seconds": baseline["latency_mean_seconds"],
+        "speculative_latency_seconds": speculative["latency_mean_seconds"],
+        "speedup": (
+            round(speculative["tokens_per_second"] / baseline["tokens_per_second"], 2)
+            if baseline["tokens_per_second"] and speculative["tokens_per_second"] else None
+        ),
+        "acceptance_rate": speculative.get("acceptance_rate"),
+        # 결정적 생성에서는 출력이 같아야 함 (추측 디코딩은 결과를 바꾸지 않음)
+        "identical_output": baseline["output"] == speculative["output"],
+    }
+
+
+def print_result(result: dict):
+    """결과 출력"""
+    print("\n" + "=" * 70)
+    print(f"대상 모델: {result['model']}  /  초안 모델: {result['draft_model']}")
+    print("-" * 70)
+    print(f"{'':<12}{'지연(s)':>12}{'tok/s':>12}")
+    print(f"{'일반':<12}{result['baseline_latency_seconds']:>12}{result['baseline_tokens_per_second'] or '-':>12}")
+    print(f"{'추측':<12}{result['speculative_latency_seconds']:>12}{result['speculative_tokens_per_second'] or '-':>12}")
+    print("-" * 70)
+    print(f"수락률: {result['acceptance_rate']}  속도 향상: {result['speedup']}x  출력 일치: {result['identical_output']}")
+    print("=" * 70)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description="추측 디코딩(초안 모델) 수락률과 속도 향상 측정",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # qwen-3b 대상 모델 + qwen-1.5b 초안 모델
+  python scripts/benchmark_speculative.py --model qwen-3b --draft qwen-1.5b
+  
+  # 초안 토큰 수 고정, 결과 JSON 저장
+  python scripts/benchmark_speculative.py --draft-tokens 5 --output spec.json
+        """
+    )
+    parser.add_argument("--model", default="qwen-3b", help="대상 모델 이름 또는 경로")
+    parser.add_argument("--draft", default="qwen-1.5b", help="초안 모델 이름 또는 경로")
+    parser.add_argument(
+        "--draft-tokens",
+        type=int,
+        default=0,
+        help="한 번에 제안할 초안 토큰 수 (0이면 transformers 기본값)"
+    )
+    parser.add_argument("--max-new-tokens", type=int, default=256, help="생성 토큰 수")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수")
+    parser.add_argument("--output", "-o", help="결과 JSON 저장 경로")
+    
+    args = parser.parse_args()
+    
+    result = run_benchmark(
+        args.model, args.draft, args.draft_tokens, args.max_new_tokens, args.runs
+    )
+    print_result(result)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"✓ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""ONNX 내보내기 - 설정된 모델을 KV 캐시 입력이 있는 ONNX 그래프로 변환 (선택: int8 양자화)"""
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import settings
+
+
+# int8 동적 양자화 대상 CPU 명령어 집합 (optimum AutoQuantizationConfig)
+INT8_TARGETS = ("avx2", "avx512", "avx512_vnni", "arm64")
+
+
+def detect_int8_target() -> str:
+    """현재 CPU에 맞는 int8 양자화 대상 (/proc/cpuinfo 기준)"""
+    import platform
+    
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            flags = f.read()
+    except OSError:
+        return "avx2"
+    if "avx512_vnni" in flags or "avx512vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+
+def export_model(model: str, output_dir: Path, opset: int = None):
+    """HuggingFace 모델을 KV 캐시 입력/출력이 있는 ONNX 그래프로 내보내기"""
+    from optimum.onnxruntime import ORTModelForCausalLM
+    from transformers import AutoTokenizer
+    
+    from meeting_minutes.core.transformers_backend import LightweightLLMConfig
+    
+    model_id = LightweightLLMConfig.RECOMMENDED_MODELS.get(model, model)
+    print(f"[내보내기] {model_id} → {output_dir}")
+    start = time.perf_counter()
+    
+    kwargs = {"export": True, "use_cache": True, "trust_remote_code": True}
+    if opset:
+        kwargs["opset"] = opset
+    ort_model = ORTModelForCausalLM.from_pretrained(model_id, **kwargs)
+    ort_model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_id, trust_remote_code=True).save_pretrained(output_dir)
+    
+    print(f"✓ 내보내기 완료 ({time.perf_counter() - start:.1f}초)")
+
+
+def quantize_model(output_dir: Path, target: str):
+    """내보낸 그래프를 int8 동적 양자화 (가중치 int8, 활성화는 실행 중 양자화)"""
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    
+    from meeting_minutes.core.onnx_backend import ONNX_FILE_NAME
+    
+    print(f"[int8 양자화] {target}")
+    start = time.perf_counter()
+    
+    config_factory = getattr(AutoQuantizationConfig, target)
+    if target == "arm64":
+        config = config_factory(is_static=False, per_channel=True)
+    else:
+        config = config_factory(is_static=False, per_channel=True, operators_to_quantize=["MatMul"])
+    quantizer = ORTQuantizer.from_pretrained(output_dir, file_name=ONNX_FILE_NAME)
+    quantizer.quantize(
+        save_dir=output_dir,
+        quantization_config=config,
+        # 2GB를 넘는 그래프는 가중치가 외부 데이터 파일에 있음
+        use_external_data_format=(output_dir / f"{ONNX_FILE_NAME}_data").exists()
+    )
+    
+    print(f"✓ 양자화 완료 ({time.perf_counter() - start:.1f}초)")
+
+
+def directory_size_mb(path: Path, pattern: str) -> float:
+    """pattern에 맞는 파일 크기 합 (MB)"""
+    return round(sum(file.stat().st_size for file in path.glob(pattern)) / 1024 ** 2, 1)
+
+
+def main():
+    """메인 함수"""
+    from meeting_minutes.core.onnx_backend import (
+        ONNX_FILE_NAME,
+        ONNX_INT8_FILE_NAME,
+        onnx_model_dir
+    )
+    
+    parser = argparse.ArgumentParser(
+        description="모델을 ONNX(KV 캐시 포함)로 내보내기 - LLM_BACKEND=onnx에서 사용",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 설정된 모델(LLM_MODEL) 내보내기
+  python scripts/export_onnx.py
+  
+  # int8 양자화 그래프도 함께 생성 (ONNX_QUANTIZED=true로 사용)
+  python scripts/export_onnx.py --model qwen-1.5b --int8
+        """
+    )
+    parser.add_argument("--model", default=settings.LLM_MODEL, help="모델 이름 또는 HuggingFace ID")
+    parser.add_argument(
+        "--output-dir",
+        default=str(settings.ONNX_MODEL_DIR),
+        help="ONNX 기본 디렉토리 (모델 이름별 하위 디렉토리에 저장)"
+    )
+    parser.add_argument("--int8", action="store_true", help="int8 동적 양자화 그래프도 생성")
+    parser.add_argument(
+        "--int8-target",
+        choices=INT8_TARGETS,
+        help="int8 양자화 대상 명령어 집합 (기본값: 현재 CPU에서 감지)"
+    )
+    parser.add_argument("--opset", type=int, help="ONNX opset 버전 (기본값: optimum 기본값)")
+    parser.add_argument("--force", action="store_true", help="이미 내보낸 모델이 있어도 다시 내보내기")
+    
+    args = parser.parse_args()
+    
+    output_dir = onnx_model_dir(args.output_dir, args.model)
+    if (output_dir / ONNX_FILE_NAME).exists() and not args.force:
+        print(f"✓ 이미 내보낸 모델 사용: {output_dir / ONNX_FILE_NAME} (--force로 다시 내보내기)")
+    else:
+        if output_dir.exists():
+            shutil.rmtree(output_dir)
+        try:
+            export_model(args.model, output_dir, args.opset)
+        except ImportError:
+            print("✗ optimum이 필요합니다: pip install \"optimum[onnxruntime]\"")
+            sys.exit(1)
+    
+    if args.int8:
+        quantize_model(output_dir, args.int8_target or detect_int8_target())
+    
+    print(f"\n출력: {output_dir}")
+    print(f"  - {ONNX_FILE_NAME}: {directory_size_mb(output_dir, ONNX_FILE_NAME + '*')} MB")
+    if (output_dir / ONNX_INT8_FILE_NAME).exists():
+        print(f"  - {ONNX_INT8_FILE_NAME}: {directory_size_mb(output_dir, ONNX_INT8_FILE_NAME + '*')} MB")
+    print(f"\n사용: LLM_BACKEND=onnx LLM_MODEL={args.model}"
+          f"{' ONNX_QUANTIZED=true' if args.int8 else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""ONNX 출력 일치 검사 - 샘플 회의로 torch 경로와 ONNX Runtime 경로의 출력/속도 비교"""
+import argparse
+import difflib
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import settings
+
+
+# 비교할 노드 프롬프트 (생성 프로필 이름)
+PARITY_FIELDS = ("summary", "decisions", "action_items")
+
+
+def load_samples(input_dir: Path, limit: int) -> list:
+    """샘플 회의 JSON 목록 (이름, 대화 내용)"""
+    samples = []
+    for path in sorted(input_dir.glob("*.json"))[:limit]:
+        with open(path, encoding="utf-8") as f:
+            samples.append((path.stem, json.load(f)["raw_transcript"]))
+    return samples
+
+
+def build_prompts(samples: list) -> list:
+    """(샘플, 필드, 프롬프트, 접두부) 목록 - 노드와 같은 프롬프트 구성"""
+    from meeting_minutes.core.prompt_templates import PromptTemplates
+    
+    templates = {
+        "summary": PromptTemplates.get_summary_prompt(),
+        "decisions": PromptTemplates.get_decision_extraction_prompt(),
+        "action_items": PromptTemplates.get_action_item_extraction_prompt(),
+    }
+    prompts = []
+    for name, transcript in samples:
+        prefix = PromptTemplates.get_transcript_prefix().format(text=transcript)
+        for field in PARITY_FIELDS:
+            prompts.append((name, field, templates[field].format(text=transcript), prefix))
+    return prompts
+
+
+def run_prompts(llm, prompts: list) -> list:
+    """프롬프트를 차례로 생성하여 (출력, 생성 토큰 수, 지연) 목록 반환"""
+    from meeting_minutes.nodes.extraction import GENERATION_PROFILES
+    
+    # 첫 호출은 워밍업으로 제외
+    llm.generate(prompts[0][2], prefix=prompts[0][3], profile=GENERATION_PROFILES[prompts[0][1]])
+    
+    results = []
+    for _, field, prompt, prefix in prompts:
+        start = time.perf_counter()
+        output, stats = llm.generate_with_stats(
+            prompt, prefix=prefix, profile=GENERATION_PROFILES[field]
+        )
+        results.append((output, stats["generated_tokens"], time.perf_counter() - start))
+    return results
+
+
+def run_parity(model: str, quantized: bool, prompts: list) -> dict:
+    """torch 경로와 ONNX 경로를 차례로 실행하여 비교 (한 번에 한 모델만 메모리에 유지)"""
+    from meeting_minutes.core.transformers_backend import LightweightLLMConfig
+    from meeting_minutes.core.onnx_backend import OnnxRuntimeBackend
+    
+    torch_llm = LightweightLLMConfig(model_name=model, deterministic=True, prefix_cache_size=0)
+    torch_llm.load_model()
+    torch_results = run_prompts(torch_llm, prompts)
+    del torch_llm
+    gc.collect()
+    
+    onnx_llm = OnnxRuntimeBackend(
+        model_name=model,
+        model_dir=settings.ONNX_MODEL_DIR,
+        quantized=quantized,
+        intra_op_threads=settings.ONNX_INTRA_OP_THREADS,
+        inter_op_threads=settings.ONNX_INTER_OP_THREADS,
+        deterministic=True
+    )
+    onnx_llm.load_model()
+    onnx_results = run_prompts(onnx_llm, prompts)
+    
+    cases = []
+    for (name, field, _, _), torch_result, onnx_result in zip(prompts, torch_results, onnx_results):
+        cases.append({
+            "sample": name,
+            "field": field,
+            "identical": torch_result[0] == onnx_result[0],
+            "similarity": round(difflib.SequenceMatcher(None, torch_result[0], onnx_result[0]).ratio(), 3),
+            "torch_seconds": round(torch_result[2], 3),
+            "onnx_seconds": round(onnx_result[2], 3),
+            "torch_tokens": torch_result[1],
+            "onnx_tokens": onnx_result[1],
+            "torch_output": torch_result[0],
+            "onnx_output": onnx_result[0],
+        })
+    
+    torch_seconds = sum(result[2] for result in torch_results)
+    onnx_seconds = sum(result[2] for result in onnx_results)
+    torch_tokens = sum(result[1] for result in torch_results)
+    onnx_tokens = sum(result[1] for result in onnx_results)
+    return {
+        "model": model,
+        "onnx_precision": onnx_llm.precision,
+        "identical_rate": round(sum(case["identical"] for case in cases) / len(cases), 3),
+        "mean_similarity": round(sum(case["similarity"] for case in cases) / len(cases), 3),
+        "torch_tokens_per_second": round(torch_tokens / torch_seconds, 2) if torch_seconds else None,
+        "onnx_tokens_per_second": round(onnx_tokens / onnx_seconds, 2) if onnx_seconds else None,
+        "speedup": round(torch_seconds / onnx_seconds, 2) if onnx_seconds else None,
+        "cases": cases,
+    }
+
+
+def print_report(report: dict):
+    """결과 표 출력"""
+    print("\n" + "=" * 84)
+    print(f"모델: {report['model']}  /  ONNX 정밀도: {report['onnx_precision']}")
+    print("-" * 84)
+    print(f"{'샘플':<24}{'필드':<14}{'일치':>6}{'유사도':>10}{'torch(s)':>12}{'onnx(s)':>12}")
+    for case in report["cases"]:
+        print(
+            f"{case['sample']:<24}{case['field']:<14}{'O' if case['identical'] else 'X':>6}"
+            f"{case['similarity']:>10}{case['torch_seconds']:>12}{case['onnx_seconds']:>12}"
+        )
+    print("-" * 84)
+    print(
+        f"완전 일치율: {report['identical_rate']}  평균 유사도: {report['mean_similarity']}  "
+        f"tok/s: {report['torch_tokens_per_second']} → {report['onnx_tokens_per_second']}  "
+        f"속도 향상: {report['speedup']}x"
+    )
+    print("=" * 84)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description="샘플 회의로 torch 경로와 ONNX Runtime 경로의 출력 일치/속도 비교 (그리디 디코딩)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # fp32 ONNX 그래프 검사 (먼저 scripts/export_onnx.py 실행)
+  python scripts/onnx_parity.py
+  
+  # int8 그래프, 샘플 2개, 결과 JSON 저장
+  python scripts/onnx_parity.py --int8 --samples 2 --output parity.json
+        """
+    )
+    parser.add_argument("--model", default=settings.LLM_MODEL, help="모델 이름 또는 HuggingFace ID")
+    parser.add_argument("--int8", action="store_true", help="int8 양자화 그래프 검사")
+    parser.add_argument("--input-dir", default="data/input", help="샘플 회의 JSON 디렉토리")
+    parser.add_argument("--samples", type=int, default=4, help="사용할 샘플 수")
+    parser.add_argument(
+        "--min-similarity",
+        type=float,
+        default=None,
+        help="평균 유사도가 이 값보다 낮으면 종료 코드 1 (기본값: fp32 0.95, int8 0.8)"
+    )
+    parser.add_argument("--output", "-o", help="결과 JSON 저장 경로")
+    
+    args = parser.parse_args()
+    
+    samples = load_samples(Path(args.input_dir), args.samples)
+    if not samples:
+        print(f"✗ 샘플 회의가 없습니다: {args.input_dir}")
+        sys.exit(1)
+    
+    report = run_parity(args.model, args.int8, build_prompts(samples))
+    print_report(report)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✓ 결과 저장: {args.output}")
+    
+    # fp32 그래프도 연산 융합으로 수치가 조금 달라 드물게 그리디 선택이 갈릴 수 있음
+    min_similarity = args.min_similarity
+    if min_similarity is None:
+        min_similarity = 0.8 if args.int8 else 0.95
+    if report["mean_similarity"] < min_similarity:
+        print(f"✗ 평균 유사도 {report['mean_similarity']} < {min_similarity}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
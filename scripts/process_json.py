@@ -91,6 +91,68 @@ def generate_via_api(json_data: dict, api_url: str = "http://127.0.0.1:8000") ->
         return None
 
 
+def generate_via_stream(json_data: dict, api_url: str = "http://127.0.0.1:8000") -> dict:
+    """SSE 스트리밍 API로 회의록 생성 (진행 상황과 생성 텍스트 실시간 출력)
+    
+    서버가 주기적으로 keep-alive를 보내므로 전체 생성 시간이 아니라
+    이벤트 사이 간격에만 읽기 타임아웃(60초)을 적용합니다.
+    
+    Args:
+        json_data: 회의 데이터
+        api_url: API 서버 URL
+    
+    Returns:
+        dict: 최종 응답 (result 이벤트)
+    """
+    endpoint = f"{api_url}/api/v1/generate-minutes/stream"
+    
+    print(f"\n[API 요청 - 스트리밍] {endpoint}")
+    print(f"회의 제목: {json_data.get('meeting_title', '회의록')}")
+    
+    result = None
+    try:
+        with requests.post(endpoint, json=json_data, stream=True, timeout=(10, 60)) as response:
+            response.raise_for_status()
+            
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or line.startswith(":"):
+                    continue
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                    continue
+                if not line.startswith("data:"):
+                    continue
+                
+                data = json.loads(line[len("data:"):])
+                if event == "node_start":
+                    print(f"\n▶ {data['node']}")
+                elif event == "node_end":
+                    status = f"✗ {data['error']}" if data.get("error") else "✓"
+                    print(f"\n{status} {data['node']}")
+                elif event == "token":
+                    print(data["text"], end="", flush=True)
+                elif event == "result":
+                    result = data
+                elif event in ("error", "cancelled"):
+                    print(f"\n✗ 생성 중단: {data.get('message', event)}")
+        
+        if result is not None:
+            print("\n✓ 회의록 생성 성공!")
+        return result
+        
+    except requests.exceptions.ConnectionError:
+        print("\n✗ API 서버에 연결할 수 없습니다.")
+        print("서버가 실행 중인지 확인하세요: python app.py")
+        return None
+    except requests.exceptions.Timeout:
+        print("\n✗ 서버 응답이 60초 이상 없습니다")
+        return None
+    except Exception as e:
+        print(f"\n✗ 오류 발생: {e}")
+        return None
+
+
 def download_file(api_url: str, filename: str, output_path: str = None):
     """생성된 파일 다운로드"""
     download_endpoint = f"{api_url}/api/v1/download/{filename}"
@@ -117,7 +179,8 @@ def process_json_file(
     json_file: str,
     api_url: str = "http://127.0.0.1:8000",
     download: bool = False,
-    output_dir: str = None
+    output_dir: str = None,
+    stream: bool = False
 ):
     """JSON 파일을 처리하여 회의록 생성
     
@@ -126,6 +189,7 @@ def process_json_file(
         api_url: API 서버 URL
         download: 파일 다운로드 여부
         output_dir: 다운로드 디렉토리
+        stream: SSE 스트리밍 엔드포인트 사용 (진행 상황 실시간 출력)
     """
     print("=" * 70)
     print("  JSON 파일 기반 회의록 생성")
@@ -141,7 +205,10 @@ def process_json_file(
         return None
     
     # 3. API 호출
-    result = generate_via_api(json_data, api_url)
+    if stream:
+        result = generate_via_stream(json_data, api_url)
+    else:
+        result = generate_via_api(json_data, api_url)
     if result is None:
         return None
     
@@ -196,6 +263,9 @@ def main():
   # 출력 디렉토리 지정
   python scripts/process_json.py data/input/sample_meeting_1.json -d -o ./downloads
   
+  # 진행 상황 실시간 출력 (SSE 스트리밍)
+  python scripts/process_json.py data/input/sample_meeting_1.json --stream
+  
   # API 서버 URL 지정
   python scripts/process_json.py data/input/sample_meeting_1.json --api http://localhost:8000
         """
@@ -219,6 +289,11 @@ def main():
         "-o", "--output",
         help="다운로드 디렉토리"
     )
+    parser.add_argument(
+        "-s", "--stream",
+        action="store_true",
+        help="스트리밍 엔드포인트로 진행 상황과 생성 텍스트를 실시간 출력"
+    )
     
     args = parser.parse_args()
     
@@ -227,7 +302,8 @@ def main():
         json_file=args.json_file,
         api_url=args.api,
         download=args.download,
-        output_dir=args.output
+        output_dir=args.output,
+        stream=args.stream
     )
 
 
@@ -22,7 +22,7 @@ setup(
     install_requires=[
         "langchain>=0.3.0",
         "langchain-community>=0.3.0",
-        "langgraph>=0.2.16",
+        "langgraph>=0.6.0",
         "python-docx>=1.1.2",
         "typing-extensions>=4.9.0",
         "python-dotenv>=1.0.0",
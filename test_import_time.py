@@ -0,0 +1,97 @@
+"""import 시간 회귀 테스트 (python -X importtime)
+
+패키지와 app.py import만으로 torch/transformers/LangGraph/python-docx를
+불러오거나 전역 LLM 백엔드를 만들지 않는지, 디렉토리를 만들지 않는지,
+import 시간이 예산 안인지 확인합니다.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent
+
+# import 하면 안 되는 무거운 모듈
+HEAVY_MODULES = ("torch", "transformers", "langgraph", "docx")
+
+# 누적 import 시간 예산 (초) - 느린 CI를 감안해 넉넉하게 잡음
+PACKAGE_BUDGET = 1.0
+APP_BUDGET = 3.0
+
+
+def import_profile(module: str) -> dict:
+    """새 인터프리터에서 module을 import하여 모듈별 누적 import 시간(초) 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    # 형식: "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total) / 1e6
+    return cumulative
+
+
+def check_import(module: str, budget: float):
+    profile = import_profile(module)
+    
+    loaded = [name for name in HEAVY_MODULES if name in profile]
+    assert not loaded, f"{module} import가 무거운 모듈을 불러옵니다: {loaded}"
+    assert profile[module] < budget, f"{module} import {profile[module]:.2f}초 > 예산 {budget}초"
+
+
+def test_package_import_is_light():
+    """import meeting_minutes - 공개 이름은 처음 접근할 때 로드"""
+    check_import("meeting_minutes", PACKAGE_BUDGET)
+
+
+def test_app_import_is_light():
+    """import app - 모델/그래프/문서 라이브러리는 서버 시작(lifespan) 이후 로드"""
+    check_import("app", APP_BUDGET)
+
+
+def test_llm_config_created_on_first_use():
+    """전역 llm_config는 import 시점이 아니라 처음 사용할 때 생성"""
+    code = (
+        "from meeting_minutes.core.llm_config import llm_config\n"
+        "assert not llm_config.is_created\n"
+        "assert llm_config.backend_name == 'transformers'\n"
+        "assert llm_config.is_created\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root,
+        env={**os.environ, "LLM_BACKEND": "transformers"},
+        check=True
+    )
+
+
+def test_import_creates_no_directories():
+    """import만으로는 출력/샘플 디렉토리를 만들지 않음 (서버 시작 시 생성)"""
+    with tempfile.TemporaryDirectory() as workdir:
+        subprocess.run(
+            [sys.executable, "-c", "import app, main, meeting_minutes.core"],
+            cwd=workdir,
+            env={**os.environ, "PYTHONPATH": str(project_root), "PYTHONDONTWRITEBYTECODE": "1"},
+            check=True
+        )
+        assert list(Path(workdir).iterdir()) == []
+
+
+if __name__ == "__main__":
+    for test in (
+        test_package_import_is_light,
+        test_app_import_is_light,
+        test_llm_config_created_on_first_use,
+        test_import_creates_no_directories,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
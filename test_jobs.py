@@ -0,0 +1,166 @@
+"""작업 큐 테스트 (파이프라인 대신 이벤트로 진행을 제어하는 runner 사용)"""
+import sys
+import threading
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from meeting_minutes.api.jobs import JobCancelledError, JobManager, JobQueueFullError
+
+
+class GatedRunner:
+    """gate가 열릴 때까지 기다렸다가 끝나는 runner (노드 경계마다 취소 확인 여부 선택)"""
+    
+    def __init__(self, checks_cancel: bool = True):
+        self.checks_cancel = checks_cancel
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.calls = []
+    
+    def __call__(self, payload, cancel_event):
+        self.calls.append(payload)
+        self.started.set()
+        self.gate.wait(timeout=10)
+        if self.checks_cancel and cancel_event.is_set():
+            raise JobCancelledError()
+        if payload == "fail":
+            raise RuntimeError("생성 실패")
+        return {"payload": payload}
+
+
+def test_job_runs_to_completion():
+    """queued → running → completed, 결과 보관"""
+    runner = GatedRunner()
+    manager = JobManager(runner, max_workers=1)
+    try:
+        job = manager.submit("회의")
+        assert runner.started.wait(timeout=5)
+        assert job.status == "running" and job.started_at is not None
+        
+        runner.gate.set()
+        job.future.result(timeout=5)
+        assert job.status == "completed"
+        assert job.result == {"payload": "회의"}
+        assert job.to_dict()["finished_at"] is not None
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_failed_job_records_error():
+    """runner 예외는 failed 상태와 오류 메시지로 기록"""
+    runner = GatedRunner()
+    runner.gate.set()
+    manager = JobManager(runner, max_workers=1)
+    try:
+        job = manager.submit("fail")
+        job.future.result(timeout=5)
+        assert job.status == "failed"
+        assert job.error == "생성 실패" and job.result is None
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_cancel_queued_job():
+    """대기 중인 작업은 즉시 cancelled, runner는 호출되지 않음"""
+    runner = GatedRunner()
+    manager = JobManager(runner, max_workers=1)
+    try:
+        first = manager.submit("첫 번째")
+        assert runner.started.wait(timeout=5)
+        second = manager.submit("두 번째")
+        
+        assert manager.cancel(second.id).status == "cancelled"
+        runner.gate.set()
+        first.future.result(timeout=5)
+        assert runner.calls == ["첫 번째"]
+        assert manager.stats() == {"completed": 1, "cancelled": 1}
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_cancel_running_job_at_node_boundary():
+    """실행 중 취소는 cancelling을 거쳐 다음 노드 경계에서 cancelled"""
+    runner = GatedRunner()
+    manager = JobManager(runner, max_workers=1)
+    try:
+        job = manager.submit("회의")
+        assert runner.started.wait(timeout=5)
+        assert manager.cancel(job.id).status == "cancelling"
+        
+        runner.gate.set()
+        job.future.result(timeout=5)
+        assert job.status == "cancelled" and job.result is None
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_cancel_after_last_node_is_reported():
+    """마지막 노드 경계 이후의 취소로 runner가 끝까지 실행되어도 cancelled로 보고"""
+    runner = GatedRunner(checks_cancel=False)
+    manager = JobManager(runner, max_workers=1)
+    try:
+        job = manager.submit("회의")
+        assert runner.started.wait(timeout=5)
+        manager.cancel(job.id)
+        
+        runner.gate.set()
+        job.future.result(timeout=5)
+        assert job.status == "cancelled" and job.result is None
+        # 끝난 작업에 대한 취소 요청은 상태를 바꾸지 않음
+        assert manager.cancel(job.id).status == "cancelled"
+    finally:
+        manager.shutdown(wait=True)
+
+
+def test_queue_limit():
+    """대기 중인 작업 수가 max_pending에 도달하면 JobQueueFullError"""
+    runner = GatedRunner()
+    manager = JobManager(runner, max_workers=1, max_pending=1)
+    try:
+        manager.submit("실행 중")
+        assert runner.started.wait(timeout=5)
+        manager.submit("대기")
+        try:
+            manager.submit("초과")
+        except JobQueueFullError:
+            pass
+        else:
+            raise AssertionError("JobQueueFullError가 발생하지 않음")
+    finally:
+        runner.gate.set()
+        manager.shutdown(wait=True)
+
+
+def test_prune_keeps_recent_finished_jobs():
+    """완료 작업은 max_history개만 보관하고 오래된 것부터 정리"""
+    runner = GatedRunner()
+    runner.gate.set()
+    manager = JobManager(runner, max_workers=1, max_history=2)
+    try:
+        jobs = []
+        for idx in range(4):
+            job = manager.submit(idx)
+            job.future.result(timeout=5)
+            jobs.append(job)
+        
+        latest = manager.submit("마지막")
+        assert [manager.get(job.id) for job in jobs[:2]] == [None, None]
+        assert all(manager.get(job.id) is job for job in jobs[2:])
+        assert manager.get(latest.id) is latest
+    finally:
+        manager.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    for test in (
+        test_job_runs_to_completion,
+        test_failed_job_records_error,
+        test_cancel_queued_job,
+        test_cancel_running_job_at_node_boundary,
+        test_cancel_after_last_node_is_reported,
+        test_queue_limit,
+        test_prune_keeps_recent_finished_jobs,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
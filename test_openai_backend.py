@@ -0,0 +1,250 @@
+"""OpenAI 호환 HTTP 백엔드 테스트 (로컬 가짜 추론 서버 사용)"""
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from meeting_minutes.core.backend import stream_tokens
+from meeting_minutes.core.generation_profile import GenerationProfile
+from meeting_minutes.core.openai_backend import OpenAIBackendError, OpenAICompatibleBackend
+from meeting_minutes.core.response_cache import ResponseCache
+
+
+class FakeInferenceServer:
+    """OpenAI 호환 /v1/chat/completions 가짜 서버
+    
+    응답은 사용자 프롬프트를 "응답: <프롬프트>" 형태로 돌려주며, 글자 단위로
+    SSE 스트리밍합니다. fail_next만큼 503을 먼저 돌려주고, 동시 처리 중인
+    요청 수와 클라이언트 연결(포트) 수를 기록합니다.
+    """
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fail_next = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.client_ports = set()
+        self.lock = threading.Lock()
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, *args):
+                pass
+            
+            def send_body(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                if self.path != "/v1/models":
+                    self.send_body(404, b"{}", "application/json")
+                    return
+                body = json.dumps({"data": [{"id": "fake-model"}]}).encode()
+                self.send_body(200, body, "application/json")
+            
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                payload = json.loads(self.rfile.read(length))
+                with server.lock:
+                    server.requests.append(payload)
+                    server.client_ports.add(self.client_address[1])
+                    if server.fail_next > 0:
+                        server.fail_next -= 1
+                        fail = True
+                    else:
+                        fail = False
+                        server.in_flight += 1
+                        server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                if fail:
+                    self.send_body(503, b'{"error": "busy"}', "application/json")
+                    return
+                
+                try:
+                    time.sleep(server.delay)
+                    text = "응답: " + payload["messages"][-1]["content"]
+                    finish_reason = "stop"
+                    if len(text) > payload["max_tokens"]:
+                        text, finish_reason = text[:payload["max_tokens"]], "length"
+                    for stop in payload.get("stop", []):
+                        if stop in text:
+                            text = text[:text.index(stop)]
+                    
+                    if not payload.get("stream"):
+                        body = json.dumps({
+                            "choices": [{
+                                "message": {"role": "assistant", "content": text},
+                                "finish_reason": finish_reason,
+                            }],
+                            "usage": {"completion_tokens": len(text)},
+                        }).encode()
+                        self.send_body(200, body, "application/json")
+                        return
+                    
+                    events = [
+                        {"choices": [{"delta": {"content": char}, "finish_reason": None}]}
+                        for char in text
+                    ]
+                    events.append({"choices": [{"delta": {}, "finish_reason": finish_reason}]})
+                    events.append({"choices": [], "usage": {"completion_tokens": len(text)}})
+                    body = "".join(
+                        f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in events
+                    ) + "data: [DONE]\n\n"
+                    self.send_body(200, body.encode("utf-8"), "text/event-stream")
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_backend(server: FakeInferenceServer, **kwargs) -> OpenAICompatibleBackend:
+    """가짜 서버에 연결하는 백엔드 (재시도 대기 시간은 짧게)"""
+    kwargs.setdefault("retry_backoff", 0.01)
+    return OpenAICompatibleBackend(base_url=server.base_url, deterministic=True, **kwargs)
+
+
+def test_generate_and_stream():
+    """생성, 모델 자동 선택, 스트리밍 콜백, 토큰 예산/중단 문자열 전달"""
+    server = FakeInferenceServer()
+    backend = make_backend(server)
+    try:
+        pieces = []
+        with stream_tokens(pieces.append):
+            text, stats = backend.generate_with_stats("안녕하세요")
+        
+        assert text == "응답: 안녕하세요"
+        assert "".join(pieces) == text
+        assert backend.model_id == "fake-model"
+        assert stats["generated_tokens"] == len(text)
+        assert server.requests[-1]["temperature"] == 0.0
+        
+        profile = GenerationProfile("short", 5, stop_sequences=("\n",), repetition_max_period=0)
+        text, stats = backend.generate_with_stats("긴 문장입니다", profile=profile)
+        assert server.requests[-1]["max_tokens"] == 5
+        assert server.requests[-1]["stop"] == ["\n"]
+        assert text == "응답: 긴"
+        assert stats["stop_reason"] == "length"
+        
+        assert list(backend.stream("스트림")) == list("응답: 스트림")
+    finally:
+        backend.close()
+        server.close()
+
+
+def test_retry_on_server_busy():
+    """503 응답은 백오프 후 재시도, 재시도 횟수를 넘으면 OpenAIBackendError"""
+    server = FakeInferenceServer()
+    backend = make_backend(server, max_retries=2)
+    try:
+        backend.load_model()
+        server.fail_next = 2
+        assert backend.generate("재시도") == "응답: 재시도"
+        assert backend.request_stats["retries"] == 2
+        
+        server.fail_next = 3
+        try:
+            backend.generate("실패")
+            assert False, "OpenAIBackendError가 발생해야 합니다"
+        except OpenAIBackendError:
+            pass
+        assert backend.request_stats["failures"] == 1
+    finally:
+        backend.close()
+        server.close()
+
+
+def test_bounded_concurrency_and_keepalive():
+    """배치 요청은 동시에 보내되 max_concurrency를 넘지 않고 연결을 재사용"""
+    server = FakeInferenceServer(delay=0.2)
+    backend = make_backend(server, max_concurrency=2)
+    try:
+        backend.load_model()
+        prompts = [f"질문 {idx}" for idx in range(6)]
+        start = time.perf_counter()
+        outputs = backend.generate_batch(prompts)
+        elapsed = time.perf_counter() - start
+        
+        assert outputs == [f"응답: {prompt}" for prompt in prompts]
+        assert server.max_in_flight == 2
+        assert backend.request_stats["max_in_flight"] == 2
+        # 2개씩 3번(0.6초) → 차례로 보낼 때(1.2초)보다 빠름
+        assert elapsed < 1.0
+        assert len(server.client_ports) <= 2
+    finally:
+        backend.close()
+        server.close()
+
+
+def test_unreachable_server():
+    """추론 서버에 연결할 수 없으면 재시도 후 OpenAIBackendError"""
+    backend = OpenAICompatibleBackend(
+        base_url="http://127.0.0.1:9/v1", max_retries=1, retry_backoff=0.01, timeout=2.0
+    )
+    try:
+        backend.load_model()
+        assert False, "OpenAIBackendError가 발생해야 합니다"
+    except OpenAIBackendError:
+        pass
+    finally:
+        backend.close()
+
+
+
+def test_cache_hit_without_server():
+    """응답 캐시에 있으면 추론 서버에 연결하지 않고 반환 (서버가 꺼져 있어도 동작)"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = Path(cache_dir) / "responses.sqlite3"
+        server = FakeInferenceServer()
+        backend = make_backend(server, model="fake-model", response_cache=ResponseCache(cache_path))
+        try:
+            assert backend.generate("캐시") == "응답: 캐시"
+        finally:
+            backend.close()
+            server.close()
+        
+        backend = OpenAICompatibleBackend(
+            base_url=server.base_url,
+            model="fake-model",
+            deterministic=True,
+            max_retries=0,
+            timeout=2.0,
+            response_cache=ResponseCache(cache_path)
+        )
+        try:
+            text, stats = backend.generate_with_stats("캐시")
+            assert text == "응답: 캐시"
+            assert stats["stop_reason"] == "cache"
+            assert not backend.is_loaded
+        finally:
+            backend.close()
+
+
+if __name__ == "__main__":
+    for test in (
+        test_generate_and_stream,
+        test_retry_on_server_busy,
+        test_bounded_concurrency_and_keepalive,
+        test_unreachable_server,
+        test_cache_hit_without_server,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
@@ -0,0 +1,45 @@
+"""실시간 회의 세션 테스트 (모델 대신 benchmarks의 FakeLLM 디스패처 사용)"""
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.fake_llm import FakeLLM
+from meeting_minutes.api.sessions import LiveSession
+from meeting_minutes.core.llm_config import llm_config
+
+
+APPENDS = [
+    "김대리: 회의를 시작하겠습니다.\n이과장: 일정 보고드리겠습니다.",
+    "\n박부장: 좋습니다. 다음 주까지 정리해 주세요.\n",
+]
+
+
+def test_transcript_joins_appends_verbatim():
+    """전체 대화는 추가된 원문을 그대로 이은 것이고, segment_count는 추가 횟수"""
+    previous = llm_config.detach_dispatcher()
+    llm_config.attach_dispatcher(FakeLLM(token_latency=0))
+    try:
+        session = LiveSession("주간 회의", "2024-05-01")
+        for text in APPENDS:
+            session.append(text)
+    finally:
+        llm_config.detach_dispatcher()
+        if previous is not None:
+            llm_config.attach_dispatcher(previous)
+    
+    assert session.transcript == "".join(APPENDS)
+    assert session.to_state()["raw_transcript"] == "".join(APPENDS)
+    
+    info = session.to_dict()
+    assert info["segment_count"] == len(APPENDS)
+    assert info["transcript_length"] == len("".join(APPENDS))
+
+
+if __name__ == "__main__":
+    for test in (
+        test_transcript_joins_appends_verbatim,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
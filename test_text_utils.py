@@ -0,0 +1,102 @@
+"""텍스트 유틸리티 테스트 (화자 분리, 규칙 기반 전처리, 청크 분할)"""
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from meeting_minutes.nodes.chunking import merge_chunk_results
+from meeting_minutes.nodes.preprocessing import rule_based_preprocess
+from meeting_minutes.utils.text_utils import (
+    chunk_by_speaker,
+    preprocess_transcript,
+    remove_fillers,
+    split_by_speaker
+)
+
+
+TRANSCRIPT = """오늘은 예산 회의입니다. 예산 총액은 5억원으로 확정되었습니다.
+
+김대리: 자료는 공유 드라이브에 올렸습니다. 담당 http://x.com 참고 부탁드립니다.
+이과장: 일정: 다음 주 화요일까지 검토하겠습니다.
+추가로 외주 비용도 확인하겠습니다.
+
+회의 중 메모 - 다음 회의는 온라인으로 진행
+박부장: 좋습니다. 그렇게 진행하죠.
+"""
+
+
+def test_untagged_text_is_kept():
+    """첫 화자 표기 앞이나 빈 줄 뒤의 화자 표기 없는 텍스트도 전처리 결과에 남음"""
+    turns = preprocess_transcript(TRANSCRIPT)
+    assert turns[0] == ("", "오늘은 예산 회의입니다. 예산 총액은 5억원으로 확정되었습니다.")
+    assert ("", "회의 중 메모 - 다음 회의는 온라인으로 진행") in turns
+    
+    processed = rule_based_preprocess(TRANSCRIPT)
+    assert "예산 총액은 5억원으로 확정되었습니다." in processed
+    assert "이과장: 일정: 다음 주 화요일까지 검토하겠습니다. 추가로 외주 비용도 확인하겠습니다." in processed
+
+
+def test_only_line_initial_names_are_speakers():
+    """줄 중간의 "일정:", "http:"는 새 화자가 아님"""
+    speakers = [speaker for speaker, _ in split_by_speaker(TRANSCRIPT)]
+    assert speakers == ["김대리", "이과장", "박부장"]
+    assert "http://x.com" in dict(split_by_speaker(TRANSCRIPT))["김대리"]
+    assert split_by_speaker("http://x.com 에서 확인") == []
+
+
+def test_numeric_repeats_are_kept():
+    """반복 단어 제거는 간투사 같은 단어에만 적용하고 숫자는 그대로 유지"""
+    numbers = "1 1 2 3 " + " ".join(str(idx) for idx in range(4, 100)) + " 100 100"
+    assert remove_fillers(numbers) == numbers
+    assert remove_fillers("그래서 그래서 2024 2024년 계획은") == "그래서 2024 2024년 계획은"
+
+
+def test_chunks_reproduce_input():
+    """청크를 이으면 원본과 같음 (화자 표기 없는 텍스트, 줄 중간의 콜론 포함)"""
+    for max_tokens in (10, 25, 60, 1500):
+        chunks = chunk_by_speaker(TRANSCRIPT, max_tokens=max_tokens)
+        assert "".join(chunks) == TRANSCRIPT
+        assert all(chunk.strip() for chunk in chunks)
+
+
+def test_chunks_split_at_line_initial_speakers():
+    """줄 맨 앞의 화자 표기에서만 발언 경계를 나눔"""
+    chunks = chunk_by_speaker(TRANSCRIPT, max_tokens=40)
+    assert chunks[0].startswith("오늘은 예산 회의입니다.")
+    # 줄 중간의 "일정:", "http:"는 화자 경계가 아님
+    assert not any(chunk.lstrip().startswith(("일정:", "http:", "//x.com")) for chunk in chunks)
+    assert any(chunk.startswith("이과장: 일정: 다음 주") for chunk in chunks)
+
+
+def test_long_turn_splits_by_sentence():
+    """한도보다 긴 발언은 문장 단위로 나누되 원본을 그대로 유지"""
+    text = "김대리: " + " ".join(f"{idx}번째 항목을 검토했습니다." for idx in range(40))
+    chunks = chunk_by_speaker(text, max_tokens=30)
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+    assert all(len(chunk) / 1.5 + 1 <= 30 for chunk in chunks)
+
+
+def test_merge_drops_placeholder_discussions():
+    """청크별 대체 논의("일반 논의")는 실제 논의가 있으면 병합 결과에서 제외"""
+    results = [
+        {"discussions": [{"topic": "일반 논의", "content": "요약"}]},
+        {"discussions": [{"topic": "예산", "content": "5억원 확정"}]},
+    ]
+    merged = merge_chunk_results(results)
+    assert merged["discussions"] == [{"topic": "예산", "content": "5억원 확정"}]
+
+
+if __name__ == "__main__":
+    for test in (
+        test_untagged_text_is_kept,
+        test_only_line_initial_names_are_speakers,
+        test_numeric_repeats_are_kept,
+        test_chunks_reproduce_input,
+        test_chunks_split_at_line_initial_speakers,
+        test_long_turn_splits_by_sentence,
+        test_merge_drops_placeholder_discussions,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
@@ -0,0 +1,207 @@
+"""transformers 백엔드 생성 경로 테스트 (임시 디렉토리에 만든 작은 무작위 모델 사용)
+
+네트워크 없이 바이트 단위 BPE 토크나이저와 작은 GPT-2 모델을 만들어
+LightweightLLMConfig로 로드합니다. 출력 내용은 의미가 없으므로 생성 경로가
+어떤 옵션으로 호출되는지와 경로 간 출력 일치만 확인합니다.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import torch
+from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+from transformers import GPT2Config, GPT2LMHeadModel, PreTrainedTokenizerFast
+
+from meeting_minutes.core.replica_pool import ReplicaPool, llm_kwargs_from
+from meeting_minutes.core.scheduler import InferenceScheduler
+from meeting_minutes.core.transformers_backend import LightweightLLMConfig
+from meeting_minutes.nodes.extraction import GENERATION_PROFILES
+
+
+CORPUS = [
+    "김대리: 예산 검토는 다음 주 화요일까지 완료하겠습니다.",
+    "이과장: 외주 비용도 함께 확인해 주세요.",
+    '{"topic": "예산", "content": "5억원 확정"}',
+    '{"task": "자료 공유", "assignee": "김대리", "deadline": "2024-05-01"}',
+]
+
+_model_dir = None
+
+
+def make_tiny_model() -> str:
+    """작은 무작위 GPT-2 모델과 토크나이저를 임시 디렉토리에 저장하고 경로 반환"""
+    global _model_dir
+    if _model_dir is not None:
+        return _model_dir.name
+    
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    tokenizer.train_from_iterator(
+        CORPUS,
+        trainers.BpeTrainer(
+            vocab_size=400,
+            special_tokens=["<|endoftext|>"],
+            initial_alphabet=pre_tokenizers.ByteLevel.alphabet()
+        )
+    )
+    fast = PreTrainedTokenizerFast(tokenizer_object=tokenizer, eos_token="<|endoftext|>")
+    
+    torch.manual_seed(0)
+    config = GPT2Config(
+        vocab_size=len(fast),
+        n_positions=1024,
+        n_embd=32,
+        n_layer=2,
+        n_head=2,
+        bos_token_id=fast.eos_token_id,
+        eos_token_id=fast.eos_token_id
+    )
+    model = GPT2LMHeadModel(config)
+    
+    _model_dir = tempfile.TemporaryDirectory()
+    fast.save_pretrained(_model_dir.name)
+    model.save_pretrained(_model_dir.name)
+    return _model_dir.name
+
+
+def load_backend(**kwargs) -> LightweightLLMConfig:
+    """작은 모델을 CPU fp32, 그리디 디코딩으로 로드"""
+    kwargs.setdefault("deterministic", True)
+    llm = LightweightLLMConfig(model_name=make_tiny_model(), device="cpu", **kwargs)
+    llm.load_model()
+    return llm
+
+
+def record_generate_calls(llm: LightweightLLMConfig) -> list:
+    """대상 모델의 generate() 호출 인자를 기록"""
+    calls = []
+    generate = llm._model.generate
+    
+    def recording_generate(*args, **kwargs):
+        calls.append(kwargs)
+        return generate(*args, **kwargs)
+    
+    llm._model.generate = recording_generate
+    return calls
+
+
+def test_grammar_and_draft_are_never_combined():
+    """제약 디코딩이 적용되는 호출은 초안 모델 없이, 아니면 speculative 프로필에 초안 모델 사용"""
+    model_path = make_tiny_model()
+    profile = GENERATION_PROFILES["discussions"]
+    assert profile.speculative and profile.json_schema is not None
+    
+    for constrained in (True, False):
+        llm = load_backend(
+            constrained_decoding=constrained,
+            draft_model_name=model_path,
+            prefix_cache_size=0
+        )
+        assert llm._draft_model is not None
+        calls = record_generate_calls(llm)
+        
+        llm.generate_with_stats("김대리: 예산 검토", profile=profile)
+        kwargs = calls[-1]
+        assert not ("logits_processor" in kwargs and "assistant_model" in kwargs)
+        if constrained:
+            assert "logits_processor" in kwargs and "assistant_model" not in kwargs
+        else:
+            assert "assistant_model" in kwargs and "logits_processor" not in kwargs
+
+
+
+def test_replica_pool_applies_profiles():
+    """복제본 풀 경로도 직접 생성과 같은 프로필(제약 디코딩, 중단 조건, 예산)로 생성"""
+    llm = load_backend(constrained_decoding=True, prefix_cache_size=0)
+    prompt = "김대리: 예산 검토는 다음 주 화요일까지 완료하겠습니다."
+    expected = {
+        name: llm.generate_with_stats(prompt, profile=GENERATION_PROFILES[name])
+        for name in ("participants", "discussions")
+    }
+    
+    pool = ReplicaPool(llm_kwargs_from(llm), num_replicas=1, threads_per_replica=1)
+    pool.start()
+    llm.attach_dispatcher(pool)
+    try:
+        for name, (text, stats) in expected.items():
+            assert llm.generate_with_stats(prompt, profile=GENERATION_PROFILES[name]) == (text, stats)
+    finally:
+        llm.detach_dispatcher()
+        pool.stop()
+    assert llm.generation_stats["discussions"]["calls"] == 2
+
+
+
+def test_scheduler_matches_sequential_greedy():
+    """연속 배칭 스케줄러의 결과가 프롬프트별 순차 그리디 생성과 같음 (프로필 포함)"""
+    llm = load_backend(constrained_decoding=True, prefix_cache_size=0, max_length=96)
+    requests = [
+        ("김대리: 예산 검토", GENERATION_PROFILES["discussions"]),
+        ("이과장: 외주 비용도 함께 확인해 주세요. 자료는 공유 드라이브에 있습니다.", GENERATION_PROFILES["participants"]),
+        ("예산", GENERATION_PROFILES["action_items"]),
+        ("김대리: 다음 주 화요일까지 완료하겠습니다.", None),
+    ]
+    expected = [
+        llm.generate_with_stats(prompt, profile=profile) for prompt, profile in requests
+    ]
+    
+    scheduler = InferenceScheduler(llm, max_batch_size=4)
+    llm.attach_dispatcher(scheduler)
+    try:
+        futures = [
+            scheduler.submit(
+                prompt,
+                max_new_tokens=stats["budget"],
+                profile=profile
+            )
+            for (prompt, profile), (_, stats) in zip(requests, expected)
+        ]
+        results = [future.result(timeout=120) for future in futures]
+    finally:
+        llm.detach_dispatcher()
+        scheduler.stop()
+    
+    assert scheduler.stats()["avg_batch_size"] > 1
+    for (text, stats), (batched_text, batched_stats) in zip(expected, results):
+        assert batched_text == text
+        assert batched_stats["stop_reason"] == stats["stop_reason"]
+
+
+def test_batch_matches_sequential_greedy():
+    """배치 생성도 행마다 프로필 중단 조건을 적용해 프롬프트별 생성과 같은 결과 (토크나이저 상태 유지)"""
+    llm = load_backend(constrained_decoding=True, prefix_cache_size=0, max_length=96)
+    requests = [
+        ("김대리: 예산 검토", GENERATION_PROFILES["discussions"]),
+        ("이과장: 외주 비용도 함께 확인해 주세요. 자료는 공유 드라이브에 있습니다.", GENERATION_PROFILES["participants"]),
+        ("예산", GENERATION_PROFILES["action_items"]),
+        ("김대리: 다음 주 화요일까지 완료하겠습니다.", GENERATION_PROFILES["summary"]),
+    ]
+    expected = [
+        llm.generate_with_stats(prompt, profile=profile) for prompt, profile in requests
+    ]
+    pad_token, padding_side = llm._tokenizer.pad_token, llm._tokenizer.padding_side
+    
+    texts, stats = llm.generate_batch_with_stats(
+        [prompt for prompt, _ in requests],
+        [{"profile": profile} for _, profile in requests]
+    )
+    
+    assert (llm._tokenizer.pad_token, llm._tokenizer.padding_side) == (pad_token, padding_side)
+    for (text, single_stats), batched_text, batched_stats in zip(expected, texts, stats):
+        assert batched_text == text
+        assert batched_stats["stop_reason"] == single_stats["stop_reason"]
+
+
+if __name__ == "__main__":
+    for test in (
+        test_grammar_and_draft_are_never_combined,
+        test_replica_pool_applies_profiles,
+        test_scheduler_matches_sequential_greedy,
+        test_batch_matches_sequential_greedy,
+    ):
+        test()
+        print(f"✓ {test.__name__}")